@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-records-lom is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Benchmark serializing a page of search results to UI-JSON.
+
+Compares the UI-serializer, which shares one instance per type-schema, to
+instantiating a type-schema per hit as `OneOfSchema` does. Timings are printed,
+not asserted on, as they depend on the machine.
+
+Run from the repository's root, with the test-dependencies installed::
+
+    python -m benchmarks.ui_serializer
+"""
+
+from copy import deepcopy
+from timeit import repeat
+
+from faker import Faker
+from flask_resources import BaseListSchema, JSONSerializer, MarshmallowSerializer
+from invenio_app.factory import create_app
+
+from invenio_records_lom.resources.serializers import LOMToUIJSONSerializer
+from tests.test_ui_serializer import PerHitUIRecordSchema, create_result_page
+
+PAGE_SIZE = 50
+"""Number of hits per page, the size the search UI requests at most."""
+
+REPEAT = 20
+"""Number of serializations per serializer, the fastest is reported."""
+
+
+def main() -> None:
+    """Print the fastest serialization of a result page, per serializer."""
+    serializers = {
+        "shared type-schemas": LOMToUIJSONSerializer(),
+        "per-hit type-schemas": MarshmallowSerializer(
+            format_serializer_cls=JSONSerializer,
+            object_schema_cls=PerHitUIRecordSchema,
+            list_schema_cls=BaseListSchema,
+        ),
+    }
+    fake = Faker()
+    Faker.seed(42)
+
+    with create_app().test_request_context():
+        page = create_result_page(fake, size=PAGE_SIZE)
+        for name, serializer in serializers.items():
+            # serializing alters the page, so each run gets a fresh copy
+            pages = iter([deepcopy(page) for _ in range(REPEAT)])
+            times = repeat(
+                lambda pages=pages, serializer=serializer: (
+                    serializer.serialize_object_list(next(pages))
+                ),
+                number=1,
+                repeat=REPEAT,
+            )
+            milliseconds = min(times) * 1000
+            print(f"{name}: {milliseconds:.1f} ms per {PAGE_SIZE} hits")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
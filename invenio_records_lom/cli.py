@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 #
-# Copyright (C) 2020-2025 Graz University of Technology.
+# Copyright (C) 2020-2026 Graz University of Technology.
 #
 # invenio-records-lom is free software; you can redistribute it and/or modify it
 # under the terms of the MIT License; see LICENSE file for more details.
@@ -9,9 +9,11 @@
 
 from __future__ import annotations
 
+from datetime import datetime
 from itertools import count
+from typing import BinaryIO, TextIO
 
-from click import group, option, secho
+from click import Choice, DateTime, File, group, option, secho
 from faker import Faker
 from flask.cli import with_appcontext
 from invenio_access.permissions import system_identity
@@ -19,7 +21,14 @@ from invenio_access.permissions import system_identity
 from .fixtures import publish_fake_record, publish_fake_record_over_celery
 from .proxies import current_records_lom
 from .records.models import LOMRecordMetadata
+from .records.statistics.api import STATS_EXPORT_GROUP_BY
+from .records.statistics.export import STATS_EXPORT_FORMATS
+from .resources.bulk_export import BULK_EXPORT_FORMATS, iter_bulk_export
 from .resources.serializers.oai.schema import LOMToOAISchema
+from .services.doi import bulk_update_doi_metadata, get_datacite_provider
+from .services.index_migration import migrate_indices
+from .services.license_migration import normalize_license_urls
+from .services.pid_queue import get_pid_queue_stats
 
 
 @group()
@@ -138,3 +147,139 @@ def reindex() -> None:
         indexer.index(record_api_object)
 
     secho("Successfully reindexed LOM records!", fg="green")
+
+
+@lom.command("export")
+@with_appcontext
+@option("--query", "-q", default="", help="Only export records matching this query.")
+@option(
+    "--format",
+    "-f",
+    "export_format",
+    default="jsonl",
+    show_default=True,
+    type=Choice(list(BULK_EXPORT_FORMATS)),
+)
+@option("--output", "-o", default="-", type=File("wb"), help="Defaults to stdout.")
+def bulk_export(query: str, export_format: str, output: BinaryIO) -> None:
+    """Export all published records, gzip-compressed, in constant memory."""
+    params = {"q": query} if query else {}
+    sources = current_records_lom.records_service.scan_published(
+        system_identity,
+        params=params,
+    )
+    output.writelines(iter_bulk_export(sources, export_format))
+
+
+@lom.command("update-doi-metadata")
+@with_appcontext
+@option("--query", "-q", default="", help="Only update records matching this query.")
+@option(
+    "--workers",
+    "-w",
+    default=4,
+    show_default=True,
+    type=int,
+    help="Maximum number of concurrent requests to DataCite.",
+)
+def update_doi_metadata(query: str, workers: int) -> None:
+    """Re-send DataCite-metadata of all published records with DataCite-DOIs."""
+    params = {"q": query} if query else {}
+    sources = current_records_lom.records_service.scan_published(
+        system_identity,
+        params=params,
+    )
+    updated, failed = bulk_update_doi_metadata(
+        sources,
+        get_datacite_provider(),
+        workers=workers,
+    )
+
+    secho(f"Updated metadata of {updated} DOIs.", fg="green")
+    for doi in failed:
+        secho(f"{doi}: update failed, see log", fg="red")
+
+
+@lom.command("pid-queue-status")
+@with_appcontext
+def pid_queue_status() -> None:
+    """Show number of queued PID-registrations, and of failed ones."""
+    stats = get_pid_queue_stats()
+    secho(f"Queued PIDs: {stats['depth']}", fg="green")
+    failures_color = "red" if stats["failures"] else "green"
+    secho(f"Failed PIDs: {stats['failures']}", fg=failures_color)
+
+
+@lom.command("migrate-indices")
+@with_appcontext
+@option(
+    "--from-version",
+    "-f",
+    "old_version",
+    required=True,
+    help='Version of the indices to migrate from, e.g. "1.0.0".',
+)
+@option("--delete-old", is_flag=True, default=False, help="Delete the old indices.")
+def migrate_indices_command(old_version: str, *, delete_old: bool) -> None:
+    """Reindex into the current index-versions, then switch aliases over to them."""
+    secho(f"Migrating LOM indices from v{old_version}...", fg="green")
+    renamed = migrate_indices(
+        current_records_lom.records_service,
+        old_version,
+        delete_old=delete_old,
+    )
+    for old_index, new_index in renamed.items():
+        secho(f"{old_index} -> {new_index}", fg="green")
+
+
+@lom.command("normalize-license-urls")
+@with_appcontext
+def normalize_license_urls_command() -> None:
+    """Standardize license URLs of all records and drafts, then reindex them."""
+    secho("Normalizing license URLs...", fg="green")
+    changed = normalize_license_urls(current_records_lom.records_service)
+    secho(f"Normalized license URLs of {changed} records and drafts.", fg="green")
+
+
+@lom.group()
+def stats() -> None:
+    """CLI-group for "invenio lom stats" commands."""
+
+
+@stats.command("export")
+@with_appcontext
+@option(
+    "--group-by",
+    default="recid",
+    show_default=True,
+    type=Choice(STATS_EXPORT_GROUP_BY),
+    help="Aggregate statistics per record-version or over all versions.",
+)
+@option("--start-date", type=DateTime(formats=["%Y-%m-%d"]), help="Inclusive.")
+@option("--end-date", type=DateTime(formats=["%Y-%m-%d"]), help="Inclusive.")
+@option(
+    "--format",
+    "-f",
+    "export_format",
+    default="csv",
+    show_default=True,
+    type=Choice(list(STATS_EXPORT_FORMATS)),
+)
+@option("--output", "-o", default="-", type=File("w"), help="Defaults to stdout.")
+def export_stats(
+    group_by: str,
+    start_date: datetime | None,
+    end_date: datetime | None,
+    export_format: str,
+    output: TextIO,
+) -> None:
+    """Export aggregated view/download statistics as CSV or JSONL."""
+    rows = current_records_lom.records_service.export_stats(
+        system_identity,
+        group_by=group_by,
+        start_date=start_date.date() if start_date else None,
+        end_date=end_date.date() if end_date else None,
+    )
+
+    iter_lines, _ = STATS_EXPORT_FORMATS[export_format]
+    output.writelines(iter_lines(rows, group_by))
@@ -17,12 +17,15 @@ from invenio_stats.contrib.event_builders import build_file_unique_id
 from invenio_stats.processors import EventsIndexer, anonymize_user, flag_robots
 from invenio_stats.queries import TermsQuery
 
-from .resources.serializers import LOMToDataCite44Serializer
+from .resources.serializers import (
+    LOMToDataCite44Serializer,
+    request_url_args_retriever,
+)
 from .services import facets
 from .services.permissions import LOMRecordPermissionPolicy
 from .services.permissions.roles import oer_certified_user, oer_curator
 from .services.pids import LOMDataCitePIDProvider
-from .utils import build_record_unique_id
+from .utils import build_record_unique_id, filter_by_recids
 
 LOM_BASE_TEMPLATE = "invenio_records_lom/base.html"
 
@@ -50,7 +53,41 @@ LOM_FACETS = {
         "ui": {
             # these fields will be available to the React search-app
             # namely, the overridable `BucketAggregation` component gets these
-            "field": "metadata.rights.url",
+            "field": "metadata.rights.license_id",
+        },
+    },
+    "oefos": {
+        "facet": facets.oefos,
+        "ui": {
+            "field": "facets.oefos",
+            "childAgg": {  # children of selected codes, see `OEFOSFacet`
+                "field": "facets.oefos",
+                "aggName": "inner",
+            },
+        },
+    },
+    "resource_type": {
+        "facet": facets.resource_type,
+        "ui": {
+            "field": "resource_type",
+        },
+    },
+    "language": {
+        "facet": facets.language,
+        "ui": {
+            "field": "facets.language",
+        },
+    },
+    "format": {
+        "facet": facets.technical_format,
+        "ui": {
+            "field": "facets.format",
+        },
+    },
+    "learningresourcetype": {
+        "facet": facets.learningresourcetype,
+        "ui": {
+            "field": "facets.learningresourcetype",
         },
     },
 }
@@ -72,6 +109,10 @@ LOM_SORT_OPTIONS = {
         "title": _("Most downloaded"),
         "fields": ["-stats.all_versions.unique_downloads"],
     },
+    "trending": {
+        "title": _("Trending"),
+        "fields": ["-stats.popularity", "-created"],
+    },
 }
 
 LOM_SEARCH = {
@@ -80,9 +121,15 @@ LOM_SEARCH = {
         "newest",
         "mostviewed",
         "mostdownloaded",
+        "trending",
     ],
     "facets": [  # which facets to activate, see `LOM_FACETS` for facet-configuration
         "rights_license",
+        "oefos",
+        "resource_type",
+        "learningresourcetype",
+        "language",
+        "format",
     ],
 }
 """Record search configuration."""
@@ -91,9 +138,67 @@ LOM_SEARCH_DRAFTS = {
     "sort": ["bestmatch", "newest"],
     "facets": [  # which facets to activate, see `LOM_FACETS` for facet-configuration
         "rights_license",
+        "oefos",
+        "resource_type",
+        "learningresourcetype",
+        "language",
+        "format",
     ],
 }
 
+LOM_SEARCH_POPULARITY_BOOST = 1.0
+"""Weight of records' popularity in relevance-sorted searches, 0 to disable."""
+
+LOM_SEARCH_CACHE_TIMEOUT = 60
+"""Seconds to share anonymous users' search results, 0 to disable.
+
+Cached results are also expired whenever a record is published, deleted or restored.
+"""
+
+LOM_SEARCH_SOURCE_FIELDS = {
+    "application/vnd.inveniolom.v1+json": {
+        "excludes": [
+            "facets",
+            "langstrings",
+            "suggest",
+            "popularity",
+            "metadata.metametadata",
+            "metadata.annotation",
+            "metadata.classification",
+            "metadata.educational",
+        ],
+    },
+}
+"""Summary-projections of search hits' `_source`, per response mimetype.
+
+Values are passed as `includes`/`excludes` to the search's `_source`. Only the
+search UI's mimetype is summarized by default, keep what its results-list displays.
+Responses of other mimetypes, and requests with `?fields=full`, get full documents.
+"""
+
+LOM_SEARCH_CURSOR_KEEP_ALIVE = "2m"
+"""How long to keep a search's point in time open between cursor-paginated pages."""
+
+LOM_SEARCH_CURSOR_RATE_LIMIT = {"capacity": 10, "refill_rate": 0.1}
+"""Token bucket limiting how often a user/IP-address opens new points in time.
+
+Each empty ``cursor`` opens one. A user/IP-address may open up to ``capacity`` at
+once, after which it gets ``refill_rate`` per second. Buckets are kept per app and
+process. Set to ``None`` to disable the limit.
+"""
+
+LOM_SEARCH_CURSOR_RATE_LIMIT_MAX_KEYS = 10000
+"""Maximum number of users/IP-addresses to keep token buckets for, per process."""
+
+LOM_SUGGEST_SIZE = 10
+"""Default number of suggestions per request, at most 25 can be requested."""
+
+LOM_SUGGEST_TIMEOUT = "50ms"
+"""Time-budget of the search for suggestions, slower shards' results are omitted."""
+
+LOM_SUGGEST_CACHE_TIMEOUT = 300
+"""Seconds to cache suggestions, per user and query."""
+
 #
 # HTML-Request Configuration
 #
@@ -111,14 +216,88 @@ LOM_ROUTES = {
     "record_search": "/search",
 }
 
+LOM_LANDING_PAGE_SERVER_TIMING = False
+"""Add a ``Server-Timing``-header with per-stage timings to landing page responses.
+
+Stages are "record", "permissions", "files", "serialize", "render". Timings are
+always logged at debug-level.
+"""
+
+LOM_LANDING_PAGE_CACHE = False
+"""Cache the UI-serialization and static fragments of published landing pages.
+
+Fragments (metadata, files, export links) are cached per record revision, locale
+and permissions. Statistics, record management and citation are always rendered.
+"""
+
+LOM_LANDING_PAGE_CACHE_TIMEOUT = 24 * 60 * 60
+"""Seconds to keep cached landing page fragments.
+
+Cache keys contain the record's revision, so publishing a new revision doesn't need
+to wait for the timeout.
+"""
+
 LOM_RECORD_EXPORTERS = {
     "json": {
         "name": _("JSON"),
         "serializer": "flask_resources.serializers:JSONSerializer",
+        "params": {"options": {"indent": 2, "sort_keys": True}},
         "content-type": "application/json",
         "filename": "{id}.json",
     },
+    "lom-xml": {
+        "name": _("LOM XML"),
+        "serializer": "invenio_records_lom.resources.serializers:LOMRecordToXMLSerializer",
+        "content-type": "application/xml",
+        "filename": "{id}.xml",
+    },
+    "datacite-json": {
+        "name": _("DataCite JSON"),
+        "serializer": "invenio_records_lom.resources.serializers:LOMToDataCite44Serializer",
+        "params": {"options": {"indent": 2, "sort_keys": True}},
+        "content-type": "application/vnd.datacite.datacite+json",
+        "filename": "{id}.json",
+    },
+    "dublincore": {
+        "name": _("Dublin Core XML"),
+        "serializer": "invenio_records_lom.resources.serializers:LOMToDublinCoreXMLSerializer",
+        "content-type": "application/xml",
+        "filename": "{id}.xml",
+    },
+    "citation": {
+        "name": _("Citation"),
+        "serializer": "invenio_records_lom.resources.serializers:LOMToCitationStringSerializer",
+        # takes `style` and `locale` from the export-URL's query-args
+        "params": {"url_args_retriever": request_url_args_retriever},
+        "content-type": "text/plain; charset=utf-8",
+        "filename": "{id}.txt",
+    },
 }
+"""Export formats of the landing page's export box.
+
+``serializer`` is instantiated with ``params``, then its ``serialize_object`` is
+called with the record's REST-serialization.
+"""
+
+LOM_RECORD_EXPORT_CACHE_TIMEOUT = 60 * 60
+"""Seconds to cache exports of published records, falsy disables caching.
+
+Exports are cached per record revision, statistics, format and query-args (e.g.
+citation style).
+"""
+
+LOM_CACHE_CONTROL = {
+    "read": "public, no-cache",
+    "export": "public, max-age=300",
+}
+"""``Cache-Control``-header per endpoint, for responses of single records.
+
+Keys are "read" (REST API) and "export" (export view). Responses carry an ``ETag``,
+``no-cache`` makes clients revalidate, which is answered with ``304 Not Modified``
+while the record's revision and statistics are unchanged. Drafts, which have no
+statistics, also carry a ``Last-Modified``. Restricted records are always sent with
+``private, no-cache``.
+"""
 
 #
 # Schema Configuration
@@ -196,6 +375,47 @@ LOM_PERSISTENT_IDENTIFIERS = {
     }
 """
 
+LOM_PIDS_QUEUE_ENABLED = False
+"""Queue PIDs for registration on publish, instead of one celery-task per PID.
+
+Queued PIDs are registered by ``LOM_PIDS_CELERY_TASKS``, which needs to be added to
+``CELERY_BEAT_SCHEDULE``. Recommended for batch imports, which otherwise run into
+the providers' rate limits.
+"""
+
+LOM_PIDS_CELERY_TASKS = {
+    "lom-process-pid-queue": {
+        "task": "invenio_records_lom.services.tasks.lom_process_pid_queue",
+        "schedule": crontab(),  # Every minute
+    },
+}
+
+LOM_PIDS_QUEUE_BATCH_SIZE = 500
+"""Maximum number of queued PIDs processed per run."""
+
+LOM_PIDS_QUEUE_WORKERS = 4
+"""Maximum number of concurrent requests to providers when processing the queue."""
+
+LOM_PIDS_QUEUE_RATE_LIMITS = {
+    "datacite": {"capacity": 10, "refill_rate": 5.0},
+}
+"""Token-bucket per provider-name, `refill_rate` is in requests per second."""
+
+LOM_PIDS_QUEUE_MAX_RETRIES = 4
+"""Retries per PID and run, waiting ``LOM_PIDS_QUEUE_BACKOFF * 2**retry`` seconds."""
+
+LOM_PIDS_QUEUE_BACKOFF = 1.0
+"""Seconds to wait before the first retry of a failed PID-registration."""
+
+LOM_PIDS_QUEUE_MAX_RUNS = 5
+"""Runs a PID is attempted in before giving up on it, failures are logged."""
+
+LOM_PIDS_QUEUE_PENDING_TIMEOUT = 24 * 60 * 60
+"""Seconds a queued PID coalesces further publishes of the same record and scheme."""
+
+LOM_PIDS_QUEUE_LOCK_TIMEOUT = 60 * 60
+"""Seconds after which a crashed run no longer blocks processing the queue."""
+
 
 # Statistics configuration
 
@@ -228,8 +448,15 @@ LOM_STATS_CELERY_TASKS = {
         ],
         "schedule": crontab(minute="20"),
     },
+    "lom-reindex-popular": {
+        "task": "invenio_records_lom.services.tasks.lom_reindex_popular",
+        "schedule": crontab(minute=40, hour=3),  # Every day at 03:40
+    },
 }
 
+LOM_STATS_REINDEX_SHARD_SIZE = 1000
+"""Number of parents per parallel shard of the ``lom-reindex-*`` tasks."""
+
 # Invenio-Stats
 # =============
 # See https://invenio-stats.readthedocs.io/en/latest/configuration.html
@@ -239,7 +466,9 @@ LOM_STATS_EVENTS = {
         "templates": "invenio_records_lom.records.statistics.templates.events.lom_file_download",
         "event_builders": [
             "invenio_rdm_records.resources.stats.file_download_event_builder",
+            "invenio_records_lom.records.statistics.event_builders.drop_if_robot",
             "invenio_rdm_records.resources.stats.check_if_via_api",
+            "invenio_records_lom.records.statistics.event_builders.drop_if_rate_limited",
         ],
         "cls": EventsIndexer,
         "params": {
@@ -250,8 +479,10 @@ LOM_STATS_EVENTS = {
         "templates": "invenio_records_lom.records.statistics.templates.events.lom_record_view",
         "event_builders": [
             "invenio_rdm_records.resources.stats.record_view_event_builder",
+            "invenio_records_lom.records.statistics.event_builders.drop_if_robot",
             "invenio_rdm_records.resources.stats.check_if_via_api",
             "invenio_rdm_records.resources.stats.drop_if_via_api",
+            "invenio_records_lom.records.statistics.event_builders.drop_if_rate_limited",
         ],
         "cls": EventsIndexer,
         "params": {
@@ -260,6 +491,32 @@ LOM_STATS_EVENTS = {
     },
 }
 
+LOM_STATS_EVENTS_RATE_LIMITS = {
+    "session": {"capacity": 20, "refill_rate": 0.2},
+}
+"""Token buckets limiting view/download events per session and per IP-address.
+
+A session/IP-address may emit up to ``capacity`` events at once, after which it gets
+``refill_rate`` events per second. Events beyond that are dropped before they reach
+the events queue. Buckets are kept per app and process. Remove a key to disable its
+limit.
+
+There is no "ip"-limit by default: whole lecture halls or campuses may share an
+IP-address behind NAT or proxies, whose legitimate events it would drop. Configure
+one generously if needed, e.g. ``"ip": {"capacity": 1000, "refill_rate": 20.0}``.
+"""
+
+LOM_STATS_EVENTS_RATE_LIMIT_MAX_KEYS = 10000
+"""Maximum number of sessions/IP-addresses to keep token buckets for, per process."""
+
+LOM_STATS_DEFER_EVENTS = True
+"""Publish view/download events after the response has been sent.
+
+Events are still built within the request, but publishing them to the events queue
+is deferred and batched per request, so that it doesn't add to response times.
+Set to ``False`` to publish each event immediately.
+"""
+
 LOM_STATS_AGGREGATIONS = {
     "lom-file-download-agg": {
         "templates": "invenio_records_lom.records.statistics.templates.aggregations.aggr_lom_file_download",
@@ -392,8 +649,60 @@ LOM_STATS_QUERIES = {
             },
         },
     },
+    "lom-course-view": {
+        "cls": TermsQuery,
+        "permission_factory": None,
+        "params": {
+            "index": "stats-lom-record-view",
+            "doc_type": "lom-record-view-day-aggregation",
+            "query_modifiers": [filter_by_recids],
+            "metric_fields": {
+                "views": ("sum", "count", {}),
+                "unique_views": ("sum", "unique_count", {}),
+            },
+        },
+    },
+    "lom-course-download": {
+        "cls": TermsQuery,
+        "permission_factory": None,
+        "params": {
+            "index": "stats-lom-file-download",
+            "doc_type": "lom-file-download-day-aggregation",
+            "query_modifiers": [filter_by_recids],
+            "metric_fields": {
+                "downloads": ("sum", "count", {}),
+                "unique_downloads": ("sum", "unique_count", {}),
+                "data_volume": ("sum", "volume", {}),
+            },
+        },
+    },
 }
 
+LOM_STATS_COURSE_CACHE_TIMEOUT = 60 * 60
+"""Seconds to cache the statistics of a course, summed over all its parts.
+
+Aggregations are only updated hourly (see ``LOM_STATS_CELERY_TASKS``), caching for
+longer than that shows outdated statistics on course pages.
+"""
+
+LOM_POPULARITY_HALF_LIFE_DAYS = 30
+"""Days after which a view or download counts half as much towards popularity."""
+
+LOM_POPULARITY_DOWNLOAD_WEIGHT = 2.0
+"""Weight of a download towards popularity, relative to that of a view."""
+
+LOM_STATS_EXPORT_PAGE_SIZE = 1000
+"""Number of composite-aggregation buckets fetched per request when exporting stats."""
+
+LOM_BULK_EXPORT_SCROLL_SIZE = 1000
+"""Number of index-documents fetched per scroll-request when bulk-exporting."""
+
+LOM_BULK_EXPORT_WORKERS = 4
+"""Number of threads serializing records when bulk-exporting."""
+
+LOM_BULK_EXPORT_CHUNK_SIZE = 100
+"""Number of records a bulk-export worker serializes at once."""
+
 LOM_ALLOW_METADATA_ONLY_RECORDS = True
 """Allow users to publish metadata-only records."""
 
@@ -416,6 +725,13 @@ LOM_CITATION_STYLES = [
 LOM_CITATION_STYLES_DEFAULT = "apa"
 """Default citation style."""
 
+LOM_CITATION_CACHE_TIMEOUT = 24 * 60 * 60
+"""Seconds to cache rendered citation-strings.
+
+Citations are cached per record revision, style and locale, so publishing a new
+revision doesn't need to wait for the timeout.
+"""
+
 LOM_RECORD_CERTIFIED_USER_NEEDS = [oer_certified_user]
 """Enable the user to create/modify records."""
 
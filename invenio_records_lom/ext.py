@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 #
-# Copyright (C) 2020-2025 Graz University of Technology.
+# Copyright (C) 2020-2026 Graz University of Technology.
 # Copyright (C) 2026 BOKU University.
 #
 # invenio-records-lom is free software; you can redistribute it and/or modify it
@@ -49,6 +49,10 @@ class InvenioRecordsLOM:
         self.init_config(app)
         self.init_services(app)
         self.init_resources(app)
+        # pylint: disable-next=attribute-defined-outside-init
+        self.stats_events_limiters = {}
+        # pylint: disable-next=attribute-defined-outside-init
+        self.search_cursor_limiter = None
         app.extensions["invenio-records-lom"] = self
 
     def init_config(self, app: Flask) -> None:
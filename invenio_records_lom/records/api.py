@@ -53,7 +53,13 @@ from invenio_requests.records.api import Request
 from invenio_requests.records.systemfields.relatedrecord import RelatedRecord
 
 from . import models
-from .dumpers import LomStatisticsDumperExt
+from .dumpers import (
+    LOMFacetsDumperExt,
+    LOMLangstringsDumperExt,
+    LOMLicenseDumperExt,
+    LomStatisticsDumperExt,
+    LOMSuggestDumperExt,
+)
 from .systemfields import (
     LOMDraftRecordIdProvider,
     LOMPIDFieldContext,
@@ -143,6 +149,10 @@ class LOMDraft(Draft, metaclass=LOMRecordMeta):
 
     dumper = SearchDumper(
         extensions=[
+            LOMFacetsDumperExt("facets"),
+            LOMLangstringsDumperExt("langstrings"),
+            LOMLicenseDumperExt("license_id"),
+            LOMSuggestDumperExt("suggest"),
             LomStatisticsDumperExt("stats"),
         ],
     )
@@ -164,7 +174,7 @@ class LOMDraft(Draft, metaclass=LOMRecordMeta):
     access = RecordAccessField()
     bucket_id = ModelField(dump=False)
     bucket = ModelField(dump=False)
-    index = IndexField("lomrecords-drafts-draft-v1.0.0", search_alias="lomrecords")
+    index = IndexField("lomrecords-drafts-draft-v2.0.0", search_alias="lomrecords")
     is_published = PIDStatusCheckField(status=PIDStatus.REGISTERED, dump=True)
     pids = DictField()
     resource_type = DictField()
@@ -191,6 +201,16 @@ class LOMRecord(Record, metaclass=LOMRecordMeta):
     parent_record_cls = LOMParent
     versions_model_cls = models.LOMVersionsState
 
+    dumper = SearchDumper(
+        extensions=[
+            LOMFacetsDumperExt("facets"),
+            LOMLangstringsDumperExt("langstrings"),
+            LOMLicenseDumperExt("license_id"),
+            LOMSuggestDumperExt("suggest"),
+            LomStatisticsDumperExt("stats"),
+        ],
+    )
+
     pid = PIDField(
         key="id",
         provider=LOMRecordIdProvider,
@@ -210,7 +230,7 @@ class LOMRecord(Record, metaclass=LOMRecordMeta):
     bucket_id = ModelField(dump=False)
     bucket = ModelField(dump=False)
     index = IndexField(
-        "lomrecords-records-record-v1.0.0",
+        "lomrecords-records-record-v2.0.0",
         search_alias="lomrecords-records",
     )
     is_published = PIDStatusCheckField(status=PIDStatus.REGISTERED, dump=True)
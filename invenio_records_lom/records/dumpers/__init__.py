@@ -2,13 +2,23 @@
 #
 # This file is part of Invenio.
 # Copyright (C) 2018 CERN.
-# Copyright (C) 2024-2025 Graz University of Technology.
+# Copyright (C) 2024-2026 Graz University of Technology.
 #
 # invenio-records-lom is free software; you can redistribute it and/or modify it
 # under the terms of the MIT License; see LICENSE file for more details.
 
-"""Statistics integration for RDM records."""
+"""Search dumper extensions for LOM records."""
 
+from .facets import LOMFacetsDumperExt
+from .langstrings import LOMLangstringsDumperExt
+from .license import LOMLicenseDumperExt
 from .stats import LomStatisticsDumperExt
+from .suggest import LOMSuggestDumperExt
 
-__all__ = ("LomStatisticsDumperExt",)
+__all__ = (
+    "LOMFacetsDumperExt",
+    "LOMLangstringsDumperExt",
+    "LOMLicenseDumperExt",
+    "LOMSuggestDumperExt",
+    "LomStatisticsDumperExt",
+)
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-records-lom is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Search dumper precomputing flat keyword-values for facets."""
+
+from invenio_records.dumpers import SearchDumperExt
+
+OEFOS_SOURCE = "https://w3id.org/oerbase/vocabs/oefos2012"
+
+OEFOS_LEVEL_LENGTHS = (1, 3, 4, 6)
+"""Lengths of OEFOS-codes per level of the hierarchy, e.g. 2 > 207 > 2074 > 207413."""
+
+ISO_639_2_TO_1 = {
+    "deu": "de",
+    "eng": "en",
+    "ger": "de",
+}
+
+
+def get_oefos_ancestors(code: str) -> list[str]:
+    """Get OEFOS-`code` preceded by its ancestors, e.g. 2, 207, 2074 for 2074."""
+    return [code[:length] for length in OEFOS_LEVEL_LENGTHS if length <= len(code)]
+
+
+def normalize_language(language: str) -> str | None:
+    """Normalize `language` to its lower-case primary subtag, e.g. "en" for "eng-US".
+
+    Return `None` for LOM's "none", which marks resources without language.
+    """
+    primary_subtag = language.split("-", maxsplit=1)[0].lower()
+    if primary_subtag in {"", "none"}:
+        return None
+    return ISO_639_2_TO_1.get(primary_subtag, primary_subtag)
+
+
+def get_langstring_text(value: dict) -> str:
+    """Get the text of langstring-object `value`."""
+    return value.get("langstring", {}).get("#text", "")
+
+
+class LOMFacetsDumperExt(SearchDumperExt):
+    """Search dumper extension for facets.
+
+    On dump, values to facet by are normalized and put into `key` as flat lists,
+    so facets are plain `terms`-aggregations on keyword-fields.
+    OEFOS-codes are dumped together with all their ancestors.
+    On load, the dumped values are removed from the data dictionary.
+    """
+
+    def __init__(self, key: str = "facets") -> None:
+        """Construct."""
+        self.key = key
+
+    def dump(self, record, data: dict) -> None:  # noqa: ANN001, ARG002
+        """Dump facet-values to the data dictionary."""
+        metadata = data.get("metadata", {})
+
+        oefos = set()
+        for classification in metadata.get("classification", []):
+            for taxonpath in classification.get("taxonpath", []):
+                if get_langstring_text(taxonpath.get("source", {})) != OEFOS_SOURCE:
+                    continue
+                for taxon in taxonpath.get("taxon", []):
+                    code = taxon.get("id", "").rstrip("/").rsplit("/", 1)[-1]
+                    if code.isdigit():
+                        oefos.update(get_oefos_ancestors(code))
+
+        languages = {
+            normalize_language(language)
+            for language in metadata.get("general", {}).get("language", [])
+        }
+        formats = {
+            format_.lower()
+            for format_ in metadata.get("technical", {}).get("format", [])
+        }
+        learningresourcetypes = {
+            learningresourcetype["id"]
+            for learningresourcetype in metadata.get("educational", {}).get(
+                "learningresourcetype",
+                [],
+            )
+            if "id" in learningresourcetype
+        }
+
+        data[self.key] = {
+            "oefos": sorted(oefos, key=lambda code: (len(code), code)),
+            "language": sorted(languages - {None}),
+            "format": sorted(formats),
+            "learningresourcetype": sorted(learningresourcetypes),
+        }
+
+    def load(self, data: dict, record_cls) -> None:  # noqa: ANN001, ARG002
+        """Remove dumped facet-values from the data dictionary."""
+        data.pop(self.key, None)
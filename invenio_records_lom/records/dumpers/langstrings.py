@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-records-lom is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Search dumper routing langstrings into fields by language."""
+
+from invenio_records.dumpers import SearchDumperExt
+
+from .facets import normalize_language
+
+LANGUAGE_SUBFIELDS = frozenset(["de", "en"])
+"""Languages with their own subfield, langstrings of others go to "other"."""
+
+
+def get_language_subfield(lang: str | None) -> str:
+    """Get subfield for langstrings of `lang`, e.g. "de" for "de-AT"."""
+    language = normalize_language(lang or "")
+    return language if language in LANGUAGE_SUBFIELDS else "other"
+
+
+def get_langstrings(value: dict | list | None) -> list[dict]:
+    """Get langstrings of `value`, which holds one or a list of them."""
+    if not value:
+        return []
+    values = value if isinstance(value, list) else [value]
+    return [v["langstring"] for v in values if "langstring" in v]
+
+
+class LOMLangstringsDumperExt(SearchDumperExt):
+    """Search dumper extension for language-specific full-text search.
+
+    On dump, texts of titles, descriptions and keywords are put into `key`,
+    e.g. to `title.de`, `title.en` or `title.other` depending on their `lang`,
+    which are indexed with an analyzer for that language.
+    On load, the dumped texts are removed from the data dictionary.
+    """
+
+    def __init__(self, key: str = "langstrings") -> None:
+        """Construct."""
+        self.key = key
+
+    def dump(self, record, data: dict) -> None:  # noqa: ANN001, ARG002
+        """Dump langstrings' texts to the data dictionary, grouped by language."""
+        metadata = data.get("metadata", {})
+        general = metadata.get("general", {})
+        classifications = metadata.get("classification", [])
+        sources = {
+            "title": [general.get("title")],
+            "description": [
+                general.get("description"),
+                metadata.get("educational", {}).get("description"),
+            ],
+            "keyword": [
+                general.get("keyword"),
+                *(classification.get("keyword") for classification in classifications),
+            ],
+        }
+
+        routed = {}
+        for field, values in sources.items():
+            for value in values:
+                for langstring in get_langstrings(value):
+                    if text := langstring.get("#text"):
+                        subfield = get_language_subfield(langstring.get("lang"))
+                        texts = routed.setdefault(field, {}).setdefault(subfield, [])
+                        texts.append(text)
+        data[self.key] = routed
+
+    def load(self, data: dict, record_cls) -> None:  # noqa: ANN001, ARG002
+        """Remove dumped texts from the data dictionary."""
+        data.pop(self.key, None)
@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-records-lom is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Search dumper adding canonical license ids."""
+
+from invenio_records.dumpers import SearchDumperExt
+
+from ...utils import get_license_id
+
+
+class LOMLicenseDumperExt(SearchDumperExt):
+    """Search dumper extension for license ids.
+
+    On dump, the license at `metadata.rights.url` is identified and its id is put
+    into `metadata.rights.<key>`, so different spellings of a license's URL facet
+    as one. On load, the dumped id is removed from the data dictionary.
+    """
+
+    def __init__(self, key: str = "license_id") -> None:
+        """Construct."""
+        self.key = key
+
+    def dump(self, record, data: dict) -> None:  # noqa: ANN001, ARG002
+        """Dump license id to the data dictionary."""
+        rights = data.get("metadata", {}).get("rights", {})
+        if url := rights.get("url"):
+            rights[self.key] = get_license_id(url)
+
+    def load(self, data: dict, record_cls) -> None:  # noqa: ANN001, ARG002
+        """Remove dumped license id from the data dictionary."""
+        data.get("metadata", {}).get("rights", {}).pop(self.key, None)
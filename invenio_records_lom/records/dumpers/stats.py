@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 #
-# Copyright (C) 2024 Graz University of Technology.
+# Copyright (C) 2024-2026 Graz University of Technology.
 #
 # invenio-records-lom is free software; you can redistribute it and/or modify it
 # under the terms of the MIT License; see LICENSE file for more details.
@@ -12,6 +12,7 @@ from invenio_rdm_records.records.dumpers import StatisticsDumperExt
 from invenio_records.dictutils import dict_lookup
 
 from ..statistics import LomStatistics
+from ..statistics.api import get_part_recids
 
 
 class LomStatisticsDumperExt(StatisticsDumperExt):
@@ -19,7 +20,9 @@ class LomStatisticsDumperExt(StatisticsDumperExt):
 
     On dump, it fetches the record's download & view statistics via Invenio-Stats
     queries and dumps them into a field so that they are indexed in the search engine.
-    On load, it keeps the dumped values in the data dictionary, in order to enable
+    Also dumps the time-decayed popularity, into the statistics for sorting and as
+    top-level `popularity`-field for boosting by `rank_feature`-queries.
+    On load, it keeps the dumped statistics in the data dictionary, in order to enable
     the record schema to dump them if present.
     """
 
@@ -33,9 +36,27 @@ class LomStatisticsDumperExt(StatisticsDumperExt):
 
         try:
             parent_data = dict_lookup(data, self.keys, parent=True)
-            parent_data[self.key] = LomStatistics.get_record_stats(
+            stats = LomStatistics.get_record_stats(
                 recid=recid,
                 parent_recid=parent_recid,
             )
+            if record.get("resource_type") == "course":
+                stats["course"] = LomStatistics.get_course_stats(
+                    recid=recid,
+                    revision_id=record.revision_id,
+                    part_recids=get_part_recids(record),
+                )
+            stats["popularity"] = LomStatistics.get_popularity(parent_recid)
+            parent_data[self.key] = stats
         except KeyError as e:
             current_app.logger.warning(e)
+            return
+
+        # `rank_feature`-fields only accept positive values
+        if stats["popularity"] > 0:
+            data["popularity"] = stats["popularity"]
+
+    def load(self, data: dict, record_cls) -> None:  # noqa: ANN001
+        """Keep the statistics, remove the top-level popularity."""
+        super().load(data, record_cls)
+        data.pop("popularity", None)
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-records-lom is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Search dumper collecting texts to suggest records by while typing."""
+
+from invenio_records.dumpers import SearchDumperExt
+
+from ...utils import get_vcard_fn
+from .facets import get_langstring_text
+
+
+class LOMSuggestDumperExt(SearchDumperExt):
+    """Search dumper extension for suggestions.
+
+    On dump, titles, keywords and contributors' names are put into `key`,
+    to be indexed as `search_as_you_type`-fields.
+    On load, the dumped texts are removed from the data dictionary.
+    """
+
+    def __init__(self, key: str = "suggest") -> None:
+        """Construct."""
+        self.key = key
+
+    def dump(self, record, data: dict) -> None:  # noqa: ANN001, ARG002
+        """Dump texts to suggest by to the data dictionary."""
+        metadata = data.get("metadata", {})
+        general = metadata.get("general", {})
+
+        title = get_langstring_text(general.get("title", {}))
+        keywords = [
+            get_langstring_text(keyword) for keyword in general.get("keyword", [])
+        ]
+        contributors = [
+            get_vcard_fn(entity)
+            for contribute in metadata.get("lifecycle", {}).get("contribute", [])
+            for entity in contribute.get("entity", [])
+        ]
+
+        data[self.key] = {
+            "title": [title] if title else [],
+            "keyword": list(dict.fromkeys(filter(None, keywords))),
+            "contributor": list(dict.fromkeys(filter(None, contributors))),
+        }
+
+    def load(self, data: dict, record_cls) -> None:  # noqa: ANN001, ARG002
+        """Remove dumped texts from the data dictionary."""
+        data.pop(self.key, None)
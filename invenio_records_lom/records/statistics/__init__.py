@@ -2,7 +2,7 @@
 #
 # This file is part of Invenio.
 # Copyright (C) 2018 CERN.
-# Copyright (C) 2024 Graz University of Technology.
+# Copyright (C) 2024-2026 Graz University of Technology.
 #
 # invenio-records-lom is free software; you can redistribute it and/or modify it
 # under the terms of the MIT License; see LICENSE file for more details.
@@ -10,5 +10,9 @@
 """Statistics integration for lom records."""
 
 from .api import LomStatistics
+from .events import emit_stats_event
 
-__all__ = ("LomStatistics",)
+__all__ = (
+    "LomStatistics",
+    "emit_stats_event",
+)
@@ -4,7 +4,7 @@
 #
 # Copyright (C) 2019 CERN.
 # Copyright (C) 2022 TU Wien.
-# Copyright (C) 2024 Graz University of Technology.
+# Copyright (C) 2024-2026 Graz University of Technology.
 #
 # invenio-records-lom is free software; you can redistribute it and/or modify it
 # under the terms of the MIT License; see LICENSE file for more details.
@@ -16,8 +16,118 @@ invenio-records-lom, these permission factories deny access unless
 otherwise specified.
 """
 
+from collections.abc import Iterable, Iterator
+from datetime import UTC, date, datetime
+
 from flask import current_app
+from invenio_cache import current_cache
 from invenio_rdm_records.records.stats import Statistics
+from invenio_search.engine import dsl
+from invenio_search.proxies import current_search_client
+from invenio_search.utils import prefix_index
+
+STATS_EXPORT_GROUP_BY = ("recid", "parent_recid")
+
+VIEW_METRICS = {
+    "views": ("sum", "count"),
+    "unique_views": ("sum", "unique_count"),
+}
+
+DOWNLOAD_METRICS = {
+    "downloads": ("sum", "count"),
+    "unique_downloads": ("sum", "unique_count"),
+    "data_volume": ("sum", "volume"),
+}
+
+
+def get_part_recids(data: dict) -> list[str]:
+    """Get the recids of all records that `data` "haspart"-relates to."""
+    recids = []
+    for relation in data.get("metadata", {}).get("relation", []):
+        kind = relation.get("kind", {}).get("value", {}).get("langstring", {})
+        if kind.get("#text") != "haspart":
+            continue
+
+        for identifier in relation.get("resource", {}).get("identifier", []):
+            if identifier.get("catalog") != "repo-pid":
+                continue
+            recids.append(identifier["entry"]["langstring"]["#text"])
+
+    return recids
+
+
+def _iter_composite_buckets(
+    index: str,
+    group_by: str,
+    metrics: dict[str, tuple[str, str]],
+    date_range: dict,
+    page_size: int,
+) -> Iterator[tuple[str, dict]]:
+    """Yield `(key, metrics)` of a composite aggregation, page by page.
+
+    Buckets are yielded sorted by `key`, only one page is held in memory.
+    """
+    after_key = None
+    while True:
+        search = dsl.Search(
+            using=current_search_client,
+            index=f"{prefix_index(index)}*",
+        )
+        search = search.extra(size=0)
+        if date_range:
+            search = search.filter("range", timestamp=date_range)
+
+        composite = {
+            "size": page_size,
+            "sources": [{group_by: {"terms": {"field": group_by}}}],
+        }
+        if after_key:
+            composite["after"] = after_key
+        agg = search.aggs.bucket("stats", "composite", **composite)
+        for name, (metric, field) in metrics.items():
+            agg.metric(name, metric, field=field)
+
+        result = search.execute().aggregations.stats
+        for bucket in result.buckets:
+            yield (
+                bucket.key[group_by],
+                {name: bucket[name].value or 0 for name in metrics},
+            )
+
+        after_key = result.to_dict().get("after_key")
+        if not result.buckets or not after_key:
+            return
+
+
+def get_decayed_sum(
+    counts: Iterable[tuple[date, float]],
+    today: date,
+    half_life: float,
+) -> float:
+    """Sum `counts` by day, each day's count halving every `half_life` days of age."""
+    return sum(
+        count * 0.5 ** (max((today - day).days, 0) / half_life) for day, count in counts
+    )
+
+
+def _merge_sorted(
+    views: Iterator[tuple[str, dict]],
+    downloads: Iterator[tuple[str, dict]],
+) -> Iterator[tuple[str, dict, dict]]:
+    """Full outer merge-join of two iterators that are sorted by key."""
+    view = next(views, None)
+    download = next(downloads, None)
+    while view is not None or download is not None:
+        if download is None or (view is not None and view[0] < download[0]):
+            yield view[0], view[1], {}
+            view = next(views, None)
+        elif view is None or download[0] < view[0]:
+            yield download[0], {}, download[1]
+            download = next(downloads, None)
+        else:
+            yield view[0], view[1], download[1]
+            view = next(views, None)
+            download = next(downloads, None)
 
 
 class LomStatistics(Statistics):
@@ -77,3 +187,144 @@ class LomStatistics(Statistics):
                 "data_volume": downloads_all["data_volume"],
             },
         }
+
+    @classmethod
+    def get_popularity(cls, parent_recid: str) -> float:
+        """Get the time-decayed popularity of all versions of `parent_recid`.
+
+        Daily unique views and downloads count half as much every
+        `LOM_POPULARITY_HALF_LIFE_DAYS`, downloads are weighted by
+        `LOM_POPULARITY_DOWNLOAD_WEIGHT`. Days older than four half-lives are ignored.
+        """
+        config = current_app.config
+        half_life = config["LOM_POPULARITY_HALF_LIFE_DAYS"]
+        today = datetime.now(UTC).date()
+        weights = {
+            f"stats-{cls.prefix}-view": 1.0,
+            "stats-lom-file-download": config["LOM_POPULARITY_DOWNLOAD_WEIGHT"],
+        }
+
+        popularity = 0.0
+        for index, weight in weights.items():
+            search = (
+                dsl.Search(using=current_search_client, index=f"{prefix_index(index)}*")
+                .filter("term", parent_recid=parent_recid)
+                .filter("range", timestamp={"gte": f"now-{4 * half_life}d/d"})
+                .extra(size=0)
+            )
+            search.aggs.bucket(
+                "days",
+                "date_histogram",
+                field="timestamp",
+                calendar_interval="day",
+                min_doc_count=1,
+            ).metric("unique_count", "sum", field="unique_count")
+            try:
+                buckets = search.execute().aggregations.days.buckets
+            except Exception as e:  # noqa: BLE001
+                # same as in `get_record_stats`
+                current_app.logger.warning(e)
+                continue
+
+            counts = [
+                (
+                    datetime.fromtimestamp(bucket.key / 1000, tz=UTC).date(),
+                    bucket.unique_count.value or 0,
+                )
+                for bucket in buckets
+            ]
+            popularity += weight * get_decayed_sum(counts, today, half_life)
+
+        return round(popularity, 4)
+
+    @classmethod
+    def get_course_stats(
+        cls,
+        recid: str,
+        revision_id: int,
+        part_recids: list[str],
+    ) -> dict:
+        """Fetch the statistics summed over all parts of a course.
+
+        Results are cached per course-revision, as relations change with revisions.
+        """
+        cache_key = f"lom-stats-course:{recid}:{revision_id}"
+        stats = current_cache.get(cache_key)
+        if stats is not None:
+            return stats
+
+        stats = {
+            "views": 0,
+            "unique_views": 0,
+            "downloads": 0,
+            "unique_downloads": 0,
+            "data_volume": 0,
+        }
+        if not part_recids:
+            return stats
+
+        try:
+            views = cls._get_query("lom-course-view").run(recids=part_recids)
+            downloads = cls._get_query("lom-course-download").run(recids=part_recids)
+        except Exception as e:  # noqa: BLE001
+            # same as in `get_record_stats`, don't cache the fallback
+            current_app.logger.warning(e)
+            return stats
+
+        results = {**views, **downloads}
+        for name in stats:
+            stats[name] = results.get(name) or 0
+
+        current_cache.set(
+            cache_key,
+            stats,
+            timeout=current_app.config["LOM_STATS_COURSE_CACHE_TIMEOUT"],
+        )
+        return stats
+
+    @classmethod
+    def iter_aggregated_stats(
+        cls,
+        group_by: str = "recid",
+        start_date: date | None = None,
+        end_date: date | None = None,
+        page_size: int = 1000,
+    ) -> Iterator[dict]:
+        """Iterate aggregated view/download statistics, one row per `group_by`.
+
+        Uses composite aggregations over the view- and download-aggregation
+        indices and merge-joins their (sorted) buckets, so that memory-usage stays
+        constant regardless of the number of records.
+        """
+        if group_by not in STATS_EXPORT_GROUP_BY:
+            msg = f"Can't group statistics by {group_by!r}"
+            raise ValueError(msg)
+
+        date_range = {}
+        if start_date:
+            date_range["gte"] = start_date.isoformat()
+        if end_date:
+            date_range["lte"] = end_date.isoformat()
+
+        views = _iter_composite_buckets(
+            f"stats-{cls.prefix}-view",
+            group_by,
+            VIEW_METRICS,
+            date_range,
+            page_size,
+        )
+        downloads = _iter_composite_buckets(
+            "stats-lom-file-download",
+            group_by,
+            DOWNLOAD_METRICS,
+            date_range,
+            page_size,
+        )
+
+        for key, view_stats, download_stats in _merge_sorted(views, downloads):
+            row = {group_by: key}
+            for name in VIEW_METRICS:
+                row[name] = int(view_stats.get(name, 0))
+            for name in DOWNLOAD_METRICS:
+                row[name] = int(download_stats.get(name, 0))
+            yield row
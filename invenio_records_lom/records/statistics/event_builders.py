@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-records-lom is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Event builders that drop robot- and burst-traffic before it is queued.
+
+`flag_robots` only runs when events are processed, by then a crawler may already
+have filled the events queue. These builders run at emit-time instead.
+"""
+
+from counter_robots import is_robot
+from flask import Flask, current_app
+
+from ...utils import TokenBucketLimiter
+
+
+def _get_limiter(kind: str) -> TokenBucketLimiter | None:
+    """Get the current app's limiter for `kind` ("ip", "session") if configured.
+
+    Limiters are kept per app, as each app may configure different limits.
+    """
+    limits = current_app.config.get("LOM_STATS_EVENTS_RATE_LIMITS", {})
+    if kind not in limits:
+        return None
+
+    limiters = current_app.extensions["invenio-records-lom"].stats_events_limiters
+    if kind not in limiters:
+        limiters[kind] = TokenBucketLimiter(
+            capacity=limits[kind]["capacity"],
+            refill_rate=limits[kind]["refill_rate"],
+            max_keys=current_app.config["LOM_STATS_EVENTS_RATE_LIMIT_MAX_KEYS"],
+        )
+    return limiters[kind]
+
+
+def drop_if_robot(
+    event: dict,
+    sender_app: Flask,  # noqa: ARG001
+    **kwargs: dict,  # noqa: ARG001
+) -> dict | None:
+    """Drop the event if it was caused by a robot.
+
+    Robot events are never aggregated, so dropping them doesn't change statistics.
+    """
+    if is_robot(event.get("user_agent") or ""):
+        return None
+    return event
+
+
+def drop_if_rate_limited(
+    event: dict,
+    sender_app: Flask,  # noqa: ARG001
+    **kwargs: dict,  # noqa: ARG001
+) -> dict | None:
+    """Drop the event if its session or IP-address emits too many events.
+
+    Tokens are only taken if all buckets have one, so events dropped by one limit
+    don't use up another's.
+    """
+    buckets = [
+        (limiter, key)
+        for kind, key in [
+            ("session", event.get("session_id")),
+            ("ip", event.get("ip_address")),
+        ]
+        if key and (limiter := _get_limiter(kind))
+    ]
+    if not all(limiter.has_token(key) for limiter, key in buckets):
+        return None
+
+    for limiter, key in buckets:
+        limiter.allow(key)
+    return event
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-records-lom is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Deferred, batched emission of statistics events."""
+
+from collections import defaultdict
+from collections.abc import Callable
+from functools import partial
+
+from flask import Flask, Response, after_this_request, current_app, g
+from invenio_stats.proxies import current_stats
+from invenio_stats.receivers import EventEmitter
+
+
+def build_stats_event(emitter: EventEmitter, **kwargs: dict) -> dict | None:
+    """Run the event builders of `emitter`, return the event or `None` if dropped.
+
+    Same as `invenio_stats.receivers.EventEmitter.__call__`, except for publishing.
+    """
+    try:
+        if emitter.name not in current_stats.events:
+            return None
+
+        event = {}
+        for builder in emitter.builders:
+            event = builder(event, current_app, **kwargs)
+            if event is None:
+                return None
+    except Exception:
+        current_app.logger.exception("Error building event")
+        return None
+
+    return event
+
+
+def publish_stats_events(app: Flask, events_by_name: dict[str, list[dict]]) -> None:
+    """Publish buffered events, one queue-publish per event-type."""
+    with app.app_context():
+        for event_name, events in events_by_name.items():
+            try:
+                current_stats.publish(event_name, events)
+            except Exception:
+                app.logger.exception("Error publishing %s events", event_name)
+
+
+def _publish_on_close(
+    app: Flask,
+    events_by_name: dict[str, list[dict]],
+) -> Callable[[Response], Response]:
+    """Create an `after_this_request`-hook that publishes after sending."""
+
+    def hook(response: Response) -> Response:
+        response.call_on_close(partial(publish_stats_events, app, events_by_name))
+        return response
+
+    return hook
+
+
+def emit_stats_event(event_name: str, **kwargs: dict) -> None:
+    """Emit a statistics event without publishing it within the request.
+
+    Event builders need the request (referrer, user-agent, session), so they run
+    immediately. Publishing to the events queue is deferred until the response
+    has been sent, all events of the same request are published in one batch.
+    """
+    emitter = current_stats.get_event_emitter(event_name)
+    if emitter is None:
+        return
+
+    if not current_app.config.get("LOM_STATS_DEFER_EVENTS", True):
+        emitter(current_app, **kwargs)
+        return
+
+    event = build_stats_event(emitter, **kwargs)
+    if event is None:
+        return
+
+    events_by_name = g.get("lom_stats_events")
+    if events_by_name is None:
+        events_by_name = g.lom_stats_events = defaultdict(list)
+        # pylint: disable-next=protected-access
+        app = current_app._get_current_object()  # noqa: SLF001
+        after_this_request(_publish_on_close(app, events_by_name))
+
+    events_by_name[event_name].append(event)
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-records-lom is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Line-by-line formatting of exported statistics."""
+
+import csv
+import json
+from collections.abc import Iterable, Iterator
+from io import StringIO
+
+from .api import DOWNLOAD_METRICS, VIEW_METRICS
+
+STATS_EXPORT_COLUMNS = (*VIEW_METRICS, *DOWNLOAD_METRICS)
+
+
+def iter_stats_csv(rows: Iterable[dict], group_by: str) -> Iterator[str]:
+    """Format `rows` as CSV, yielding one line at a time."""
+    columns = (group_by, *STATS_EXPORT_COLUMNS)
+    buffer = StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=columns, extrasaction="ignore")
+
+    writer.writeheader()
+    for row in rows:
+        writer.writerow(row)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    # flushes the header in case there were no rows
+    yield buffer.getvalue()
+
+
+def iter_stats_jsonl(
+    rows: Iterable[dict],
+    group_by: str,  # noqa: ARG001
+) -> Iterator[str]:
+    """Format `rows` as JSON-lines, yielding one line at a time."""
+    for row in rows:
+        yield json.dumps(row) + "\n"
+
+
+STATS_EXPORT_FORMATS = {
+    "csv": (iter_stats_csv, "text/csv"),
+    "jsonl": (iter_stats_jsonl, "application/x-ndjson"),
+}
+"""Export format-name to `(line-iterator, mimetype)`."""
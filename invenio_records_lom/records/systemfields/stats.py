@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 #
-# Copyright (C) 2024 Graz University of Technology.
+# Copyright (C) 2024-2026 Graz University of Technology.
 #
 # invenio-records-lom is free software; you can redistribute it and/or
 # modify it under the terms of the MIT License; see LICENSE file for more
@@ -13,6 +13,7 @@ from invenio_search.proxies import current_search_client
 from invenio_search.utils import build_alias_name
 
 from ..statistics import LomStatistics
+from ..statistics.api import get_part_recids
 
 
 class LomRecordStatisticsField(RecordStatisticsField):
@@ -45,7 +46,16 @@ class LomRecordStatisticsField(RecordStatisticsField):
             stats = None
 
         # as a fallback, use the more up-to-date aggregations indices
-        return stats or self.api.get_record_stats(
+        stats = stats or self.api.get_record_stats(
             recid=recid,
             parent_recid=parent_recid,
         )
+
+        if record.get("resource_type") == "course" and "course" not in stats:
+            stats["course"] = self.api.get_course_stats(
+                recid=recid,
+                revision_id=record.revision_id,
+                part_recids=get_part_recids(record),
+            )
+
+        return stats
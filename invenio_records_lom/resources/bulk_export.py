@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-records-lom is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Streaming bulk export of records' index-documents, gzip-compressed."""
+
+import json
+import zlib
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from itertools import batched, chain
+from typing import NamedTuple
+
+from flask import current_app
+from lxml.etree import tostring
+
+from .serializers import LOMToDataCite44Serializer, LOMToOAIXMLSerializer
+
+BULK_EXPORT_JSON_KEYS = (
+    "id",
+    "pids",
+    "created",
+    "updated",
+    "resource_type",
+    "access",
+    "metadata",
+)
+"""Keys of index-documents included in JSONL-exports, others are internal."""
+
+
+def serialize_json(source: dict) -> str:
+    """Serialize index-document `source` to a JSON-line."""
+    record = {key: source[key] for key in BULK_EXPORT_JSON_KEYS if key in source}
+    return json.dumps(record) + "\n"
+
+
+def serialize_lom_xml(source: dict) -> str:
+    """Serialize index-document `source` to a LOM-XML element."""
+    lom = LOMToOAIXMLSerializer(
+        metadata=source["metadata"],
+        lom_id=source["id"],
+        oaiserver_id_prefix=current_app.config.get("OAISERVER_ID_PREFIX"),
+        doi=source.get("pids", {}).get("doi", {}).get("identifier"),
+    ).dump_obj()
+    return tostring(lom, encoding="unicode") + "\n"
+
+
+def serialize_datacite(source: dict) -> str:
+    """Serialize index-document `source` to a line of DataCite-JSON."""
+    return json.dumps(LOMToDataCite44Serializer().dump_obj(source)) + "\n"
+
+
+class BulkExportFormat(NamedTuple):
+    """How to serialize one record, and what to put around all of them."""
+
+    serialize: Callable[[dict], str]
+    extension: str
+    header: str = ""
+    footer: str = ""
+
+
+BULK_EXPORT_FORMATS = {
+    "jsonl": BulkExportFormat(serialize_json, "jsonl"),
+    "lom-xml": BulkExportFormat(
+        serialize_lom_xml,
+        "xml",
+        header='<?xml version="1.0" encoding="UTF-8"?>\n<records>\n',
+        footer="</records>\n",
+    ),
+    "datacite": BulkExportFormat(serialize_datacite, "jsonl"),
+}
+"""Bulk-export format-name to `BulkExportFormat`."""
+
+
+def iter_serialized(
+    sources: Iterable[dict],
+    serialize: Callable[[dict], str],
+    workers: int,
+    chunk_size: int,
+) -> Iterator[str]:
+    """Serialize `sources` in a pool of `workers` threads, keeping their order.
+
+    Sources are serialized in chunks of `chunk_size`, at most `2 * workers` chunks
+    are in flight at any time, which keeps memory flat regardless of their number.
+    """
+    # pylint: disable-next=protected-access
+    app = current_app._get_current_object()  # noqa: SLF001
+
+    def serialize_chunk(chunk: tuple[dict, ...]) -> str:
+        """Serialize `chunk` within an app-context, serializers read config."""
+        with app.app_context():
+            return "".join(serialize(source) for source in chunk)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for chunk in batched(sources, chunk_size):
+            pending.append(executor.submit(serialize_chunk, chunk))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def iter_gzip(chunks: Iterable[str]) -> Iterator[bytes]:
+    """Gzip-compress `chunks` incrementally, yielding compressed bytes as available."""
+    # wbits=31 makes zlib write a gzip-header and -trailer
+    compressor = zlib.compressobj(wbits=31)
+    for chunk in chunks:
+        if data := compressor.compress(chunk.encode()):
+            yield data
+    yield compressor.flush()
+
+
+def iter_bulk_export(sources: Iterable[dict], export_format: str) -> Iterator[bytes]:
+    """Export `sources` as gzip-compressed `export_format`."""
+    bulk_export_format = BULK_EXPORT_FORMATS[export_format]
+    serialized = iter_serialized(
+        sources,
+        bulk_export_format.serialize,
+        workers=current_app.config["LOM_BULK_EXPORT_WORKERS"],
+        chunk_size=current_app.config["LOM_BULK_EXPORT_CHUNK_SIZE"],
+    )
+    return iter_gzip(
+        chain([bulk_export_format.header], serialized, [bulk_export_format.footer]),
+    )
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-records-lom is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Conditional GET (ETag, Last-Modified) and Cache-Control for single records."""
+
+from datetime import UTC, datetime
+from hashlib import sha256
+from json import dumps
+
+from flask import current_app, request
+from invenio_records_resources.records.api import Record
+from werkzeug.http import http_date, is_resource_modified, quote_etag
+
+
+def record_validators(
+    record: Record,
+    variant: str = "",
+) -> tuple[str, datetime | None]:
+    """Get `(etag, last_modified)` of `record`'s `variant`-representation.
+
+    The ETag changes with the record's `revision_id`, `variant` distinguishes
+    between representations of the same revision (e.g. serialization format).
+    Published records' representations include statistics, which change without
+    a new revision. Their ETag also covers the statistics, and they have no
+    `last_modified`, as there is no telling when statistics last changed.
+    """
+    stats = None if record.is_draft else record.stats
+    if stats:
+        variant = f"{variant}&stats={dumps(stats, sort_keys=True, default=str)}"
+
+    etag = str(record.revision_id)
+    if variant:
+        etag = f"{etag}-{sha256(variant.encode()).hexdigest()[:8]}"
+    if stats:
+        return etag, None
+
+    # `updated` is naive UTC, HTTP-dates have second-precision
+    last_modified = record.updated.replace(tzinfo=UTC, microsecond=0)
+    return etag, last_modified
+
+
+def is_not_modified(etag: str, last_modified: datetime | None) -> bool:
+    """Whether the request's `If-None-Match`/`If-Modified-Since` still match."""
+    if request.method not in {"GET", "HEAD"}:
+        return False
+    return not is_resource_modified(
+        request.environ,
+        etag=etag,
+        last_modified=last_modified,
+    )
+
+
+def conditional_headers(
+    record: Record,
+    etag: str,
+    last_modified: datetime | None,
+    endpoint: str,
+) -> dict[str, str]:
+    """Build validator- and `Cache-Control`-headers for `endpoint`.
+
+    `Cache-Control` is taken from `LOM_CACHE_CONTROL[endpoint]`, restricted records
+    are never cached by shared caches.
+    """
+    headers = {"ETag": quote_etag(etag)}
+    if last_modified:
+        headers["Last-Modified"] = http_date(last_modified)
+
+    cache_control = current_app.config.get("LOM_CACHE_CONTROL", {}).get(endpoint)
+    protection = record.access.protection
+    if protection.record != "public" or protection.files != "public":
+        cache_control = "private, no-cache"
+    if cache_control:
+        headers["Cache-Control"] = cache_control
+
+    return headers
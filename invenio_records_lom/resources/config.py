@@ -17,9 +17,13 @@ from invenio_rdm_records.resources.config import (
 )
 from invenio_records_resources.resources import RecordResourceConfig
 from invenio_records_resources.resources.files import FileResourceConfig
+from invenio_records_resources.resources.records import SearchRequestArgsSchema
 from invenio_records_resources.services.base.config import ConfiguratorMixin
-from marshmallow import fields
+from marshmallow import fields, validate
 
+from ..records.statistics.api import STATS_EXPORT_GROUP_BY
+from ..records.statistics.export import STATS_EXPORT_FORMATS
+from .bulk_export import BULK_EXPORT_FORMATS
 from .serializers import LOMToCitationStringSerializer, LOMToUIJSONSerializer
 
 record_serializers = {
@@ -36,6 +40,17 @@ record_serializers = {
 url_prefix = "/oer"
 
 
+class LOMSearchRequestArgsSchema(SearchRequestArgsSchema):
+    """Search URL query string arguments, with cursor and fields.
+
+    `cursor` is for cursor-pagination, `fields=full` opts out of summarized hits.
+    """
+
+    cursor = fields.Str()
+    # declared last, as it shadows `marshmallow.fields` within the class-body
+    fields = fields.Str(validate=validate.OneOf(["full"]))
+
+
 class LOMDraftFilesResourceConfig(FileResourceConfig, ConfiguratorMixin):
     """LOM Draft Files Resource configuration."""
 
@@ -75,6 +90,12 @@ class LOMRecordResourceConfig(RecordResourceConfig, ConfiguratorMixin):
             "user-prefix": "/user",
             # PIDs
             "item-pids-reserve": "/<pid_value>/draft/pids/<scheme>",
+            # Bulk export
+            "bulk-export": "/export",
+            # Typeahead
+            "suggest": "/suggest",
+            # Statistics
+            "stats-export": "/stats/export",
         },
     )
 
@@ -90,6 +111,32 @@ class LOMRecordResourceConfig(RecordResourceConfig, ConfiguratorMixin):
         "locale": fields.Str(),
         "include_deleted": fields.Bool(),
     }
+    request_search_args = LOMSearchRequestArgsSchema
+    request_stats_export_args = {  # noqa: RUF012
+        "group_by": fields.Str(
+            load_default="recid",
+            validate=validate.OneOf(STATS_EXPORT_GROUP_BY),
+        ),
+        "start_date": fields.Date(),
+        "end_date": fields.Date(),
+        "format": fields.Str(
+            load_default="csv",
+            validate=validate.OneOf(STATS_EXPORT_FORMATS),
+        ),
+    }
+
+    request_suggest_args = {  # noqa: RUF012
+        "q": fields.Str(required=True, validate=validate.Length(min=1)),
+        "size": fields.Int(validate=validate.Range(min=1, max=25)),
+    }
+
+    request_bulk_export_args = {  # noqa: RUF012
+        "q": fields.Str(),
+        "format": fields.Str(
+            load_default="jsonl",
+            validate=validate.OneOf(BULK_EXPORT_FORMATS),
+        ),
+    }
 
     response_handlers = record_serializers
 
@@ -7,8 +7,48 @@
 
 """LOM resources."""
 
-from flask_resources import route
+from flask import (
+    Response,
+    current_app,
+    g,
+    redirect,
+    request,
+    stream_with_context,
+    url_for,
+)
+from flask_resources import (
+    from_conf,
+    request_parser,
+    resource_requestctx,
+    response_handler,
+    route,
+)
 from invenio_rdm_records.resources import RDMRecordResource
+from invenio_records_resources.resources.records.resource import (
+    request_extra_args,
+    request_read_args,
+    request_search_args,
+    request_view_args,
+)
+from invenio_records_resources.resources.records.utils import search_preference
+from sqlalchemy.exc import NoResultFound
+
+from ..records.statistics.export import STATS_EXPORT_FORMATS
+from .bulk_export import BULK_EXPORT_FORMATS, iter_bulk_export
+from .conditional import conditional_headers, is_not_modified, record_validators
+
+request_stats_export_args = request_parser(
+    from_conf("request_stats_export_args"),
+    location="args",
+)
+request_bulk_export_args = request_parser(
+    from_conf("request_bulk_export_args"),
+    location="args",
+)
+request_suggest_args = request_parser(
+    from_conf("request_suggest_args"),
+    location="args",
+)
 
 
 class LOMRecordResource(RDMRecordResource):
@@ -29,6 +69,7 @@ class LOMRecordResource(RDMRecordResource):
         return [
             route("DELETE", prefix(routes["item-draft"]), self.delete_draft),
             route("GET", prefix(routes["list"]), self.search),
+            route("GET", prefix(routes["suggest"]), self.suggest),
             route("GET", prefix(routes["item"]), self.read),
             route("POST", prefix(routes["list"]), self.create),
             route("POST", prefix(routes["item-draft"]), self.edit),
@@ -38,7 +79,119 @@ class LOMRecordResource(RDMRecordResource):
             # User Dashboard routes
             route("GET", s(routes["user-prefix"]), self.search_user_records),
             route("POST", prefix(routes["item-pids-reserve"]), self.pids_reserve),
+            # streams CSV/JSONL itself, hence no content-negotiation
+            route(
+                "GET",
+                prefix(routes["stats-export"]),
+                self.export_stats,
+                apply_decorators=False,
+            ),
+            # streams gzip itself, hence no content-negotiation
+            route(
+                "GET",
+                prefix(routes["bulk-export"]),
+                self.bulk_export,
+                apply_decorators=False,
+            ),
         ]
 
+    @request_extra_args
+    @request_read_args
+    @request_view_args
+    def read(self) -> Response:
+        """Read an item, respond with 304 if the client's copy is still current.
+
+        Validators are checked after reading (and permission-checking) the record,
+        but before running any serializer.
+        """
+        try:
+            item = self.service.read(
+                g.identity,
+                resource_requestctx.view_args["pid_value"],
+                expand=resource_requestctx.args.get("expand", False),
+                include_deleted=resource_requestctx.args.get("include_deleted", False),
+            )
+        except NoResultFound:
+            # `pid_value` might be a parent's, redirect to its latest version
+            latest = self.service.read_latest(
+                g.identity,
+                resource_requestctx.view_args["pid_value"],
+                expand=resource_requestctx.args.get("expand", False),
+            )
+            return redirect(url_for(".read", pid_value=latest.id))
+
+        # pylint: disable-next=protected-access
+        record = item._record  # noqa: SLF001
+        variant = (
+            f"{resource_requestctx.accept_mimetype}?{sorted(request.args.items())}"
+        )
+        etag, last_modified = record_validators(record, variant)
+        headers = conditional_headers(record, etag, last_modified, "read")
+        if is_not_modified(etag, last_modified):
+            return Response(status=304, headers=headers)
+
+        response_handler = resource_requestctx.response_handler
+        response = response_handler.make_response(item.to_dict(), 200)
+        response.headers.update(headers)
+        return response
+
+    @request_extra_args
+    @request_search_args
+    @response_handler(many=True)
+    def search(self) -> tuple[dict, int]:
+        """Perform a search over the items, summarizing hits for the response."""
+        hits = self.service.search(
+            identity=g.identity,
+            params=resource_requestctx.args,
+            search_preference=search_preference(),
+            expand=resource_requestctx.args.get("expand", False),
+            mimetype=resource_requestctx.accept_mimetype,
+        )
+        return hits.to_dict(), 200
+
+    @request_stats_export_args
+    def export_stats(self) -> Response:
+        """Stream aggregated statistics of all records as CSV or JSONL."""
+        args = resource_requestctx.args
+        group_by = args["group_by"]
+        rows = self.service.export_stats(
+            g.identity,
+            group_by=group_by,
+            start_date=args.get("start_date"),
+            end_date=args.get("end_date"),
+        )
+
+        iter_lines, mimetype = STATS_EXPORT_FORMATS[args["format"]]
+        filename = f"lom-stats-{group_by}.{args['format']}"
+        return Response(
+            stream_with_context(iter_lines(rows, group_by)),
+            mimetype=mimetype,
+            headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+        )
+
+    @request_bulk_export_args
+    def bulk_export(self) -> Response:
+        """Stream all (or the `q`-matching) published records, gzip-compressed."""
+        args = resource_requestctx.args
+        params = {"q": args["q"]} if args.get("q") else {}
+        sources = self.service.scan_published(g.identity, params=params)
+
+        export_format = args["format"]
+        extension = BULK_EXPORT_FORMATS[export_format].extension
+        filename = f"lom-records-{export_format}.{extension}.gz"
+        return Response(
+            stream_with_context(iter_bulk_export(sources, export_format)),
+            mimetype="application/gzip",
+            headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+        )
+
+    @request_suggest_args
+    def suggest(self) -> tuple[dict, int]:
+        """Suggest published records matching the typed-in prefix `q`."""
+        args = resource_requestctx.args
+        size = args.get("size") or current_app.config["LOM_SUGGEST_SIZE"]
+        suggestions = self.service.suggest(g.identity, args["q"], size)
+        return {"hits": suggestions}, 200
+
     # TODO: some parent-methods have @response_header_signposting,
     #   which adds an 'Link'-HTTP-header that is incorrect for LOM...
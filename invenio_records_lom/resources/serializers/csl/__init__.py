@@ -1,12 +1,12 @@
 # -*- coding: utf-8 -*-
 #
-# Copyright (C) 2024 Graz University of Technology.
+# Copyright (C) 2024-2026 Graz University of Technology.
 #
 # invenio-records-lom is free software; you can redistribute it and/or modify it
 # under the terms of the MIT License; see LICENSE file for more details.
 
 """CSL Serializer."""
 
-from .serializer import LOMToCitationStringSerializer
+from .serializer import LOMToCitationStringSerializer, request_url_args_retriever
 
-__all__ = ("LOMToCitationStringSerializer",)
+__all__ = ("LOMToCitationStringSerializer", "request_url_args_retriever")
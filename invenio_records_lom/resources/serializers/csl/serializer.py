@@ -1,23 +1,89 @@
 # -*- coding: utf-8 -*-
 #
-# Copyright (C) 2024 Graz University of Technology.
+# Copyright (C) 2024-2026 Graz University of Technology.
 #
 # invenio-records-lom is free software; you can redistribute it and/or modify it
 # under the terms of the MIT License; see LICENSE file for more details.
 
 """CSL serializers."""
 
+import re
 from collections.abc import Callable
+from functools import lru_cache
+from threading import Lock
 
+from citeproc import (
+    Citation,
+    CitationItem,
+    CitationStylesBibliography,
+    CitationStylesStyle,
+    formatter,
+)
+from citeproc.source.json import CiteProcJSON
 from citeproc_styles import get_style_filepath
+from flask import current_app, request
 from flask_resources import BaseListSchema, JSONSerializer, MarshmallowSerializer
-from invenio_rdm_records.resources.serializers.csl import get_citation_string
+from invenio_cache import current_cache
 
 from .schema import LOMToCSLSchema
 
 type StyleLocaleTuple = tuple[str | None, str | None]
 
 
+def request_url_args_retriever() -> StyleLocaleTuple:
+    """Get style and locale from the current request's query-args.
+
+    Unlike `csl_url_args_retriever`, this works outside of resource-requests too,
+    e.g. in plain flask views.
+    """
+    return request.args.get("style"), request.args.get("locale")
+
+
+@lru_cache(maxsize=64)
+def get_citation_style(style: str, locale: str) -> tuple[CitationStylesStyle, Lock]:
+    """Parse CSL-`style` with `locale` once per process.
+
+    citeproc-py's bibliographies write to their style while rendering,
+    the returned lock serializes rendering with the shared style.
+    """
+    style_filepath = get_style_filepath(style.lower())
+    citation_style = CitationStylesStyle(style_filepath, locale=locale, validate=False)
+    return citation_style, Lock()
+
+
+def clean_citation(text: str, doi: str | None, doi_link: str | None) -> str:
+    """Remove double spaces and punctuation, replace DOI-links with `doi_link`.
+
+    Copied from `invenio-rdm-records`'s `get_citation_string`.
+    """
+    if doi and doi_link:
+        text = text.replace(f"https://doi.org/{doi}", doi_link)
+    text = re.sub(r"\s\s+", " ", text)
+    return re.sub(r"\.\.+", ".", text)
+
+
+def render_citation(csl_json: dict, citation_style: CitationStylesStyle) -> str:
+    """Render `csl_json` as citation-string with already parsed `citation_style`."""
+    csl_json = dict(csl_json)
+    extras = csl_json.pop("_extras", {})
+    source = CiteProcJSON([csl_json])
+    bibliography = CitationStylesBibliography(citation_style, source, formatter.plain)
+    bibliography.register(Citation([CitationItem(csl_json["id"])]))
+
+    return clean_citation(
+        str(bibliography.bibliography()[0]),
+        csl_json.get("DOI"),
+        extras.get("links", {}).get("doi"),
+    )
+
+
+def citation_cache_key(record: dict, style: str, locale: str) -> str | None:
+    """Get the cache-key of `record`'s citation, `None` if it mustn't be cached."""
+    if record.get("is_draft") or record.get("revision_id") is None:
+        return None
+    return f"lom-citation:{record['id']}:{record['revision_id']}:{style}:{locale}"
+
+
 # Copied from `invenio-rdm-records`'s `StringCitationSerializer`, with some changes:
 class LOMToCitationStringSerializer(MarshmallowSerializer):
     """Marshmallow-based citation-string serializer for LOM records."""
@@ -40,21 +106,51 @@ class LOMToCitationStringSerializer(MarshmallowSerializer):
         )
         self.url_args_retriever = url_args_retriever
 
-    def serialize_object(self, record: dict) -> str:
-        """Serialize a single record."""
+    def get_style_and_locale(self) -> tuple[str, str]:
+        """Get style and locale from url-args, falling back to defaults."""
         style, locale = (
             self.url_args_retriever()
             if callable(self.url_args_retriever)
             else self.url_args_retriever
         )
+        return style or self.default_style, locale or self.default_locale
 
-        style = style or self.default_style
-        locale = locale or self.default_locale
-        style_filepath = get_style_filepath(style.lower())
+    def serialize_citations(self, records: list[dict]) -> list[str]:
+        """Serialize each of `records` to its citation-string, parsing the style once.
 
-        return get_citation_string(
-            self.dump_obj(record),
-            record["id"],
-            style_filepath,
-            locale,
+        Citations are cached per record revision, style and locale.
+        """
+        style, locale = self.get_style_and_locale()
+        keys = [citation_cache_key(record, style, locale) for record in records]
+        cached_keys = [key for key in keys if key]
+        cached = dict(
+            zip(cached_keys, current_cache.get_many(*cached_keys), strict=True),
         )
+
+        citations, to_cache = [], {}
+        for record, key in zip(records, keys, strict=True):
+            citation = cached.get(key)
+            if citation is None:
+                citation_style, lock = get_citation_style(style, locale)
+                with lock:
+                    citation = render_citation(self.dump_obj(record), citation_style)
+                if key:
+                    to_cache[key] = citation
+            citations.append(citation)
+
+        if to_cache:
+            timeout = current_app.config["LOM_CITATION_CACHE_TIMEOUT"]
+            current_cache.set_many(to_cache, timeout=timeout)
+        return citations
+
+    def serialize_object(self, record: dict) -> str:
+        """Serialize a single record."""
+        return self.serialize_citations([record])[0]
+
+    def serialize_object_list(self, records: dict) -> str:
+        """Serialize a page of search results to a bibliography, one entry per line.
+
+        Entries are in the order of the hits, rendered and cached the same as
+        single citations, so each entry's DOI-link is that of its own hit.
+        """
+        return "\n".join(self.serialize_citations(records["hits"]["hits"]))
@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 #
-# Copyright (C) 2024 Graz University of Technology.
+# Copyright (C) 2024-2026 Graz University of Technology.
 #
 # invenio-records-lom is free software; you can redistribute it and/or modify it
 # under the terms of the MIT License; see LICENSE file for more details.
@@ -11,6 +11,7 @@ from dcxml import simpledc
 from flask_resources import BaseListSchema, MarshmallowSerializer
 from flask_resources.serializers import JSONSerializer, SimpleSerializer
 
+from ....utils import LOMMetadata
 from .schema import LOMToDublinCoreRecordSchema
 
 
@@ -43,3 +44,7 @@ class LOMToDublinCoreXMLSerializer(MarshmallowSerializer):
             encoder=simpledc.tostring,
             **kwargs,
         )
+
+    def serialize_object(self, obj: dict) -> str:
+        """Serialize a single record, the schema works on its LOM-metadata."""
+        return super().serialize_object(LOMMetadata(obj["metadata"]))
@@ -1,12 +1,15 @@
 # -*- coding: utf-8 -*-
 #
-# Copyright (C) 2024 Graz University of Technology.
+# Copyright (C) 2024-2026 Graz University of Technology.
 #
 # invenio-records-lom is free software; you can redistribute it and/or modify it
 # under the terms of the MIT License; see LICENSE file for more details.
 
 """OAI-PMH Serializer."""
 
-from .serializer import LOMToOAIXMLSerializer
+from .serializer import LOMRecordToXMLSerializer, LOMToOAIXMLSerializer
 
-__all__ = ("LOMToOAIXMLSerializer",)
+__all__ = (
+    "LOMRecordToXMLSerializer",
+    "LOMToOAIXMLSerializer",
+)
@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 #
-# Copyright (C) 2024 Graz University of Technology.
+# Copyright (C) 2024-2026 Graz University of Technology.
 #
 # invenio-records-lom is free software; you can redistribute it and/or modify it
 # under the terms of the MIT License; see LICENSE file for more details.
@@ -13,7 +13,7 @@ from types import MappingProxyType
 
 from flask import current_app
 from lxml.builder import ElementMaker
-from lxml.etree import Element
+from lxml.etree import Element, tostring
 
 from .schema import LOMToOAISchema
 
@@ -176,3 +176,22 @@ class LOMToOAIXMLSerializer:
     def dump_obj(self) -> Element:
         """Serialize a single record."""
         return self.build(self.metadata, self.element_maker.lom(**self.ELEMENT_ATTRIBS))
+
+
+class LOMRecordToXMLSerializer:
+    """LOM-XML serializer for whole records, e.g. for exporting single records."""
+
+    def serialize_object(self, record: dict) -> str:
+        """Serialize a single record."""
+        lom = LOMToOAIXMLSerializer(
+            metadata=record["metadata"],
+            lom_id=record["id"],
+            oaiserver_id_prefix=current_app.config.get("OAISERVER_ID_PREFIX"),
+            doi=record.get("pids", {}).get("doi", {}).get("identifier"),
+        ).dump_obj()
+        return tostring(
+            lom,
+            encoding="UTF-8",
+            xml_declaration=True,
+            pretty_print=True,
+        ).decode()
@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 #
-# Copyright (C) 2021-2025 Graz University of Technology.
+# Copyright (C) 2021-2026 Graz University of Technology.
 #
 # invenio-records-lom is free software; you can redistribute it and/or modify it
 # under the terms of the MIT License; see LICENSE file for more details.
@@ -11,18 +11,18 @@ from re import search
 from types import MappingProxyType
 
 from flask import current_app
-from flask_resources import BaseObjectSchema
+from flask_resources import BaseListSchema, BaseObjectSchema
 from invenio_rdm_records.resources.serializers.ui.fields import AccessStatusField
 from invenio_rdm_records.resources.serializers.ui.schema import (
     FormatDate,
     record_version,
 )
-from marshmallow import fields
+from marshmallow import Schema, fields, pre_dump
 from marshmallow_oneofschema import OneOfSchema
 from werkzeug.local import LocalProxy
 
 from ....services.schemas.fields import ControlledVocabularyField
-from ..utils import get_newest_part, get_related, get_text
+from ..utils import get_related, get_text
 
 
 class Title(fields.Field):
@@ -137,6 +137,50 @@ class Rights(fields.Field):
         return [right]
 
 
+UI_FIELDS_KEY = "_ui_fields"
+"""Key under which pre-extracted UI-fields are passed to a schema's fields."""
+
+
+def extract_ui_fields(metadata: dict) -> dict:
+    """Extract list-valued UI-fields from LOM-`metadata`, visiting each part once."""
+    contributors = []
+    for contribute in metadata.get("lifecycle", {}).get("contribute", []):
+        if entities := contribute.get("entity", []):
+            role = get_text(contribute["role"]["value"])
+            contributors.extend(
+                {"fullname": entity, "role": role} for entity in entities
+            )
+
+    general_descriptions = metadata.get("general", {}).get("description", [])
+    educational_descriptions = metadata.get("educational", {}).get("description", [])
+    if isinstance(educational_descriptions, dict):
+        # TODO: sometimes `metadata.educational.description` is made
+        # :list[langstring], other times :langstring, unify this!
+        educational_descriptions = [educational_descriptions]
+
+    return {
+        "contributors": contributors,
+        "generalDescriptions": [
+            text for desc in general_descriptions if (text := get_text(desc))
+        ],
+        "educationalDescriptions": [
+            text for desc in educational_descriptions if (text := get_text(desc))
+        ],
+        "courses": [
+            {
+                "title": get_text(course["course"]["title"]),
+                "version": get_text(course["course"]["version"]),
+            }
+            for course in metadata.get("courses", [])
+        ],
+        "classifications": [
+            get_text(taxon["taxon"][-1]["entry"])
+            for classification in metadata.get("classification", [])
+            for taxon in classification.get("taxonpath", [])
+        ],
+    }
+
+
 class LOMUIBaseSchema(BaseObjectSchema):
     """Base schema for LOMUI-classes, containing all common fields."""
 
@@ -163,72 +207,30 @@ class LOMUIBaseSchema(BaseObjectSchema):
 
     is_draft = fields.Boolean(attribute="is_draft")
 
-    contributors = fields.Method("get_contributors")
+    contributors = fields.Raw(attribute=f"{UI_FIELDS_KEY}.contributors")
 
-    generalDescriptions = fields.Method("get_general_descriptions")  # noqa: N815
+    generalDescriptions = fields.Raw(  # noqa: N815
+        attribute=f"{UI_FIELDS_KEY}.generalDescriptions",
+    )
 
-    educationalDescriptions = fields.Method(  # noqa: N815
-        "get_educational_descriptions",
+    educationalDescriptions = fields.Raw(  # noqa: N815
+        attribute=f"{UI_FIELDS_KEY}.educationalDescriptions",
     )
 
-    courses = fields.Method("get_courses")
+    courses = fields.Raw(attribute=f"{UI_FIELDS_KEY}.courses")
 
-    classifications = fields.Method("get_classifications")
+    classifications = fields.Raw(attribute=f"{UI_FIELDS_KEY}.classifications")
 
     doi = fields.Method("get_doi")
 
-    def get_contributors(self, obj: dict) -> list[dict]:
-        """Get contributors."""
-        ui_contributors = []
-        for lom_contribute in (
-            obj["metadata"].get("lifecycle", {}).get("contribute", [])
-        ):
-            for entity in lom_contribute.get("entity", []):
-                ui_contributors.append(  # noqa: PERF401
-                    {
-                        "fullname": entity,
-                        "role": get_text(lom_contribute["role"]["value"]),
-                    },
-                )
-        return ui_contributors
-
-    def get_general_descriptions(self, obj: dict) -> list[str]:
-        """Get general descriptions."""
-        return [
-            get_text(desc)
-            for desc in obj["metadata"].get("general", {}).get("description", [])
-            if get_text(desc)
-        ]
-
-    def get_educational_descriptions(self, obj: dict) -> list[str]:
-        """Get educational descriptions."""
-        descriptions = obj["metadata"].get("educational", {}).get("description", [])
-        if isinstance(descriptions, dict):
-            # TODO: sometimes `metadata.educational.description` is made
-            # :list[langstring], other times :langstring, unify this!
-            descriptions = [descriptions]
-        return [get_text(desc) for desc in descriptions if get_text(desc)]
-
-    def get_courses(self, obj: dict) -> list[dict]:
-        """Get courses."""
-        courses = obj["metadata"].get("courses", [])
-        return [
-            {
-                "title": get_text(course["course"]["title"]),
-                "version": get_text(course["course"]["version"]),
-            }
-            for course in courses
-        ]
-
-    def get_classifications(self, obj: dict) -> list[str]:
-        """Get classifications."""
-        out = []
+    @pre_dump
+    def add_ui_fields(self, obj: dict, **__: dict) -> dict:
+        """Extract UI-fields once, rather than once per field."""
+        return {**obj, UI_FIELDS_KEY: self.extract_ui_fields(obj)}
 
-        for classification in obj["metadata"].get("classification", []):
-            for taxon in classification.get("taxonpath", []):
-                out.append(get_text(taxon["taxon"][-1]["entry"]))  # noqa: PERF401
-
-        return out
+    def extract_ui_fields(self, obj: dict) -> dict:
+        """Extract list-valued UI-fields of `obj`."""
+        return extract_ui_fields(obj["metadata"])
 
     def get_doi(self, obj: dict) -> str:
         """Get DOI."""
@@ -251,47 +253,30 @@ class LOMUIUnitSchema(LOMUIBaseSchema):
 class LOMUICourseSchema(LOMUIBaseSchema):
     """Schema for dumping html-template data to a record of resource_type "course"."""
 
-    def get_contributors(self, obj: dict) -> list[dict]:
-        """Get contributors, overwrites parent-class's `get_contributors`."""
-        # courses don't store contribution-information, try to get from
-        # associated unints instead
-        ui_contributors = []
-        for unit in get_related(obj, relation_kind="haspart"):
-            if "metadata" not in unit:
-                # in this case, relations of obj have not been dereferenced
-                # can happen e.g. when called with obj directly from opensearch
-                continue
-            ui_contributors.extend(super().get_contributors(unit))
-
-        return ui_contributors
+    def extract_ui_fields(self, obj: dict) -> dict:
+        """Extract UI-fields, overwrites parent-class's `extract_ui_fields`.
 
-    def get_general_descriptions(self, obj: dict) -> list[str]:
-        """Get general descriptions.
-
-        Overwrite parent-class's `get_general_descriptions`.
+        Courses don't store contribution- and description-information, these are
+        taken from all associated units and the newest associated unit respectively.
         """
-        # courses don't store description-information, try to get from newest
-        # associated unit instead
-        newest_unit = get_newest_part(obj)
-        if "metadata" not in newest_unit:
-            # in this case, relations of obj have not been dereferenced
+        ui_fields = super().extract_ui_fields(obj)
+        units_ui_fields = [
+            # relations of obj might not have been dereferenced
             # can happen e.g. when called with obj directly from opensearch
-            return []
-        return super().get_general_descriptions(newest_unit)
-
-    def get_educational_descriptions(self, obj: dict) -> list[str]:
-        """Get educational descriptions.
+            extract_ui_fields(unit["metadata"]) if "metadata" in unit else None
+            for unit in get_related(obj, relation_kind="haspart")
+        ]
 
-        Overwrite parent-class's `get_educational_descriptions`.
-        """
-        # courses don't store description-information, try to get from newest
-        # associated unit instead
-        newest_unit = get_newest_part(obj)
-        if "metadata" not in newest_unit:
-            # in this case, relations of obj have not been dereferenced
-            # can happen e.g. when called with obj directly from opensearch
-            return []
-        return super().get_educational_descriptions(newest_unit)
+        ui_fields["contributors"] = [
+            contributor
+            for unit_ui_fields in units_ui_fields
+            if unit_ui_fields
+            for contributor in unit_ui_fields["contributors"]
+        ]
+        newest_unit_ui_fields = units_ui_fields[-1]
+        for key in ("generalDescriptions", "educationalDescriptions"):
+            ui_fields[key] = newest_unit_ui_fields[key] if newest_unit_ui_fields else []
+        return ui_fields
 
 
 class LOMUIUploadSchema(LOMUIFileSchema):
@@ -317,9 +302,37 @@ class LOMUIRecordSchema(OneOfSchema):
         },
     )
 
+    def __init__(self, *args, **kwargs) -> None:  # noqa: ANN002, ANN003
+        """Construct, with one instance per type-schema.
+
+        `OneOfSchema` would instantiate type-schemas anew for each dumped record.
+        """
+        super().__init__(*args, **kwargs)
+        self.type_schemas = MappingProxyType(
+            {
+                obj_type: schema_cls()
+                for obj_type, schema_cls in type(self).type_schemas.items()
+            },
+        )
+
     def get_obj_type(self, obj: dict) -> str:
         """Get type of `obj`.
 
         Which is used as a key to look up a schema within type_schemas
         """
         return obj["resource_type"]
+
+
+class LOMUIListSchema(BaseListSchema):
+    """List-schema dumping all hits of all pages with the same object-schema."""
+
+    def __init__(self, object_schema_cls: type[Schema], **kwargs: dict) -> None:
+        """Construct."""
+        super().__init__(object_schema_cls=object_schema_cls, **kwargs)
+        self.object_schema = object_schema_cls()
+
+    def get_hits(self, obj_list: dict) -> dict:
+        """Dump hits."""
+        hits = obj_list["hits"]
+        hits["hits"] = self.object_schema.dump(hits["hits"], many=True)
+        return hits
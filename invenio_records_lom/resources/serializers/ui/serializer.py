@@ -1,15 +1,15 @@
 # -*- coding: utf-8 -*-
 #
-# Copyright (C) 2024-2025 Graz University of Technology.
+# Copyright (C) 2024-2026 Graz University of Technology.
 #
 # invenio-records-lom is free software; you can redistribute it and/or modify it
 # under the terms of the MIT License; see LICENSE file for more details.
 
 """UI serializer."""
 
-from flask_resources import BaseListSchema, JSONSerializer, MarshmallowSerializer
+from flask_resources import JSONSerializer, MarshmallowSerializer
 
-from .schema import LOMUIRecordSchema
+from .schema import LOMUIListSchema, LOMUIRecordSchema
 
 
 class LOMToUIJSONSerializer(MarshmallowSerializer):
@@ -20,5 +20,5 @@ class LOMToUIJSONSerializer(MarshmallowSerializer):
         super().__init__(
             format_serializer_cls=JSONSerializer,
             object_schema_cls=LOMUIRecordSchema,
-            list_schema_cls=BaseListSchema,
+            list_schema_cls=LOMUIListSchema,
         )
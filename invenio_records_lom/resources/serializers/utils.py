@@ -38,9 +38,3 @@ def get_related(obj: dict, relation_kind: str, catalog: str = "repo-pid") -> lis
             results.append(identifier)
 
     return results
-
-
-def get_newest_part(obj: dict):  # noqa: ANN201
-    """Get newest dereferenced record that is "haspart"-related to `obj`."""
-    parts = get_related(obj, relation_kind="haspart")
-    return parts[-1]
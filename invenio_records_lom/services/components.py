@@ -9,6 +9,7 @@
 
 from copy import copy
 
+from flask import current_app
 from flask_principal import Identity
 from invenio_drafts_resources.records import Record
 from invenio_drafts_resources.services.records.components import (
@@ -26,7 +27,9 @@ from invenio_records_resources.services.uow import TaskOp
 
 from ..records import LOMDraft, LOMRecord
 from ..utils import LOMMetadata
+from .pid_queue import EnqueuePIDOp
 from .pids import ParentPIDSComponent
+from .search_cache import InvalidateSearchCacheOp
 from .tasks import register_or_update_pid
 
 
@@ -108,7 +111,7 @@ class LOMPIDsComponent(PIDsComponent):
         record.metadata = metadata.json
 
     # overwrite `publish`` to use the celery-task from this package
-    # this was copied from its parent class, except for its last line
+    # this was copied from its parent class, except for its last lines
     def publish(
         self,
         identity: Identity,  # noqa: ARG002
@@ -162,8 +165,33 @@ class LOMPIDsComponent(PIDsComponent):
         record.pids = pids
 
         # Async register/update tasks after transaction commit.
-        for scheme in pids:
-            self.uow.register(TaskOp(register_or_update_pid, record["id"], scheme))
+        for scheme, pid_attrs in pids.items():
+            if current_app.config["LOM_PIDS_QUEUE_ENABLED"]:
+                op = EnqueuePIDOp(record["id"], scheme, pid_attrs["provider"])
+            else:
+                op = TaskOp(register_or_update_pid, record["id"], scheme)
+            self.uow.register(op)
+
+
+class SearchCacheComponent(ServiceComponent):
+    """Service component expiring cached search results when records change."""
+
+    def publish(
+        self,
+        identity: Identity,  # noqa: ARG002
+        draft: LOMDraft = None,  # noqa: ARG002
+        record: LOMRecord = None,  # noqa: ARG002
+    ) -> None:
+        """Expire cached search results after publishing."""
+        self.uow.register(InvalidateSearchCacheOp())
+
+    def delete_record(self, identity: Identity, **__: dict) -> None:  # noqa: ARG002
+        """Expire cached search results after deleting."""
+        self.uow.register(InvalidateSearchCacheOp())
+
+    def restore_record(self, identity: Identity, **__: dict) -> None:  # noqa: ARG002
+        """Expire cached search results after restoring."""
+        self.uow.register(InvalidateSearchCacheOp())
 
 
 DefaultRecordsComponents = [
@@ -175,4 +203,5 @@ DefaultRecordsComponents = [
     ParentPIDSComponent,
     RelationsComponent,
     ResourceTypeComponent,
+    SearchCacheComponent,
 ]
@@ -36,15 +36,20 @@ from invenio_records_resources.services.base.config import (
 )
 from invenio_records_resources.services.base.links import EndpointLink
 from invenio_records_resources.services.files.links import FileEndpointLink
-from invenio_records_resources.services.records.links import (
-    RecordEndpointLink,
-    pagination_endpoint_links,
+from invenio_records_resources.services.records.links import RecordEndpointLink
+from invenio_records_resources.services.records.params import FacetsParam
+from invenio_records_resources.services.records.queryparser import (
+    QueryParser,
+    SearchFieldTransformer,
 )
 
 from ..records import LOMDraft, LOMRecord
 from . import facets
 from .components import DefaultRecordsComponents
+from .pagination import CursorParam, cursor_pagination_endpoint_links
+from .params import LOMFacetsParam, PopularityBoostParam, SourceFieldsParam
 from .permissions import LOMRecordPermissionPolicy
+from .results import LOMRecordList
 from .schemas import LOMRecordSchema
 
 
@@ -122,12 +127,53 @@ class FromConfigLOMRequiredPIDs:
         ]
 
 
+lom_query_parser_cls = QueryParser.factory(
+    fields=[
+        "langstrings.title.*^3",
+        "langstrings.keyword.*^2",
+        "langstrings.description.*",
+        "metadata.lifecycle.contribute.entity",
+        "metadata.general.identifier.entry.langstring.#text",
+        "metadata.courses.course.title.langstring.#text",
+        "metadata.classification.taxonpath.taxon.entry.langstring.#text",
+    ],
+    tree_transformer_cls=SearchFieldTransformer,
+    mapping={
+        "title": "langstrings.title.\\*",
+        "description": "langstrings.description.\\*",
+        "keyword": "langstrings.keyword.\\*",
+    },
+)
+"""Query parser targeting langstrings' language-specific fields."""
+
+
+def with_lom_facets_param(params_interpreters_cls: list[type]) -> list[type]:
+    """Replace `FacetsParam` with `LOMFacetsParam` in `params_interpreters_cls`."""
+    return [
+        LOMFacetsParam if interpreter_cls is FacetsParam else interpreter_cls
+        for interpreter_cls in params_interpreters_cls
+    ]
+
+
 class LOMSearchOptions(SearchOptions, SearchOptionsMixin):
     """Search options applied when calling .search on the corresponding LOM-Service."""
 
+    query_parser_cls = lom_query_parser_cls
+    params_interpreters_cls = [  # noqa: RUF012
+        *with_lom_facets_param(SearchOptions.params_interpreters_cls),
+        PopularityBoostParam,
+        SourceFieldsParam,
+        CursorParam,
+    ]
+
     facets = MappingProxyType(
         {
             "right_license": facets.rights_license,
+            "oefos": facets.oefos,
+            "resource_type": facets.resource_type,
+            "language": facets.language,
+            "format": facets.technical_format,
+            "learningresourcetype": facets.learningresourcetype,
         },
     )
 
@@ -135,9 +181,20 @@ class LOMSearchOptions(SearchOptions, SearchOptionsMixin):
 class LOMSearchDraftsOptions(SearchDraftsOptions, SearchOptionsMixin):
     """Search options for drafts search."""
 
+    query_parser_cls = lom_query_parser_cls
+    params_interpreters_cls = [  # noqa: RUF012
+        *with_lom_facets_param(SearchDraftsOptions.params_interpreters_cls),
+        CursorParam,
+    ]
+
     facets = MappingProxyType(
         {
             "right_license": facets.rights_license,
+            "oefos": facets.oefos,
+            "resource_type": facets.resource_type,
+            "language": facets.language,
+            "format": facets.technical_format,
+            "learningresourcetype": facets.learningresourcetype,
         },
     )
 
@@ -149,6 +206,8 @@ class LOMRecordServiceConfig(RecordServiceConfig, ConfiguratorMixin):
     draft_cls = LOMDraft
     record_cls = LOMRecord
 
+    result_list_cls = LOMRecordList
+
     indexer_cls = RecordIndexer
     indexer_queue_name = "lom-records"
     draft_indexer_cls = RecordIndexer
@@ -219,9 +278,11 @@ class LOMRecordServiceConfig(RecordServiceConfig, ConfiguratorMixin):
         default=DefaultRecordsComponents,
     )
 
-    links_search = pagination_endpoint_links("lom_records.search")
+    links_search = cursor_pagination_endpoint_links("lom_records.search")
 
-    links_search_drafts = pagination_endpoint_links("lom_records.search_user_records")
+    links_search_drafts = cursor_pagination_endpoint_links(
+        "lom_records.search_user_records",
+    )
 
 
 class LOMDraftFilesServiceConfig(FileServiceConfig, ConfiguratorMixin):
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-records-lom is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Bulk operations on DataCite-DOIs."""
+
+from collections import deque
+from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from flask import current_app
+from invenio_rdm_records.services.pids.providers import DataCitePIDProvider
+
+from ..proxies import current_records_lom
+
+
+def get_datacite_provider() -> DataCitePIDProvider:
+    """Get the configured DataCite-provider of the records-service."""
+    pid_manager = current_records_lom.records_service.pids.pid_manager
+    # pylint: disable-next=protected-access
+    return pid_manager._get_provider("doi", "datacite")  # noqa: SLF001
+
+
+def bulk_update_doi_metadata(
+    sources: Iterable[dict],
+    provider: DataCitePIDProvider,
+    workers: int,
+) -> tuple[int, list[str]]:
+    """Re-send DataCite-metadata for the DataCite-DOIs of `sources`.
+
+    `sources` are records' index-documents, metadata is serialized in the calling
+    thread, while up to `workers` requests to DataCite are in flight at once.
+    Like `provider.update`, restricted records' DOIs are hidden instead.
+    Returns the number of updated DOIs and the list of DOIs that failed, failing
+    to serialize or to send one DOI's metadata doesn't abort the others.
+    """
+    api = provider.client.api
+    serializer = provider.serializer
+    updated, failed = 0, []
+
+    def fail(doi: str, error: Exception) -> None:
+        """Record that updating `doi` failed."""
+        current_app.logger.warning("Updating metadata of DOI %s failed: %s", doi, error)
+        failed.append(doi)
+
+    def collect(doi: str, future: Future) -> None:
+        """Wait for `future`, count its outcome."""
+        nonlocal updated
+        try:
+            future.result()
+            updated += 1
+        except Exception as error:  # noqa: BLE001
+            # e.g. `DataCiteError`, or `requests`' connection-errors
+            fail(doi, error)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending: deque[tuple[str, Future]] = deque()
+        for source in sources:
+            doi_info = source.get("pids", {}).get("doi", {})
+            if doi_info.get("provider") != "datacite":
+                continue
+
+            doi = doi_info["identifier"]
+            if source["access"]["record"] == "restricted":
+                future = executor.submit(api.hide_doi, doi=doi)
+            else:
+                try:
+                    metadata = serializer.dump_obj(source)
+                except Exception as error:  # noqa: BLE001
+                    fail(doi, error)
+                    continue
+                metadata["event"] = "publish"
+                future = executor.submit(api.update_doi, metadata=metadata, doi=doi)
+
+            pending.append((doi, future))
+            if len(pending) >= 2 * workers:
+                collect(*pending.popleft())
+        while pending:
+            collect(*pending.popleft())
+
+    return updated, failed
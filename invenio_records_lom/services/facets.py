@@ -1,48 +1,227 @@
 # -*- coding: utf-8 -*-
 #
-# Copyright (C) 2023-2024 Graz University of Technology.
+# Copyright (C) 2023-2026 Graz University of Technology.
 #
 # invenio-records-lom is free software; you can redistribute it and/or modify it
 # under the terms of the MIT License; see LICENSE file for more details.
 
 """LOM facets (`facet` is opensearch-lingo for `search-query filter`)."""
 
+from functools import lru_cache
+
 from invenio_i18n import gettext as _
+from invenio_i18n.ext import current_i18n
 from invenio_records_resources.services.records.facets import TermsFacet
+from invenio_search.engine import dsl
 
+from ..records.dumpers.facets import OEFOS_LEVEL_LENGTHS, get_oefos_ancestors
+from ..utils import LICENSE_LABELS, get_learningresourcetypedict, get_oefosdict
 
-def license_labels(keys: list) -> dict:
-    """Label licenses.
 
-    ATTENTION: # noqa
-    this should be a temporary solution. the real solution should be to fix the
-    metadata within the database.
+def get_label_language() -> str:
+    """Get language of the current locale, if vocabularies have labels in it."""
+    language = current_i18n.locale.language
+    return language if language in {"de", "en"} else "en"
 
-    """
-    license_mapping = {
-        "https://creativecommons.org/publicdomain/zero/1.0/": _("CC0 1.0"),
-        "https://creativecommons.org/licenses/by/4.0/": _("CC BY 4.0"),
-        "https://creativecommons.org/licenses/by-sa/4.0/": _("CC BY-SA 4.0"),
-        "https://creativecommons.org/licenses/by-nd/4.0/": _("CC BY-ND 4.0"),
-        "https://creativecommons.org/licenses/by-nc/4.0/": _("CC BY-NC 4.0"),
-        "https://creativecommons.org/licenses/by-nc-sa/4.0/": _("CC BY-NC-SA 4.0"),
-        "https://creativecommons.org/licenses/by-nc-nd/4.0/": _("CC BY-NC-ND 4.0"),
-    }
+
+@lru_cache(maxsize=2)
+def get_cached_oefosdict(language: str) -> dict[str, str]:
+    """Get OEFOS-dict of `language`, read from file once per process."""
+    return get_oefosdict(language)
+
+
+@lru_cache(maxsize=1)
+def get_cached_learningresourcetypedict() -> dict[str, dict[str, str]]:
+    """Get learningresourcetypes-dict, read from file once per process."""
+    return get_learningresourcetypedict()
+
+
+def oefos_labels(keys: list) -> dict:
+    """Label OEFOS-codes with the names of their disciplines."""
+    oefosdict = get_cached_oefosdict(get_label_language())
+    return {key: f"{key} {oefosdict.get(key, '')}".strip() for key in keys}
+
+
+def language_labels(keys: list) -> dict:
+    """Label language-codes with their names in the current locale."""
+    languages = current_i18n.locale.languages
+    return {key: languages.get(key, key) for key in keys}
+
+
+def learningresourcetype_labels(keys: list) -> dict:
+    """Label learning resource type URLs with their names."""
+    labels_by_ending = get_cached_learningresourcetypedict()
+    language = get_label_language()
     out = {}
     for key in keys:
-        search_key = key
-        if search_key[-1] != "/":
-            search_key += "/"
-        if search_key[0:5] == "http:":
-            search_key = f"https{search_key[4:]}"
+        labels = labels_by_ending.get(key.rstrip("/").rsplit("/", 1)[-1], {})
+        out[key] = labels.get(language, key)
+    return out
 
-        out[key] = license_mapping.get(search_key)
 
-    return out
+def license_labels(keys: list) -> dict:
+    """Label license ids with their licenses' names, unknown ones by their URLs."""
+    return {key: str(LICENSE_LABELS.get(key, key)) for key in keys}
+
+
+def get_oefos_children_pattern(code: str) -> str | None:
+    """Get regex matching the children of OEFOS-`code`, "" being the root."""
+    child_lengths = [length for length in OEFOS_LEVEL_LENGTHS if length > len(code)]
+    if not child_lengths:
+        return None
+    return f"{code}[0-9]{{{child_lengths[0] - len(code)}}}"
+
+
+def get_expanded_oefos(selected: list[str]) -> list[str]:
+    """Get OEFOS-codes whose children are shown, i.e. selected codes and ancestors."""
+    expanded = {ancestor for code in selected for ancestor in get_oefos_ancestors(code)}
+    return sorted(code for code in expanded if get_oefos_children_pattern(code))
+
+
+class OEFOSFacet(TermsFacet):
+    """Hierarchical facet of OEFOS-codes, aggregating children on demand.
+
+    Initially, only top-level codes are aggregated. Selecting a code expands it,
+    its children are aggregated by a terms-aggregation restricted to the code's
+    documents. Expects codes to be indexed together with all their ancestors.
+    Selected codes are passed to `get_aggregation` by `LOMFacetsParam`, so no
+    per-request state is kept on the (shared) facet.
+    """
+
+    children_size = 100
+
+    def get_aggregation(self, filter_values: list[str] | None = None) -> dsl.A:
+        """Aggregate top-level codes and children of codes `filter_values` expand."""
+        field = self._params["field"]
+        aggs = {
+            "top": dsl.A("terms", field=field, include=get_oefos_children_pattern("")),
+        }
+        for code in get_expanded_oefos(filter_values or []):
+            aggs[f"children_{code}"] = dsl.A(
+                "filter",
+                term={field: code},
+                aggs={
+                    "children": dsl.A(
+                        "terms",
+                        field=field,
+                        include=get_oefos_children_pattern(code),
+                        size=self.children_size,
+                    ),
+                },
+            )
+        return dsl.A("filter", match_all={}, aggs=aggs)
+
+    def add_filter(self, filter_values: list[str]) -> dsl.Q | None:
+        """Filter by selected codes, ignoring those with selected descendants."""
+        deepest = [
+            code
+            for code in filter_values
+            if not any(
+                other != code and other.startswith(code) for other in filter_values
+            )
+        ]
+        if not deepest:
+            return None
+        return dsl.Q("terms", **{self._params["field"]: deepest})
+
+    def _get_buckets_by_parent(
+        self,
+        data,  # noqa: ANN001
+        filter_values: list[str],
+    ) -> dict:
+        """Get result-buckets by their parent's code, "" for top-level codes."""
+        buckets_by_parent = {"": data.top.buckets}
+        for code in get_expanded_oefos(filter_values):
+            if children := getattr(data, f"children_{code}", None):
+                buckets_by_parent[code] = children.children.buckets
+        return buckets_by_parent
+
+    def _build_buckets(
+        self,
+        buckets_by_parent: dict,
+        filter_values: list[str],
+        label_map: dict | None,
+        parent: str = "",
+    ) -> list[dict]:
+        """Build (labelled) output-buckets of `parent`'s children, recursively."""
+        out = []
+        for bucket in buckets_by_parent[parent]:
+            key = self.get_value(bucket)
+            bucket_out = {
+                "key": key,
+                "doc_count": self.get_metric(bucket),
+                "is_selected": self.is_filtered(key, filter_values),
+            }
+            if label_map is not None:
+                bucket_out["label"] = label_map[key]
+            if key in buckets_by_parent:
+                bucket_out["inner"] = {
+                    "buckets": self._build_buckets(
+                        buckets_by_parent,
+                        filter_values,
+                        label_map,
+                        parent=key,
+                    ),
+                }
+            out.append(bucket_out)
+        return out
+
+    def get_values(self, data, filter_values: list[str]) -> dict:  # noqa: ANN001
+        """Get an unlabelled tree of buckets."""
+        buckets_by_parent = self._get_buckets_by_parent(data, filter_values)
+        return {"buckets": self._build_buckets(buckets_by_parent, filter_values, None)}
+
+    def get_labelled_values(
+        self,
+        data,  # noqa: ANN001
+        filter_values: list[str],
+    ) -> dict:
+        """Get a labelled tree of buckets, labelling all codes at once."""
+        buckets_by_parent = self._get_buckets_by_parent(data, filter_values)
+        all_buckets = [b for buckets in buckets_by_parent.values() for b in buckets]
+        label_map = self.get_label_mapping(all_buckets)
+        buckets = self._build_buckets(buckets_by_parent, filter_values, label_map)
+        return {"buckets": buckets, "label": str(self._label)}
 
 
 rights_license = TermsFacet(
-    field="metadata.rights.url.keyword",
+    field="metadata.rights.license_id",
     label=_("License"),
     value_labels=license_labels,
 )
+
+
+oefos = OEFOSFacet(
+    field="facets.oefos",
+    label=_("Discipline"),
+    value_labels=oefos_labels,
+)
+
+resource_type = TermsFacet(
+    field="resource_type",
+    label=_("Resource type"),
+    value_labels={
+        "course": _("Course"),
+        "unit": _("Unit"),
+        "file": _("File"),
+        "link": _("Link"),
+        "upload": _("Upload"),
+    },
+)
+
+language = TermsFacet(
+    field="facets.language",
+    label=_("Language"),
+    value_labels=language_labels,
+)
+
+technical_format = TermsFacet(
+    field="facets.format",
+    label=_("Format"),
+)
+
+learningresourcetype = TermsFacet(
+    field="facets.learningresourcetype",
+    label=_("Learning resource type"),
+    value_labels=learningresourcetype_labels,
+)
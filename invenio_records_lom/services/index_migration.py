@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-records-lom is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Migrate records and drafts to new versions of their search-indices.
+
+New index-versions are created next to the old ones and filled from the database.
+Only then are aliases switched over, in one atomic request,
+so searches are answered by the old indices until the new ones are complete.
+"""
+
+from invenio_access.permissions import system_identity
+from invenio_search import current_search, current_search_client
+from invenio_search.utils import build_alias_name
+
+from .services import LOMRecordService
+
+
+def get_alias_names(index: str) -> list[str]:
+    """Get names of the aliases invenio-search puts on `index`, prefixed."""
+
+    def find_path(tree: dict, path: tuple[str, ...]) -> tuple[str, ...] | None:
+        """Find the aliases in `tree` leading to `index`."""
+        for name, value in tree.items():
+            if not isinstance(value, dict):
+                if name == index:
+                    return path
+            elif (found := find_path(value, (*path, name))) is not None:
+                return found
+        return None
+
+    path = find_path(current_search.aliases, ()) or ()
+    return [build_alias_name(alias) for alias in path]
+
+
+def migrate_indices(
+    service: LOMRecordService,
+    old_version: str,
+    *,
+    delete_old: bool = False,
+) -> dict[str, str]:
+    """Migrate `service`'s record- and draft-indices from `old_version`.
+
+    The current index-versions are those of `service`'s api-classes' `IndexField`s.
+    Returns a dict mapping old to new concrete index-names.
+    """
+    client = current_search_client
+    old_aliases_by_index = {}
+    for api_cls in [service.record_cls, service.draft_cls]:
+        # pylint: disable-next=protected-access
+        new_index = api_cls.index._name  # noqa: SLF001
+        old_index = f"{new_index.rsplit('-v', 1)[0]}-v{old_version}"
+        # fails if the old index doesn't exist, before anything was changed
+        old_aliases_by_index[new_index] = client.indices.get_alias(
+            index=build_alias_name(old_index),
+        )
+
+    new_concretes = {
+        new_index: current_search.create_index(new_index)[0][0]
+        for new_index in old_aliases_by_index
+    }
+
+    # records are indexed into the new indices' write-aliases
+    service.rebuild_index(system_identity)
+    service.indexer.process_bulk_queue()
+    service.draft_indexer.process_bulk_queue()
+    for new_index in new_concretes:
+        current_search.flush_and_refresh(new_index)
+
+    actions, renamed = [], {}
+    for new_index, new_concrete in new_concretes.items():
+        old_aliases = old_aliases_by_index[new_index]
+        for alias in get_alias_names(new_index):
+            actions.extend(
+                {"remove": {"index": old_concrete, "alias": alias}}
+                for old_concrete, info in old_aliases.items()
+                if alias in info["aliases"]
+            )
+            actions.append({"add": {"index": new_concrete, "alias": alias}})
+        renamed.update(dict.fromkeys(old_aliases, new_concrete))
+    client.indices.update_aliases(body={"actions": actions})
+
+    if delete_old:
+        client.indices.delete(index=",".join(renamed))
+    return renamed
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-records-lom is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Standardize license URLs stored in records and drafts.
+
+Older records store the same license under different spellings of its URL,
+e.g. with "http:" or without trailing "/", as only newer inputs are standardized.
+"""
+
+from invenio_db import db
+
+from ..utils.util import standardize_url
+from .services import LOMRecordService
+
+
+def normalize_rights_url(metadata: dict) -> bool:
+    """Standardize the license URL of `metadata` in place, return whether it changed.
+
+    The rights' description is updated too, when it is the URL itself.
+    """
+    rights = metadata.get("rights", {})
+    url = rights.get("url")
+    if not url or (standardized := standardize_url(url)) == url:
+        return False
+
+    rights["url"] = standardized
+    langstring = rights.get("description", {}).get("langstring", {})
+    if langstring.get("#text") == url:
+        langstring["#text"] = standardized
+    return True
+
+
+def normalize_license_urls(service: LOMRecordService) -> int:
+    """Standardize license URLs of `service`'s records and drafts, reindex changed ones.
+
+    Returns the number of changed records and drafts.
+    """
+    changed = 0
+    for api_cls, indexer in [
+        (service.record_cls, service.indexer),
+        (service.draft_cls, service.draft_indexer),
+    ]:
+        model_cls = api_cls.model_cls
+        changed_ids = []
+        for model in model_cls.query.filter(model_cls.is_deleted.is_(False)):
+            record = api_cls(model.data, model=model)
+            if normalize_rights_url(record.get("metadata", {})):
+                record.commit()
+                changed_ids.append(model.id)
+        db.session.commit()
+
+        indexer.bulk_index(changed_ids)
+        indexer.process_bulk_queue()
+        changed += len(changed_ids)
+    return changed
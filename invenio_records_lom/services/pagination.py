@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-records-lom is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Cursor-pagination of searches, for traversing result sets of any depth.
+
+Pages are fetched with `search_after` within a point in time (PIT) of the indices,
+so they are neither limited by `max_result_window` nor slower the deeper they are,
+and later pages aren't affected by concurrent changes.
+Cursors are opaque to clients, they carry the PIT's id and the last hit's sort.
+PITs are closed after their last page, opening new ones is rate-limited per user.
+"""
+
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from collections.abc import Iterator
+from contextlib import contextmanager
+from json import dumps, loads
+
+from flask import current_app, has_request_context, request
+from flask_principal import Identity
+from invenio_i18n import gettext as _
+from invenio_records_resources.services.base.links import EndpointLink
+from invenio_records_resources.services.errors import QuerystringValidationError
+from invenio_records_resources.services.records.links import (
+    pagination_endpoint_links,
+)
+from invenio_records_resources.services.records.params.base import ParamInterpreter
+from invenio_search import current_search_client
+from invenio_search.engine import dsl
+from invenio_search.engine import search as search_engine
+
+from ..utils import TokenBucketLimiter
+from .search_cache import is_anonymous
+
+CURSOR_TIEBREAKER = {"id": "asc"}
+"""Sort appended to every cursor-paginated search, for a total order of hits."""
+
+
+def encode_cursor(pit_id: str, search_after: list) -> str:
+    """Encode the cursor to continue within PIT `pit_id` after `search_after`."""
+    payload = dumps({"pit_id": pit_id, "search_after": search_after})
+    return urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> dict:
+    """Decode `cursor` to a dict with "pit_id" and "search_after"."""
+    try:
+        payload = loads(urlsafe_b64decode(cursor.encode()))
+    except ValueError as error:
+        raise QuerystringValidationError(_("Invalid cursor.")) from error
+
+    if not (
+        isinstance(payload, dict)
+        and isinstance(payload.get("pit_id"), str)
+        and isinstance(payload.get("search_after"), list)
+    ):
+        raise QuerystringValidationError(_("Invalid cursor."))
+    return payload
+
+
+def _get_pit_limiter() -> TokenBucketLimiter | None:
+    """Get the current app's limiter of opening PITs, if configured."""
+    limit = current_app.config.get("LOM_SEARCH_CURSOR_RATE_LIMIT")
+    if not limit:
+        return None
+
+    ext = current_app.extensions["invenio-records-lom"]
+    if ext.search_cursor_limiter is None:
+        ext.search_cursor_limiter = TokenBucketLimiter(
+            capacity=limit["capacity"],
+            refill_rate=limit["refill_rate"],
+            max_keys=current_app.config["LOM_SEARCH_CURSOR_RATE_LIMIT_MAX_KEYS"],
+        )
+    return ext.search_cursor_limiter
+
+
+def _rate_limit_key(identity: Identity) -> str | None:
+    """Get the key to rate-limit `identity` by, its user or else its IP-address."""
+    if not is_anonymous(identity):
+        return f"user:{identity.id}"
+    if has_request_context() and request.remote_addr:
+        return f"ip:{request.remote_addr}"
+    return None
+
+
+def open_pit(identity: Identity, indices: list | str) -> str:
+    """Open a PIT of `indices` for `identity`, return its id.
+
+    Raises `QuerystringValidationError` if `identity` opens PITs too often.
+    """
+    limiter = _get_pit_limiter()
+    key = _rate_limit_key(identity)
+    if limiter and key and not limiter.allow(key):
+        raise QuerystringValidationError(
+            _("Too many new cursors, continue existing ones or retry later."),
+        )
+
+    pit = current_search_client.create_point_in_time(
+        index=indices,
+        keep_alive=current_app.config["LOM_SEARCH_CURSOR_KEEP_ALIVE"],
+    )
+    return pit["pit_id"]
+
+
+def close_pit(pit_id: str) -> None:
+    """Close the PIT `pit_id`, if it hasn't expired already."""
+    current_search_client.delete_point_in_time(body={"pit_id": [pit_id]}, ignore=404)
+
+
+@contextmanager
+def cursor_errors(params: dict | None) -> Iterator[None]:
+    """Raise search-errors caused by an expired or unknown cursor as invalid args.
+
+    Without a cursor to continue from, errors are re-raised as they are.
+    """
+    try:
+        yield
+    except (search_engine.NotFoundError, search_engine.RequestError) as error:
+        if not (params and params.get("cursor")):
+            raise
+        raise QuerystringValidationError(
+            _("Cursor expired or invalid, start over with an empty cursor."),
+        ) from error
+
+
+class CursorParam(ParamInterpreter):
+    """Evaluate the 'cursor' parameter, paginating by `search_after` within a PIT.
+
+    An empty cursor opens a new PIT and starts with the first page, at a rate
+    limited by `LOM_SEARCH_CURSOR_RATE_LIMIT`.
+    Needs to run after the sort is set, as it appends a tiebreaker to it.
+    """
+
+    def apply(
+        self,
+        identity: Identity,
+        search: dsl.Search,
+        params: dict,
+    ) -> dsl.Search:
+        """Evaluate the cursor on the search."""
+        if "cursor" not in params:
+            return search
+
+        keep_alive = current_app.config["LOM_SEARCH_CURSOR_KEEP_ALIVE"]
+        if params["cursor"]:
+            cursor = decode_cursor(params["cursor"])
+            pit_id = cursor["pit_id"]
+            search = search.extra(search_after=cursor["search_after"])
+        else:
+            # pylint: disable-next=protected-access
+            pit_id = open_pit(identity, search._index)  # noqa: SLF001
+
+        # searches within a PIT mustn't name indices, nor set a preference
+        # pylint: disable-next=protected-access
+        sort = search._sort  # noqa: SLF001
+        search = search.index().params(preference=None).sort(*sort, CURSOR_TIEBREAKER)
+        search = search.extra(pit={"id": pit_id, "keep_alive": keep_alive})
+        return search[: params["size"]]
+
+
+class CursorPagination:
+    """Pagination of a cursor-paginated page, which has no previous page."""
+
+    has_prev = False
+
+    def __init__(self, size: int, results: dsl.response.Response) -> None:
+        """Construct."""
+        hits = results.hits
+        pit_id = getattr(results, "pit_id", None)
+        self.has_next = bool(pit_id) and len(hits) == size
+        self.next_cursor = (
+            encode_cursor(pit_id, list(hits[-1].meta.sort)) if self.has_next else None
+        )
+
+
+def cursor_pagination_endpoint_links(endpoint: str, params: list | None = None) -> dict:
+    """Create pagination links (prev/self/next), continuing cursors if present."""
+
+    def next_vars(pagination: CursorPagination, vars_: dict) -> None:
+        """Point to the next page, by cursor if paginating by cursor."""
+        if isinstance(pagination, CursorPagination):
+            vars_["args"].pop("page", None)
+            vars_["args"]["cursor"] = pagination.next_cursor
+        else:
+            vars_["args"]["page"] = pagination.next_page.page
+
+    return {
+        **pagination_endpoint_links(endpoint, params=params),
+        "next": EndpointLink(
+            endpoint,
+            when=lambda pagination, _: pagination.has_next,
+            vars=next_vars,
+            params=params,
+        ),
+    }
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-records-lom is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Search parameter interpreters for LOM records."""
+
+from flask import current_app
+from flask_principal import Identity
+from invenio_records_resources.services.records.params import FacetsParam
+from invenio_records_resources.services.records.params.base import ParamInterpreter
+from invenio_search.engine import dsl
+
+from .facets import OEFOSFacet
+
+
+class LOMFacetsParam(FacetsParam):
+    """Evaluate facets, passing selected values to OEFOS-facets' aggregations.
+
+    `FacetsParam` would hand them to `prepare_aggregation` instead, for facets to
+    keep until `get_aggregation` is called.
+    """
+
+    def aggregate(self, search: dsl.Search) -> dsl.Search:
+        """Add aggregations representing the facets."""
+        for name, facet in self.facets.items():
+            selected = list(self.selected_values.get(name, []))
+            if isinstance(facet, OEFOSFacet):
+                agg = facet.get_aggregation(selected)
+            else:
+                if selected:
+                    facet.prepare_aggregation(selected)
+                agg = facet.get_aggregation()
+            search.aggs.bucket(name, agg)
+        return search
+
+
+class PopularityBoostParam(ParamInterpreter):
+    """Boost relevance-sorted searches by records' precomputed popularity.
+
+    Uses a `rank_feature`-query on the dumped `popularity`, in an optional clause,
+    so records without views or downloads still match.
+    Needs to run after the sort is set, as only relevance-sorted searches are boosted.
+    """
+
+    def apply(
+        self,
+        identity: Identity,  # noqa: ARG002
+        search: dsl.Search,
+        params: dict,
+    ) -> dsl.Search:
+        """Add the popularity-boost to the search."""
+        boost = current_app.config["LOM_SEARCH_POPULARITY_BOOST"]
+        if not boost or not params.get("q") or params.get("sort") != "bestmatch":
+            return search
+
+        rank_feature = dsl.Q("rank_feature", field="popularity", boost=boost)
+        return search.query("bool", should=[rank_feature], minimum_should_match=0)
+
+
+class SourceFieldsParam(ParamInterpreter):
+    """Project hits' `_source` to the summary configured for the response's mimetype.
+
+    Summaries are looked up in `LOM_SEARCH_SOURCE_FIELDS` by the "mimetype"-param,
+    full documents are returned for unconfigured mimetypes or `fields=full`.
+    """
+
+    def apply(
+        self,
+        identity: Identity,  # noqa: ARG002
+        search: dsl.Search,
+        params: dict,
+    ) -> dsl.Search:
+        """Restrict the search's `_source` to the summary's fields."""
+        if params.get("fields") == "full":
+            return search
+
+        source_fields = current_app.config["LOM_SEARCH_SOURCE_FIELDS"]
+        if not (summary := source_fields.get(params.get("mimetype"))):
+            return search
+        return search.source(**summary)
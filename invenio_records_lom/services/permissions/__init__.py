@@ -1,12 +1,13 @@
 # -*- coding: utf-8 -*-
 #
-# Copyright (C) 2023 Graz University of Technology.
+# Copyright (C) 2023-2026 Graz University of Technology.
 #
 # invenio-records-lom is free software; you can redistribute it and/or modify it
 # under the terms of the MIT License; see LICENSE file for more details.
 
 """Permission-policy and roles, based on `flask-principal`."""
 
+from .evaluation import evaluate_permissions
 from .generators import OERCertifiedUsers, OERCurators
 from .policy import LOMRecordPermissionPolicy
 
@@ -14,4 +15,5 @@ __all__ = (
     "LOMRecordPermissionPolicy",
     "OERCertifiedUsers",
     "OERCurators",
+    "evaluate_permissions",
 )
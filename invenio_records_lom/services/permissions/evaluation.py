@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-records-lom is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Evaluate several actions of a permission-policy at once."""
+
+from functools import cache
+
+from flask_principal import Identity, Need
+from invenio_records_permissions.policies import BasePermissionPolicy
+
+
+class SharedGeneratorResultsMixin:
+    """Policy-mixin that takes generator-results from `shared_results` if present.
+
+    Actions of a policy mostly reuse the same generator-instances (e.g. `can_curate`
+    extends `can_manage`), when sharing `shared_results` between policy-instances
+    of different actions, each generator is evaluated only once.
+    """
+
+    def __init__(
+        self,
+        action: str,
+        shared_results: dict[tuple[int, str], set[Need]],
+        **over: dict,
+    ) -> None:
+        """Construct."""
+        super().__init__(action, **over)
+        self.shared_results = shared_results
+
+    def _collect(self, kind: str) -> set[Need]:
+        """Collect `kind` ("needs", "excludes") of all generators of this action."""
+        collected = set()
+        for generator in self.generators:
+            key = (id(generator), kind)
+            if key not in self.shared_results:
+                self.shared_results[key] = set(getattr(generator, kind)(**self.over))
+            collected |= self.shared_results[key]
+        return collected
+
+    @property
+    def needs(self) -> set[Need]:
+        """Set of Needs granting permission."""
+        self.explicit_needs |= self._collect("needs")
+        self._load_permissions()
+        return self._permissions.needs
+
+    @property
+    def excludes(self) -> set[Need]:
+        """Set of Needs denying permission."""
+        self.explicit_excludes |= self._collect("excludes")
+        self._load_permissions()
+        return self._permissions.excludes
+
+
+@cache
+def _shared_results_policy_cls(
+    policy_cls: type[BasePermissionPolicy],
+) -> type[BasePermissionPolicy]:
+    """Create (once) a subclass of `policy_cls` that shares generator-results."""
+    name = f"SharedResults{policy_cls.__name__}"
+    return type(name, (SharedGeneratorResultsMixin, policy_cls), {})
+
+
+def evaluate_permissions(
+    policy_cls: type[BasePermissionPolicy],
+    identity: Identity,
+    actions: list[str],
+    **over: dict,
+) -> dict[str, bool]:
+    """Check `actions` for `identity`, evaluating each generator at most once.
+
+    Equivalent to `policy_cls(action, **over).allows(identity)` for every action.
+    """
+    shared_results = {}
+    shared_cls = _shared_results_policy_cls(policy_cls)
+    return {
+        action: shared_cls(action, shared_results, **over).allows(identity)
+        for action in actions
+    }
@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 #
-# Copyright (C) 2021-2025 Graz University of Technology.
+# Copyright (C) 2021-2026 Graz University of Technology.
 #
 # invenio-records-lom is free software; you can redistribute it and/or modify it
 # under the terms of the MIT License; see LICENSE file for more details.
@@ -78,6 +78,8 @@ class LOMRecordPermissionPolicy(RecordPermissionPolicy):
     )
     # Allow submitting new record
     can_create = can_handle_oer
+    # Allow streaming all (readable) records at once, which is expensive
+    can_bulk_export = (OERCurators(), SystemProcess())
 
     #
     # Drafts
@@ -154,6 +156,12 @@ class LOMRecordPermissionPolicy(RecordPermissionPolicy):
     # Allow lifting a record or draft.
     can_lift_embargo = can_manage
 
+    #
+    # Statistics
+    #
+    # Allow exporting aggregated statistics of all records
+    can_export_stats = (OERCurators(), SystemProcess())
+
     #
     # Communities
     #
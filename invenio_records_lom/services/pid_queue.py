@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-records-lom is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Queue of PIDs to register (or update) at their providers, processed in bulk.
+
+Publishing many records at once (e.g. batch imports) would otherwise send one
+request per PID to the provider at once, running into its rate limits.
+Jobs are kept in a queue on the celery-broker, like invenio-indexer's bulk-queue.
+"""
+
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from queue import Empty
+from time import sleep as time_sleep
+
+from celery import current_app as current_celery_app
+from flask import current_app
+from invenio_cache import current_cache
+from invenio_records_resources.services.uow import Operation, UnitOfWork
+from kombu.simple import SimpleQueue
+
+from ..utils import TokenBucketLimiter
+
+PID_QUEUE_NAME = "lom-pid-registration"
+PID_QUEUE_FAILURES_KEY = "lom-pid-queue:failures"
+
+
+def _pending_key(job: dict) -> str:
+    """Get the cache-key marking `job` as queued."""
+    return f"lom-pid-queue:pending:{job['recid']}:{job['scheme']}"
+
+
+@contextmanager
+def pid_queue() -> Iterator[SimpleQueue]:
+    """Open the PID-queue on the celery-broker."""
+    with current_celery_app.pool.acquire(block=True) as connection:
+        queue = connection.SimpleQueue(PID_QUEUE_NAME)
+        try:
+            yield queue
+        finally:
+            queue.close()
+
+
+def enqueue_pid(recid: str, scheme: str, provider: str, runs: int = 0) -> bool:
+    """Queue registering `recid`'s `scheme`-PID, unless that is already queued.
+
+    Returns whether a job was added. `runs` counts previously failed processings.
+    """
+    job = {"recid": recid, "scheme": scheme, "provider": provider, "runs": runs}
+    timeout = current_app.config["LOM_PIDS_QUEUE_PENDING_TIMEOUT"]
+    if not current_cache.add(_pending_key(job), value=True, timeout=timeout):
+        return False
+
+    with pid_queue() as queue:
+        queue.put(job)
+    return True
+
+
+class EnqueuePIDOp(Operation):
+    """Queue a PID-registration after the unit of work was committed."""
+
+    def __init__(self, recid: str, scheme: str, provider: str) -> None:
+        """Construct."""
+        self.recid = recid
+        self.scheme = scheme
+        self.provider = provider
+
+    def on_post_commit(self, uow: UnitOfWork) -> None:  # noqa: ARG002
+        """Queue the PID."""
+        enqueue_pid(self.recid, self.scheme, self.provider)
+
+
+def get_pid_queue_stats() -> dict[str, int]:
+    """Get number of queued jobs and of jobs that failed since the last reset."""
+    with pid_queue() as queue:
+        depth = queue.qsize()
+    return {"depth": depth, "failures": current_cache.get(PID_QUEUE_FAILURES_KEY) or 0}
+
+
+def process_pid_jobs(
+    jobs: list[dict],
+    register: Callable[[dict], None],
+    limiters: dict[str, TokenBucketLimiter],
+    *,
+    workers: int,
+    max_retries: int,
+    backoff: float,
+    sleep: Callable[[float], None] = time_sleep,
+) -> list[dict]:
+    """Run `register` for `jobs` with up to `workers` at a time, return failed jobs.
+
+    Before each attempt, a token is taken from the limiter of the job's provider.
+    Failed attempts are retried `max_retries` times, after waiting `backoff`
+    seconds, doubling with every further retry.
+    """
+    # pylint: disable-next=protected-access
+    app = current_app._get_current_object()  # noqa: SLF001
+
+    def run(job: dict) -> bool:
+        """Register `job`, return whether that eventually succeeded."""
+        limiter = limiters.get(job["provider"])
+        with app.app_context():
+            for attempt in range(max_retries + 1):
+                while limiter and not limiter.allow(job["provider"]):
+                    sleep(1 / limiter.refill_rate)
+                try:
+                    register(job)
+                except Exception:
+                    app.logger.warning(
+                        "Registering PID of %s failed.",
+                        job,
+                        exc_info=True,
+                    )
+                    if attempt < max_retries:
+                        sleep(backoff * 2**attempt)
+                else:
+                    return True
+        return False
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        succeeded = list(executor.map(run, jobs))
+    return [job for job, ok in zip(jobs, succeeded, strict=True) if not ok]
+
+
+def drain_pid_queue(register: Callable[[dict], None]) -> tuple[int, int]:
+    """Process up to `LOM_PIDS_QUEUE_BATCH_SIZE` queued jobs, coalescing duplicates.
+
+    Failed jobs are queued again for the next run, until they have failed
+    `LOM_PIDS_QUEUE_MAX_RUNS` times. Returns the number of processed and failed jobs.
+    """
+    config = current_app.config
+    limiters = {
+        provider: TokenBucketLimiter(
+            capacity=limit["capacity"],
+            refill_rate=limit["refill_rate"],
+            max_keys=1,
+        )
+        for provider, limit in config["LOM_PIDS_QUEUE_RATE_LIMITS"].items()
+    }
+
+    with pid_queue() as queue:
+        messages, jobs = [], {}
+        while len(messages) < config["LOM_PIDS_QUEUE_BATCH_SIZE"]:
+            try:
+                message = queue.get_nowait()
+            except Empty:
+                break
+            messages.append(message)
+            job = message.payload
+            jobs[job["recid"], job["scheme"]] = job
+
+        # publishing again from now on queues anew, even while processing
+        current_cache.delete_many(*[_pending_key(job) for job in jobs.values()])
+        failed = process_pid_jobs(
+            list(jobs.values()),
+            register,
+            limiters,
+            workers=config["LOM_PIDS_QUEUE_WORKERS"],
+            max_retries=config["LOM_PIDS_QUEUE_MAX_RETRIES"],
+            backoff=config["LOM_PIDS_QUEUE_BACKOFF"],
+        )
+        for message in messages:
+            message.ack()
+
+    if failed:
+        current_cache.inc(PID_QUEUE_FAILURES_KEY, len(failed))
+    for job in failed:
+        runs = job.get("runs", 0) + 1
+        if runs < config["LOM_PIDS_QUEUE_MAX_RUNS"]:
+            enqueue_pid(job["recid"], job["scheme"], job["provider"], runs=runs)
+        else:
+            current_app.logger.error("Giving up on registering PID of %s.", job)
+
+    return len(jobs), len(failed)
@@ -7,6 +7,9 @@
 
 """Customized classes used by pids-service."""
 
+from contextvars import ContextVar
+
+from datacite.errors import DataCiteError
 from flask_principal import Identity
 from invenio_drafts_resources.services.records.components import ServiceComponent
 from invenio_i18n import lazy_gettext as _
@@ -15,6 +18,12 @@ from marshmallow import ValidationError
 
 from ..records.api import LOMRecord
 
+raise_datacite_errors: ContextVar[bool] = ContextVar(
+    "raise_datacite_errors",
+    default=False,
+)
+"""When set, `LOMDataCitePIDProvider` raises errors of DataCite-requests."""
+
 
 class LOMDataCitePIDProvider(DataCitePIDProvider):
     """DataCite pid provider with customized validate.
@@ -71,6 +80,17 @@ class LOMDataCitePIDProvider(DataCitePIDProvider):
 
         return success and not errors, errors
 
+    @staticmethod
+    def _log_errors(exception: DataCiteError) -> None:
+        """Log `exception`, re-raise it if `raise_datacite_errors` is set.
+
+        The parent-class swallows errors of DataCite-requests after logging them,
+        which leaves callers that want to retry (e.g. the PID-queue) no way to tell.
+        """
+        DataCitePIDProvider._log_errors(exception)  # noqa: SLF001
+        if raise_datacite_errors.get():
+            raise exception
+
 
 class ParentPIDSComponent(ServiceComponent):
     """Service component for record parent PIDs."""
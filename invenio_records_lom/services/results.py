@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-records-lom is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Service results for LOM records."""
+
+from invenio_rdm_records.services.results import RDMRecordList
+from invenio_records_resources.pagination import Pagination
+
+from .pagination import CursorPagination, close_pit
+
+
+class LOMRecordList(RDMRecordList):
+    """Record list, paginated by cursor if the search was."""
+
+    def __init__(self, *args, **kwargs) -> None:  # noqa: ANN002, ANN003
+        """Construct, closing the search's PIT if this is its last page."""
+        super().__init__(*args, **kwargs)
+        pit_id = getattr(self._results, "pit_id", None)
+        if pit_id and not self.pagination.has_next:
+            close_pit(pit_id)
+
+    @property
+    def pagination(self) -> Pagination | CursorPagination:
+        """Create a pagination object."""
+        if self._params and "cursor" in self._params:
+            return CursorPagination(self._params["size"], self._results)
+        return super().pagination
+
+    def to_dict(self) -> dict:
+        """Return result as a dictionary, without page-number if paginated by cursor."""
+        result = super().to_dict()
+        if self._params and "cursor" in self._params:
+            result.pop("page", None)
+        return result
@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 #
-# Copyright (C) 2024 Graz University of Technology.
+# Copyright (C) 2024-2026 Graz University of Technology.
 #
 # invenio-records-lom is free software; you can redistribute it and/or
 # modify it under the terms of the MIT License; see LICENSE file for more
@@ -30,3 +30,7 @@ class LomStatisticSchema(Schema):
 
     this_version = fields.Nested(PartialStatisticSchema)
     all_versions = fields.Nested(PartialStatisticSchema)
+    # summed over all parts, only for course-type records
+    course = fields.Nested(PartialStatisticSchema)
+    # time-decayed combination of views and downloads of all versions
+    popularity = fields.Float()
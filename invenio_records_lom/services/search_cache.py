@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-records-lom is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Short-lived cache of anonymous users' search results.
+
+All anonymous users get the same results for the same search, so their responses
+are shared, keyed by the search's final request-body, which normalizes the order
+and defaults of query parameters. Keys include a generation, which is increased
+whenever a record is published, deleted or restored, expiring all cached results.
+"""
+
+from hashlib import sha256
+from json import dumps
+
+from flask_principal import Identity
+from invenio_cache import current_cache
+from invenio_records_resources.services.uow import Operation, UnitOfWork
+from invenio_search.engine import dsl
+
+SEARCH_CACHE_GENERATION_KEY = "lom-search-cache:generation"
+
+
+def is_anonymous(identity: Identity) -> bool:
+    """Check whether `identity` belongs to a user that isn't logged in."""
+    return identity.id is None
+
+
+def search_cache_key(search: dsl.Search) -> str:
+    """Get the cache-key of `search`'s response, in the current generation."""
+    generation = current_cache.get(SEARCH_CACHE_GENERATION_KEY) or 0
+    body = dumps(search.to_dict(), sort_keys=True, default=str)
+    return f"lom-search-cache:{generation}:{sha256(body.encode()).hexdigest()}"
+
+
+def invalidate_search_cache() -> None:
+    """Expire all cached search results, by starting a new generation."""
+    current_cache.inc(SEARCH_CACHE_GENERATION_KEY)
+
+
+class InvalidateSearchCacheOp(Operation):
+    """Expire cached search results after the unit of work was committed."""
+
+    def on_post_commit(self, uow: UnitOfWork) -> None:  # noqa: ARG002
+        """Expire cached search results."""
+        invalidate_search_cache()
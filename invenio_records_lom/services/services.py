@@ -1,14 +1,203 @@
 # -*- coding: utf-8 -*-
 #
-# Copyright (C) 2021-2024 Graz University of Technology.
+# Copyright (C) 2021-2026 Graz University of Technology.
 #
 # invenio-records-lom is free software; you can redistribute it and/or modify it
 # under the terms of the MIT License; see LICENSE file for more details.
 
 """Record services configured for LOM-use."""
 
+from collections.abc import Iterator
+from datetime import date
+from hashlib import sha256
+
+from flask import current_app
+from flask_principal import Identity
+from invenio_cache import current_cache
 from invenio_rdm_records.services import RDMRecordService
+from invenio_records_resources.services import LinksTemplate
+from invenio_search.engine import dsl
+
+from ..records.statistics import LomStatistics
+from .pagination import cursor_errors
+from .results import LOMRecordList
+from .search_cache import is_anonymous, search_cache_key
+
+SUGGEST_FIELDS = ("title", "keyword", "contributor")
+"""Subfields of `suggest` in the index, as dumped by `LOMSuggestDumperExt`."""
+
+
+def suggest_cache_key(identity: Identity, q: str, size: int) -> str:
+    """Get the cache-key of suggestions for `q`, per user as results are filtered."""
+    q_hash = sha256(q.strip().lower().encode()).hexdigest()
+    return f"lom-suggest:{identity.id}:{size}:{q_hash}"
 
 
 class LOMRecordService(RDMRecordService):
     """RecordService configured for LOM-use."""
+
+    def search(
+        self,
+        identity: Identity,
+        params: dict | None = None,
+        search_preference: str | None = None,
+        expand: bool = False,  # noqa: FBT001, FBT002
+        extra_filter: dsl.query.Query | None = None,
+        *,
+        mimetype: str | None = None,
+        **kwargs,  # noqa: ANN003
+    ) -> LOMRecordList:
+        """Search for published records, summarized and sharing anonymous results.
+
+        Hits are summarized to the fields `LOM_SEARCH_SOURCE_FIELDS` configures for
+        `mimetype`, unless `params` ask for "full" fields.
+        Responses to anonymous users' searches are cached for
+        `LOM_SEARCH_CACHE_TIMEOUT` seconds, or until any record is published.
+        Cursor-paginated searches aren't cached, as their cursors are unique.
+        """
+        # same as `super().search`, but for summaries and the cached execution
+        self.require_permission(identity, "search", params=params, **kwargs)
+        params = params or {}
+        params["mimetype"] = mimetype
+        search = self._search(
+            "search",
+            identity,
+            params,
+            search_preference,
+            extra_filter=extra_filter,
+            permission_action="read_deleted",
+            **kwargs,
+        )
+        # the mimetype is for params-interpreters only, links mustn't pass it on
+        params.pop("mimetype")
+
+        timeout = current_app.config["LOM_SEARCH_CACHE_TIMEOUT"]
+        cacheable = timeout and is_anonymous(identity) and "cursor" not in params
+        key = search_cache_key(search) if cacheable else None
+        if key and (cached := current_cache.get(key)) is not None:
+            # pylint: disable-next=protected-access
+            search_result = search._response_class(search, cached)  # noqa: SLF001
+        else:
+            with cursor_errors(params):
+                search_result = search.execute()
+            if key:
+                current_cache.set(key, search_result.to_dict(), timeout=timeout)
+
+        return self.result_list(
+            self,
+            identity,
+            search_result,
+            params,
+            links_tpl=LinksTemplate(self.config.links_search, context={"args": params}),
+            links_item_tpl=self.links_item_tpl,
+            expandable_fields=self.expandable_fields,
+            expand=expand,
+        )
+
+    def search_drafts(
+        self,
+        identity: Identity,
+        params: dict | None = None,
+        *args,  # noqa: ANN002
+        **kwargs,  # noqa: ANN003
+    ) -> LOMRecordList:
+        """Search for drafts, raising expired cursors as invalid args."""
+        with cursor_errors(params):
+            return super().search_drafts(identity, params, *args, **kwargs)
+
+    def export_stats(
+        self,
+        identity: Identity,
+        group_by: str = "recid",
+        start_date: date | None = None,
+        end_date: date | None = None,
+    ) -> Iterator[dict]:
+        """Iterate aggregated view/download statistics, one row per `group_by`.
+
+        Permission is checked eagerly, the rows themselves are fetched lazily.
+        """
+        self.require_permission(identity, "export_stats")
+
+        return LomStatistics.iter_aggregated_stats(
+            group_by=group_by,
+            start_date=start_date,
+            end_date=end_date,
+            page_size=current_app.config["LOM_STATS_EXPORT_PAGE_SIZE"],
+        )
+
+    def scan_published(
+        self,
+        identity: Identity,
+        params: dict | None = None,
+    ) -> Iterator[dict]:
+        """Iterate index-documents of published, non-deleted records matching `params`.
+
+        Documents are scrolled from the search-index only, without loading records
+        from the database. Only the records `identity` may read are included.
+        Permission is checked eagerly, the documents themselves are fetched lazily.
+        Index-only fields added by the dumper's extensions are removed.
+        """
+        self.require_permission(identity, "bulk_export")
+
+        search = self._search(
+            "scan",
+            identity,
+            params or {},
+            None,
+            extra_filter=dsl.Q("term", deletion_status="P"),
+        )
+        search = search.params(size=current_app.config["LOM_BULK_EXPORT_SCROLL_SIZE"])
+        # pylint: disable-next=protected-access
+        extensions = self.record_cls.dumper._extensions  # noqa: SLF001
+
+        def load(source: dict) -> dict:
+            """Reverse the dumper-extensions' changes to `source`."""
+            for extension in extensions:
+                extension.load(source, self.record_cls)
+            return source
+
+        return (load(hit.to_dict()) for hit in search.scan())
+
+    def suggest(self, identity: Identity, q: str, size: int) -> list[dict]:
+        """Suggest up to `size` published records as `q` is being typed.
+
+        Matches prefixes of titles, keywords and contributors' names, waiting for
+        the search at most `LOM_SUGGEST_TIMEOUT`. Suggestions are cached per user.
+        """
+        self.require_permission(identity, "search")
+
+        key = suggest_cache_key(identity, q, size)
+        if (suggestions := current_cache.get(key)) is not None:
+            return suggestions
+
+        search = self.create_search(
+            identity,
+            self.record_cls,
+            self.config.search,
+            extra_filter=dsl.Q("term", deletion_status="P")
+            & dsl.Q("term", **{"versions.is_latest": True}),
+            versioning=False,
+        )
+        fields = [
+            f"suggest.{field}{suffix}"
+            for field in SUGGEST_FIELDS
+            for suffix in ("", "._2gram", "._3gram")
+        ]
+        search = (
+            search.query("multi_match", query=q, type="bool_prefix", fields=fields)
+            .source(["id", "suggest.title"])
+            .extra(
+                size=size,
+                timeout=current_app.config["LOM_SUGGEST_TIMEOUT"],
+                track_total_hits=False,
+            )
+        )
+
+        suggestions = []
+        for hit in search.execute():
+            titles = hit.to_dict().get("suggest", {}).get("title", [])
+            suggestions.append({"id": hit.id, "title": titles[0] if titles else ""})
+
+        timeout = current_app.config["LOM_SUGGEST_CACHE_TIMEOUT"]
+        current_cache.set(key, suggestions, timeout=timeout)
+        return suggestions
@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 #
-# Copyright (C) 2022-2024 Graz University of Technology.
+# Copyright (C) 2022-2026 Graz University of Technology.
 #
 # invenio-records-lom is free software; you can redistribute it and/or modify it
 # under the terms of the MIT License; see LICENSE file for more details.
@@ -9,14 +9,20 @@
 
 from datetime import datetime, timedelta, timezone
 
-from celery import shared_task
+from celery import chord, group, shared_task
+from flask import current_app
 from invenio_access.permissions import system_identity
+from invenio_cache.errors import LockAcquireFailed
+from invenio_cache.lock import CachedMutex
 from invenio_search.engine import dsl
+from invenio_search.engine import search as search_engine
 from invenio_search.proxies import current_search_client
 from invenio_search.utils import prefix_index
 from invenio_stats.bookmark import BookmarkAPI
 
 from ..proxies import current_records_lom
+from .pid_queue import drain_pid_queue
+from .pids import raise_datacite_errors
 
 
 @shared_task(ignore_result=True)
@@ -29,9 +35,91 @@ def register_or_update_pid(recid: str, scheme: str) -> None:
     )
 
 
+def register_or_update_queued_pid(job: dict) -> None:
+    """Update a PID of the PID-queue on its remote provider, raising on failure."""
+    token = raise_datacite_errors.set(True)
+    try:
+        register_or_update_pid(recid=job["recid"], scheme=job["scheme"])
+    finally:
+        raise_datacite_errors.reset(token)
+
+
+@shared_task(ignore_result=True)
+def lom_process_pid_queue() -> str:
+    """Register/update queued PIDs, one run at a time.
+
+    Runs overlapping with a still active run return immediately, so concurrency
+    towards providers stays bounded by `LOM_PIDS_QUEUE_WORKERS`.
+    """
+    try:
+        with CachedMutex("lom-pid-queue:lock") as lock:
+            lock.acquire(timeout=current_app.config["LOM_PIDS_QUEUE_LOCK_TIMEOUT"])
+            processed, failed = drain_pid_queue(register_or_update_queued_pid)
+    except LockAcquireFailed:
+        return "PID-queue is already being processed"
+    return f"{processed} PIDs processed, {failed} failed"
+
+
+@shared_task
+def lom_reindex_stats_shard(parent_ids: list[str]) -> int:
+    """Reindex all versions of the records belonging to `parent_ids`.
+
+    Documents are dumped and bulk-written by the shard itself, rather than being
+    queued for the indexer. Raises if any document fails, so that the stats-reindex
+    bookmark isn't advanced.
+    """
+    service = current_records_lom.records_service
+    indexer = service.indexer
+    search = (
+        dsl.Search(
+            using=current_search_client,
+            index=prefix_index(service.record_cls.index.search_alias),
+        )
+        .filter("terms", parent__id=parent_ids)
+        .source(["id"])
+    )
+    # same actions as the indexer's bulk-queue consumer creates
+    actions = (
+        # pylint: disable-next=protected-access
+        indexer._index_action({"id": hit.meta.id})  # noqa: SLF001
+        for hit in search.scan()
+    )
+    indexed, _ = search_engine.helpers.bulk(
+        current_search_client,
+        actions,
+        request_timeout=current_app.config["INDEXER_BULK_REQUEST_TIMEOUT"],
+    )
+    return indexed
+
+
+@shared_task(ignore_result=True)
+def lom_set_stats_reindex_bookmark(shard_results: list[int], bookmark: str) -> str:
+    """Advance the stats-reindex bookmark, called once all shards succeeded."""
+    BookmarkAPI(current_search_client, "lom_stats_reindex", "day").set_bookmark(
+        bookmark,
+    )
+    return f"{sum(shard_results)} documents reindexed"
+
+
+def get_changed_parents(stats_indices: list, since: str) -> list[str]:
+    """Get the parents with statistics updated in `stats_indices` since `since`."""
+    indices = ",".join(f"{prefix_index(x)}*" for x in stats_indices)
+    query = (
+        dsl.Search(using=current_search_client, index=indices)
+        .filter({"range": {"updated_timestamp": {"gte": since}}})
+        .source(["parent_recid"])
+    )
+    return sorted({result.parent_recid for result in query.scan()})
+
+
 @shared_task(ignore_result=True)
 def lom_reindex_stats(stats_indices: list) -> str:
-    """Reindex the documents where the stats have changed."""
+    """Reindex the documents where the stats have changed.
+
+    Changed parents are split into shards of `LOM_STATS_REINDEX_SHARD_SIZE`, which
+    are reindexed in parallel. The bookmark is only advanced when all shards
+    succeeded, so a failed run is retried from the same bookmark.
+    """
     bm = BookmarkAPI(current_search_client, "lom_stats_reindex", "day")
     last_run = bm.get_bookmark()
     if not last_run:
@@ -40,28 +128,45 @@ def lom_reindex_stats(stats_indices: list) -> str:
         last_run = (datetime.now(timezone.utc) - timedelta(days=7)).isoformat()
 
     reindex_start_time = datetime.now(timezone.utc).isoformat()
-    indices = ",".join(f"{prefix_index(x)}*" for x in stats_indices)
+    all_parents = get_changed_parents(stats_indices, last_run)
+
+    if not all_parents:
+        bm.set_bookmark(reindex_start_time)
+        return "0 documents reindexed"
+
+    step = current_app.config["LOM_STATS_REINDEX_SHARD_SIZE"]
+    shards = [
+        lom_reindex_stats_shard.s(all_parents[i : i + step])
+        for i in range(0, len(all_parents), step)
+    ]
+    chord(shards)(lom_set_stats_reindex_bookmark.s(reindex_start_time))
+    return f"{len(all_parents)} parents dispatched in {len(shards)} shards"
+
+
+@shared_task(ignore_result=True)
+def lom_reindex_popular() -> str:
+    """Reindex the documents with a popularity, so that their popularity decays.
+
+    `lom_reindex_stats` only reindexes parents with new events, records without
+    would otherwise keep their popularity. Once a record's popularity has decayed to
+    0 its top-level `popularity`-field is removed, so it isn't reindexed anymore.
+    """
+    record_cls = current_records_lom.records_service.record_cls
+    query = (
+        dsl.Search(
+            using=current_search_client,
+            index=prefix_index(record_cls.index.search_alias),
+        )
+        .filter("exists", field="popularity")
+        .source(["parent.id"])
+    )
+    all_parents = sorted({result.parent.id for result in query.scan()})
 
-    all_parents = set()
-    query = dsl.Search(
-        using=current_search_client,
-        index=indices,
-    ).filter({"range": {"updated_timestamp": {"gte": last_run}}})
-
-    for result in query.scan():
-        parent_id = result.parent_recid
-        all_parents.add(parent_id)
-
-    if all_parents:
-        all_parents_list = list(all_parents)
-        step = 10000
-        end = len(list(all_parents))
-        for i in range(0, end, step):
-            records_q = dsl.Q("terms", parent__id=all_parents_list[i : i + step])
-            current_records_lom.records_service.reindex(
-                params={"allversions": True},
-                identity=system_identity,
-                search_query=records_q,
-            )
-    bm.set_bookmark(reindex_start_time)
-    return f"{len(all_parents)} documents reindexed"
+    step = current_app.config["LOM_STATS_REINDEX_SHARD_SIZE"]
+    shards = [
+        lom_reindex_stats_shard.s(all_parents[i : i + step])
+        for i in range(0, len(all_parents), step)
+    ]
+    if shards:
+        group(shards).apply_async()
+    return f"{len(all_parents)} parents dispatched in {len(shards)} shards"
@@ -3,7 +3,7 @@
 # Copyright (C) 2019-2021 CERN.
 # Copyright (C) 2019-2021 Northwestern University.
 # Copyright (C)      2021 TU Wien.
-# Copyright (C) 2021-2024 Graz University of Technology.
+# Copyright (C) 2021-2026 Graz University of Technology.
 #
 # invenio-records-lom is free software; you can redistribute it and/or modify it
 # under the terms of the MIT License; see LICENSE file for more details.
@@ -19,14 +19,34 @@
 
 """Decorates for record-view-functions."""
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from functools import wraps
-
-from flask import g, redirect, request, url_for
+from time import perf_counter
+
+from flask import (
+    Response,
+    after_this_request,
+    current_app,
+    g,
+    redirect,
+    request,
+    url_for,
+)
 from invenio_records_resources.services.errors import PermissionDeniedError
 from sqlalchemy.orm.exc import NoResultFound
 
 from ...proxies import current_records_lom
+from ...services.permissions import evaluate_permissions
+
+LANDING_PAGE_ACTIONS = (
+    "edit",
+    "new_version",
+    "manage",
+    "update_draft",
+    "read_files",
+    "review",
+)
 
 
 def pass_include_deleted[T](func: Callable[..., T]) -> Callable:
@@ -143,6 +163,97 @@ def pass_record_files[T](func: Callable[..., T]) -> Callable:
     return decoed
 
 
+@contextmanager
+def timed(timings: dict[str, float], stage: str) -> Iterator[None]:
+    """Add the duration (in ms) of the `with`-block to `timings[stage]`."""
+    start = perf_counter()
+    try:
+        yield
+    finally:
+        timings[stage] = timings.get(stage, 0) + (perf_counter() - start) * 1000
+
+
+def _report_timings(timings: dict[str, float]) -> Callable[[Response], Response]:
+    """Create an `after_this_request`-hook that reports `timings`."""
+
+    def hook(response: Response) -> Response:
+        current_app.logger.debug("landing page timings (ms): %s", timings)
+        if current_app.config.get("LOM_LANDING_PAGE_SERVER_TIMING", False):
+            response.headers["Server-Timing"] = ", ".join(
+                f"{stage};dur={duration:.1f}" for stage, duration in timings.items()
+            )
+        return response
+
+    return hook
+
+
+def pass_landing_page[T](func: Callable[..., T]) -> Callable:
+    """Retrieve `record`, `files`, `permissions` for the landing page in one pass.
+
+    Replaces `pass_record_or_draft` and `pass_record_files` for the landing page:
+    - files are listed from the already read record, instead of reading it again
+    - all permissions of `LANDING_PAGE_ACTIONS`, as well as the permission to list
+      files, are evaluated together, each permission-generator only once
+    Per-stage timings are passed as `timings`, the decorated function may add to
+    them, they are reported after the request.
+    """
+
+    @wraps(func)
+    def decoed(**kwargs: dict) -> T:
+        timings = {}
+        after_this_request(_report_timings(timings))
+
+        is_preview = kwargs.get("is_preview", False)
+        service = current_records_lom.records_service
+        service_kwargs = {"identity": g.identity, "id_": kwargs.get("pid_value")}
+
+        with timed(timings, "record"):
+            if is_preview:
+                try:
+                    record_item = service.read_draft(**service_kwargs)
+                except NoResultFound:
+                    record_item = service.read(**service_kwargs)
+            else:
+                record_item = service.read(**service_kwargs)
+
+        # pylint: disable-next=protected-access
+        record = record_item._record  # noqa: SLF001
+        files_service = service.draft_files if record.is_draft else service.files
+        files_action = f"{files_service.config.permission_action_prefix}read_files"
+
+        with timed(timings, "permissions"):
+            allowed = evaluate_permissions(
+                service.config.permission_policy_cls,
+                g.identity,
+                [*LANDING_PAGE_ACTIONS, files_action],
+                record=record,
+            )
+
+        files = None
+        if allowed[files_action]:
+            with timed(timings, "files"):
+                # same as `files_service.list_files`, minus re-reading the record
+                # pylint: disable-next=protected-access
+                files = files_service._list_files_result(  # noqa: SLF001
+                    g.identity,
+                    kwargs.get("pid_value"),
+                    record,
+                )
+
+        permissions = {
+            f"can_{action}": allowed[action] for action in LANDING_PAGE_ACTIONS
+        }
+        return func(
+            **kwargs,
+            record=record_item,
+            files=files,
+            permissions=permissions,
+            timings=timings,
+        )
+
+    return decoed
+
+
 def pass_file_metadata[T](func: Callable[..., T]) -> Callable:
     """Retrieve `file_metadata` from database and pass that into decorated function."""
 
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-records-lom is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Cached rendering of static landing page fragments and of exports."""
+
+from collections.abc import Callable
+from hashlib import sha256
+from json import dumps
+
+from flask import current_app
+from invenio_cache import current_cache
+from invenio_i18n.ext import current_i18n
+from invenio_records_resources.services.records.results import RecordItem
+from jinja2 import pass_context
+from jinja2.runtime import Context
+from markupsafe import Markup
+
+
+def landing_page_cache_key(record: RecordItem) -> str | None:
+    """Get the cache-key prefix for `record`'s landing page.
+
+    Returns `None` when the landing page mustn't be cached, e.g. for drafts.
+    Statistics aren't part of what is cached, so they don't need to invalidate it.
+    """
+    if not current_app.config.get("LOM_LANDING_PAGE_CACHE", False):
+        return None
+
+    # pylint: disable-next=protected-access
+    api_record = record._record  # noqa: SLF001
+    if api_record.is_draft:
+        return None
+
+    locale = str(current_i18n.locale)
+    return f"lom-landing:{record.id}:{api_record.revision_id}:{locale}"
+
+
+def fingerprint(**kwargs: dict) -> str:
+    """Fingerprint request-specific inputs of a fragment, e.g. permissions."""
+    return sha256(dumps(kwargs, sort_keys=True).encode()).hexdigest()[:16]
+
+
+def cached_record_ui(
+    cache_key: str | None,
+    request_fingerprint: str,
+    serialize: Callable[[], dict],
+) -> dict:
+    """Get the record's UI-serialization from cache, or `serialize()` it.
+
+    The serialization contains identity-dependent parts (e.g. links), hence is
+    cached per `request_fingerprint`, which must cover the identity's permissions.
+    """
+    if not cache_key:
+        return serialize()
+
+    key = f"{cache_key}:{request_fingerprint}:record-ui"
+    record_ui = current_cache.get(key)
+    if record_ui is None:
+        record_ui = serialize()
+        timeout = current_app.config["LOM_LANDING_PAGE_CACHE_TIMEOUT"]
+        current_cache.set(key, record_ui, timeout=timeout)
+    return record_ui
+
+
+def cached_export(cache_key: str | None, serialize: Callable[[], str]) -> str:
+    """Get a rendered export from cache, or `serialize()` it."""
+    timeout = current_app.config.get("LOM_RECORD_EXPORT_CACHE_TIMEOUT")
+    if not cache_key or not timeout:
+        return serialize()
+
+    exported = current_cache.get(cache_key)
+    if exported is None:
+        exported = serialize()
+        current_cache.set(cache_key, exported, timeout=timeout)
+    return exported
+
+
+def make_fragment_renderer(
+    cache_key: str | None,
+    request_fingerprint: str,
+) -> Callable[..., Markup]:
+    """Create a template-function rendering (and caching) landing page fragments.
+
+    Fragments are rendered with the including template's context,
+    `request_fingerprint` must cover everything request-specific that fragments depend on.
+    When `cache_key` is `None`, fragments are rendered without caching.
+    """
+
+    @pass_context
+    def render_fragment(context: Context, name: str, template_name: str) -> Markup:
+        """Render `template_name`, or take it from cache."""
+        key = f"{cache_key}:{request_fingerprint}:{name}" if cache_key else None
+        if key:
+            html = current_cache.get(key)
+            if html is not None:
+                return Markup(html)  # noqa: S704
+
+        template = context.environment.get_template(template_name)
+        html = template.render(context.get_all())
+
+        if key:
+            timeout = current_app.config["LOM_LANDING_PAGE_CACHE_TIMEOUT"]
+            current_cache.set(key, html, timeout=timeout)
+        return Markup(html)  # noqa: S704
+
+    return render_fragment
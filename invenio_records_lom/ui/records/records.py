@@ -3,7 +3,7 @@
 # Copyright (C) 2019-2021 CERN.
 # Copyright (C) 2019-2021 Northwestern University.
 # Copyright (C)      2021 TU Wien.
-# Copyright (C) 2021-2025 Graz University of Technology.
+# Copyright (C) 2021-2026 Graz University of Technology.
 #
 # invenio-records-lom is free software; you can redistribute it and/or modify it
 # under the terms of the MIT License; see LICENSE file for more details.
@@ -25,20 +25,33 @@ from invenio_previewer.extensions import default
 from invenio_previewer.proxies import current_previewer
 from invenio_records_resources.services.files.results import FileItem, FileList
 from invenio_records_resources.services.records.results import RecordItem
-from invenio_stats.proxies import current_stats
 from marshmallow import ValidationError
 
 from ...proxies import current_records_lom
+from ...records.statistics import emit_stats_event
+from ...resources.conditional import (
+    conditional_headers,
+    is_not_modified,
+    record_validators,
+)
 from ...resources.serializers import LOMToUIJSONSerializer
 from .decorators import (
     pass_file_item,
     pass_file_metadata,
     pass_include_deleted,
     pass_is_preview,
-    pass_record_files,
+    pass_landing_page,
     pass_record_from_pid,
     pass_record_latest,
     pass_record_or_draft,
+    timed,
+)
+from .fragments import (
+    cached_export,
+    cached_record_ui,
+    fingerprint,
+    landing_page_cache_key,
+    make_fragment_renderer,
 )
 
 
@@ -91,20 +104,32 @@ class PreviewFile:
 #
 @pass_is_preview
 @pass_include_deleted
-@pass_record_or_draft
-@pass_record_files
+@pass_landing_page
 def record_detail(
     pid_value: str | None = None,
     is_preview: bool | None = None,  # noqa: FBT001
     record: RecordItem = None,
     files: FileList | None = None,
     *,
+    permissions: dict[str, bool] | None = None,
+    timings: dict[str, float] | None = None,
     include_deleted: bool = False,
     **__,  # noqa: ANN003
 ) -> str:
     """Record detail page (aka landing page)."""
-    files_dict = {} if files is None else files.to_dict()
-    record_ui = LOMToUIJSONSerializer().dump_obj(record.to_dict())
+    cache_key = landing_page_cache_key(record)
+    request_fingerprint = fingerprint(
+        permissions=permissions,
+        include_deleted=include_deleted,
+        is_preview=is_preview,
+    )
+    with timed(timings, "serialize"):
+        files_dict = {} if files is None else files.to_dict()
+        record_ui = cached_record_ui(
+            cache_key,
+            request_fingerprint,
+            lambda: LOMToUIJSONSerializer().dump_obj(record.to_dict()),
+        )
 
     is_draft = record_ui["is_draft"]
     if is_preview and is_draft:
@@ -113,24 +138,27 @@ def record_detail(
         except ValidationError:
             abort(404)
 
-    # emit a record view stats event
-    emitter = current_stats.get_event_emitter("lom-record-view")
-    if record is not None and emitter is not None:
-        emitter(current_app, record=record._record, via_api=False)  # noqa: SLF001
+    # emit a record view stats event, it gets published after the response is sent
+    if record is not None:
+        emit_stats_event(
+            "lom-record-view",
+            record=record._record,  # noqa: SLF001
+            via_api=False,
+        )
 
-    return render_template(
-        "invenio_records_lom/record.html",
-        files=files_dict,
-        include_deleted=include_deleted,
-        is_draft=is_draft,
-        is_preview=is_preview,
-        permissions=record.has_permissions_to(
-            ["edit", "new_version", "manage", "update_draft", "read_files", "review"],
-        ),
-        pid=pid_value,
-        record=record,
-        record_ui=record_ui,
-    )
+    with timed(timings, "render"):
+        return render_template(
+            "invenio_records_lom/record.html",
+            files=files_dict,
+            include_deleted=include_deleted,
+            is_draft=is_draft,
+            is_preview=is_preview,
+            permissions=permissions,
+            pid=pid_value,
+            record=record,
+            record_ui=record_ui,
+            render_fragment=make_fragment_renderer(cache_key, request_fingerprint),
+        )
 
 
 @pass_is_preview
@@ -148,16 +176,29 @@ def record_export(
     if exporter is None:
         abort(404)
 
-    serializer = obj_or_import_string(exporter["serializer"])(
-        options={
-            "indent": 2,
-            "sort_keys": True,
-        },
-    )
-    exported_record = serializer.serialize_object(record.to_dict())
+    # pylint: disable-next=protected-access
+    api_record = record._record  # noqa: SLF001
+    # query-args select e.g. the citation style, hence are part of the variant
+    variant = f"{export_format}?{sorted(request.args.items())}"
+    etag, last_modified = record_validators(api_record, variant)
+    conditional = conditional_headers(api_record, etag, last_modified, "export")
+    if is_not_modified(etag, last_modified):
+        return ("", 304, conditional)
+
+    def serialize() -> str:
+        """Run the exporter's serializer, which is skipped on cache-hits."""
+        serializer = obj_or_import_string(exporter["serializer"])(
+            **exporter.get("params", {}),
+        )
+        return serializer.serialize_object(record.to_dict())
+
+    # the ETag covers record, revision and variant
+    cache_key = None if api_record.is_draft else f"lom-export:{record.id}:{etag}"
+    exported_record = cached_export(cache_key, serialize)
     content_type = exporter.get("content-type", export_format)
     filename = exporter.get("filename", export_format).format(id=pid_value)
     headers = {
+        **conditional,
         "Content-Type": content_type,
         "Content-Disposition": f"attachment; filename={filename}",
     }
@@ -207,14 +248,13 @@ def record_file_download(  # noqa: ANN201
     **__,  # noqa: ANN003
 ):
     """Download a file from a record."""
-    # emit a file download stats event
-    emitter = current_stats.get_event_emitter("lom-file-download")
-    if file_item is not None and emitter is not None:
+    # emit a file download stats event, it gets published after the response is sent
+    if file_item is not None:
         # pylint: disable-next=protected-access
         obj = file_item._file.object_version  # noqa: SLF001
         # pylint: disable-next=protected-access
-        emitter(
-            current_app,
+        emit_stats_event(
+            "lom-file-download",
             record=file_item._record,  # noqa: SLF001
             obj=obj,
             via_api=False,
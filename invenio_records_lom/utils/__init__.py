@@ -1,14 +1,16 @@
 # -*- coding: utf-8 -*-
 #
-# Copyright (C) 2022-2025 Graz University of Technology.
+# Copyright (C) 2022-2026 Graz University of Technology.
 #
 # invenio-records-lom is free software; you can redistribute it and/or modify it
 # under the terms of the MIT License; see LICENSE file for more details.
 
 """Utilities for creation of LOM-compliant metadata."""
 
+from .licenses import LICENSE_LABELS, get_license_id
+from .limiter import TokenBucketLimiter
 from .metadata import LOMCourseMetadata, LOMMetadata, LOMRecordData
-from .stats import build_record_unique_id
+from .stats import build_record_unique_id, filter_by_recids
 from .util import (
     DotAccessWrapper,
     LOMDuplicateRecordError,
@@ -18,19 +20,24 @@ from .util import (
     get_oefosdict,
     update_record,
 )
-from .vcard import make_lom_vcard
+from .vcard import get_vcard_fn, make_lom_vcard
 
 __all__ = (
+    "LICENSE_LABELS",
     "DotAccessWrapper",
     "LOMCourseMetadata",
     "LOMDuplicateRecordError",
     "LOMMetadata",
     "LOMRecordData",
+    "TokenBucketLimiter",
     "build_record_unique_id",
     "check_about_duplicate",
     "create_record",
+    "filter_by_recids",
     "get_learningresourcetypedict",
+    "get_license_id",
     "get_oefosdict",
+    "get_vcard_fn",
     "make_lom_vcard",
     "update_record",
 )
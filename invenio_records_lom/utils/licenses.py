@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-records-lom is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Registry of known licenses, keyed by their standardized URLs."""
+
+from dataclasses import dataclass
+
+from invenio_i18n import lazy_gettext as _
+
+from .util import standardize_url
+
+
+@dataclass(frozen=True)
+class License:
+    """Holds a license's canonical id and label."""
+
+    id: str
+    label: str
+
+
+LICENSES: dict[str, License] = {
+    "https://creativecommons.org/publicdomain/zero/1.0/": License(
+        "cc0-1.0",
+        _("CC0 1.0"),
+    ),
+    "https://creativecommons.org/licenses/by/4.0/": License(
+        "cc-by-4.0",
+        _("CC BY 4.0"),
+    ),
+    "https://creativecommons.org/licenses/by-sa/4.0/": License(
+        "cc-by-sa-4.0",
+        _("CC BY-SA 4.0"),
+    ),
+    "https://creativecommons.org/licenses/by-nd/4.0/": License(
+        "cc-by-nd-4.0",
+        _("CC BY-ND 4.0"),
+    ),
+    "https://creativecommons.org/licenses/by-nc/4.0/": License(
+        "cc-by-nc-4.0",
+        _("CC BY-NC 4.0"),
+    ),
+    "https://creativecommons.org/licenses/by-nc-sa/4.0/": License(
+        "cc-by-nc-sa-4.0",
+        _("CC BY-NC-SA 4.0"),
+    ),
+    "https://creativecommons.org/licenses/by-nc-nd/4.0/": License(
+        "cc-by-nc-nd-4.0",
+        _("CC BY-NC-ND 4.0"),
+    ),
+    "https://mit-license.org/": License("mit", _("MIT License")),
+}
+
+LICENSE_LABELS: dict[str, str] = {
+    license_.id: license_.label for license_ in LICENSES.values()
+}
+"""Labels of known licenses, keyed by their ids."""
+
+
+def get_license_id(url: str) -> str:
+    """Get id of the license at `url`, its standardized URL for unknown licenses."""
+    url = standardize_url(url)
+    license_ = LICENSES.get(url)
+    return license_.id if license_ else url
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-records-lom is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Rate limiting by per-key token buckets."""
+
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+
+
+class TokenBucketLimiter:
+    """Per-key token buckets, keeping only the `max_keys` most recently used keys.
+
+    Each key may spend up to `capacity` tokens at once, tokens are refilled with
+    `refill_rate` tokens per second.
+    """
+
+    def __init__(self, capacity: float, refill_rate: float, max_keys: int) -> None:
+        """Construct."""
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.max_keys = max_keys
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+        self._lock = Lock()
+
+    def _refilled(self, key: str, now: float) -> float:
+        """Get the tokens in `key`'s bucket at `now`, the lock must be held."""
+        tokens, last = self._buckets.get(key, (self.capacity, now))
+        return min(self.capacity, tokens + (now - last) * self.refill_rate)
+
+    def has_token(self, key: str, now: float | None = None) -> bool:
+        """Return whether `key`'s bucket has a token, without taking it."""
+        now = monotonic() if now is None else now
+        with self._lock:
+            return self._refilled(key, now) >= 1
+
+    def allow(self, key: str, now: float | None = None) -> bool:
+        """Take a token from `key`'s bucket, return whether there was one."""
+        now = monotonic() if now is None else now
+        with self._lock:
+            tokens = self._refilled(key, now)
+            allowed = tokens >= 1
+            if allowed:
+                tokens -= 1
+
+            self._buckets.pop(key, None)
+            self._buckets[key] = (tokens, now)
+            if len(self._buckets) > self.max_keys:
+                # evicted keys start over with a full bucket, which errs on the
+                # side of keeping events
+                self._buckets.popitem(last=False)
+
+        return allowed
@@ -1,14 +1,21 @@
 # -*- coding: utf-8 -*-
 #
-# Copyright (C) 2024 Graz University of Technology.
+# Copyright (C) 2024-2026 Graz University of Technology.
 #
 # invenio-records-lom is free software; you can redistribute it and/or modify it
 # under the terms of the MIT License; see LICENSE file for more details.
 
 """statistic utils module."""
 
+from invenio_search.engine import dsl
+
 
 def build_record_unique_id(doc: dict) -> dict:
     """Build record unique identifier."""
     doc["unique_id"] = f"{doc['recid']}_{doc['parent_recid']}"
     return doc
+
+
+def filter_by_recids(query: dsl.Search, recids: list[str], **__: dict) -> dsl.Search:
+    """Query-modifier restricting a statistics query to the given `recids`."""
+    return query.filter("terms", recid=recids)
@@ -253,12 +253,9 @@ def check_about_duplicate(identifier: str, catalog: str) -> None:
     search.query = dsl.Q(
         "bool",
         must=[
+            dsl.Q("term", **{"metadata.general.identifier.catalog": catalog}),
             dsl.Q(
-                "match",
-                **{"metadata.general.identifier.catalog.keyword": catalog},
-            ),
-            dsl.Q(
-                "match_phrase",
+                "term",
                 **{"metadata.general.identifier.entry.langstring.#text": identifier},
             ),
         ],
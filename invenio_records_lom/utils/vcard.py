@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 #
-# Copyright (C) 2023-2024 Graz University of Technology.
+# Copyright (C) 2023-2026 Graz University of Technology.
 #
 # invenio-records-lom is free software; you can redistribute it and/or modify it
 # under the terms of the MIT License; see LICENSE file for more details.
@@ -32,6 +32,7 @@ then use its :py:meth:`~VCardMaker.make_vcard` method:
    # which vcard-properties can be passed depends on `my_config`
 """
 
+import re
 from collections.abc import Iterable
 from dataclasses import dataclass
 
@@ -257,3 +258,20 @@ def make_lom_vcard(**vcard_properties: str | Iterable[str]) -> str | bytes:
     )
 
     return lom_vcard_maker.make_vcard(**vcard_properties)
+
+
+def get_vcard_fn(entity: str) -> str:
+    r"""Get the formatted name of vcard-string `entity`.
+
+    LOM-entities not being vcards are usually names already, they are returned as is.
+    Folded lines are unfolded and ``\``-escapes are resolved.
+    """
+    if not entity.lstrip().upper().startswith("BEGIN:VCARD"):
+        return entity
+
+    unfolded = re.sub(r"\r?\n[ \t]", "", entity)
+    for line in unfolded.splitlines():
+        name, _, value = line.partition(":")
+        if name.split(";", maxsplit=1)[0].upper() == "FN":
+            return re.sub(r"\\(.)", lambda m: "\n" if m[1] in "nN" else m[1], value)
+    return ""
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-records-lom is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Bulk export tests."""
+
+import gzip
+import json
+
+from flask import Flask
+
+from invenio_records_lom.resources.bulk_export import iter_gzip, iter_serialized
+
+
+def test_iter_serialized_keeps_order(base_app: Flask) -> None:
+    """Test chunks serialized in the pool come out in input-order."""
+    sources = [{"id": str(i)} for i in range(50)]
+
+    with base_app.app_context():
+        chunks = iter_serialized(
+            sources,
+            lambda source: json.dumps(source) + "\n",
+            workers=3,
+            chunk_size=4,
+        )
+        lines = "".join(chunks).splitlines()
+
+    assert [json.loads(line) for line in lines] == sources
+
+
+def test_iter_gzip_roundtrip() -> None:
+    """Test incrementally compressed chunks decompress to their concatenation."""
+    chunks = ["<records>\n", *(f"<lom>{i}</lom>\n" for i in range(1000)), "</records>"]
+
+    compressed = b"".join(iter_gzip(chunks))
+
+    assert gzip.decompress(compressed).decode() == "".join(chunks)
@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-records-lom is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Conditional GET tests."""
+
+from datetime import datetime
+from types import SimpleNamespace
+
+from invenio_records_lom.resources.conditional import record_validators
+
+
+def test_record_validators_cover_stats() -> None:
+    """Test ETags change with statistics, which have no Last-Modified."""
+    updated = datetime(2026, 10, 19, 12, 0, 0, 123)  # noqa: DTZ001
+    draft = SimpleNamespace(is_draft=True, revision_id=3, updated=updated)
+    etag, last_modified = record_validators(draft, "application/json")
+    assert etag.startswith("3-")
+    assert last_modified.microsecond == 0
+
+    record = SimpleNamespace(is_draft=False, revision_id=3, updated=updated)
+    record.stats = {"this_version": {"views": 1}}
+    etag, last_modified = record_validators(record, "application/json")
+    assert last_modified is None
+
+    record.stats = {"this_version": {"views": 2}}
+    assert record_validators(record, "application/json")[0] != etag
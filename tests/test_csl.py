@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-records-lom is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""CSL serializer tests."""
+
+from flask import Flask
+from flask_principal import Identity
+from pytest_mock import MockerFixture
+
+from invenio_records_lom.resources.serializers.csl.serializer import (
+    LOMToCitationStringSerializer,
+    citation_cache_key,
+    get_citation_style,
+    render_citation,
+)
+from invenio_records_lom.services import LOMRecordService
+
+SERIALIZER_MODULE = "invenio_records_lom.resources.serializers.csl.serializer"
+
+
+def make_record(id_: str, title: str, revision_id: int = 1, **extra: bool) -> dict:
+    """Create a minimal record-dict, as passed to the serializer."""
+    return {
+        "id": id_,
+        "revision_id": revision_id,
+        "metadata": {"general": {"title": {"langstring": {"#text": title}}}},
+        **extra,
+    }
+
+
+def test_citation_cache_key() -> None:
+    """Test citations are keyed by revision, style and locale, drafts aren't."""
+    record = make_record("abcde-12345", "Title")
+    key = citation_cache_key(record, "apa", "en-US")
+
+    assert key == "lom-citation:abcde-12345:1:apa:en-US"
+    assert key not in {
+        citation_cache_key(make_record("abcde-12345", "Title", 2), "apa", "en-US"),
+        citation_cache_key(record, "harvard1", "en-US"),
+        citation_cache_key(record, "apa", "de-AT"),
+    }
+    assert citation_cache_key({**record, "is_draft": True}, "apa", "en-US") is None
+    assert citation_cache_key({**record, "revision_id": None}, "apa", "en-US") is None
+
+
+def test_get_citation_style_is_parsed_once() -> None:
+    """Test styles are parsed once per process, per style and locale."""
+    style, lock = get_citation_style("apa", "en-US")
+    assert get_citation_style("apa", "en-US") == (style, lock)
+    assert get_citation_style("apa", "de-AT")[0] is not style
+
+
+def test_serialize_citations_cached(base_app: Flask, mocker: MockerFixture) -> None:
+    """Test citations are rendered once per revision, drafts every time."""
+    cache = {}
+    current_cache = mocker.patch(f"{SERIALIZER_MODULE}.current_cache")
+    current_cache.get_many.side_effect = lambda *keys: [cache.get(k) for k in keys]
+    current_cache.set_many.side_effect = lambda mapping, **__: cache.update(mapping)
+    render = mocker.patch(f"{SERIALIZER_MODULE}.render_citation", wraps=render_citation)
+
+    serializer = LOMToCitationStringSerializer(url_args_retriever=("apa", "en-US"))
+    published = make_record("abcde-12345", "Published")
+    draft = make_record("fghij-67890", "Draft", is_draft=True)
+    with base_app.app_context():
+        first = serializer.serialize_citations([published, draft])
+        assert render.call_count == 2
+        assert list(cache) == ["lom-citation:abcde-12345:1:apa:en-US"]
+
+        # the published record's citation is served from cache
+        assert serializer.serialize_citations([published, draft]) == first
+        assert render.call_count == 3
+
+        # a new revision is rendered anew
+        serializer.serialize_object(make_record("abcde-12345", "Published", 2))
+        assert render.call_count == 4
+
+    assert "Published" in first[0]
+    assert "Draft" in first[1]
+
+
+def test_search_bibliography(
+    base_app: Flask,
+    service: LOMRecordService,
+    search_clear: None,
+    identity: Identity,
+    full_lom_metadata: dict,
+) -> None:
+    """Test searches serialize to a bibliography, with one line per hit."""
+    for _ in range(2):
+        draft = service.create(identity=identity, data=full_lom_metadata)
+        service.publish(identity=identity, id_=draft.id)
+    service.record_cls.index.refresh()
+
+    client = base_app.test_client()
+    response = client.get("/api/oer", headers={"Accept": "text/x-bibliography"})
+
+    assert response.status_code == 200
+    assert response.mimetype == "text/x-bibliography"
+    lines = response.get_data(as_text=True).splitlines()
+    assert len(lines) == 2
+    assert all(lines)
+
+
+def test_bibliography_keeps_dois_apart(base_app: Flask) -> None:
+    """Test each entry's DOI is that of its own hit, also for prefixed DOIs."""
+    serializer = LOMToCitationStringSerializer(url_args_retriever=("apa", "en-US"))
+    hits = [
+        {
+            **make_record(f"abcde-1234{i}", f"Title {i}", is_draft=True),
+            "pids": {"doi": {"identifier": doi}},
+        }
+        for i, doi in enumerate(["10.1234/ab", "10.1234/abc"])
+    ]
+
+    with base_app.app_context():
+        bibliography = serializer.serialize_object_list({"hits": {"hits": hits}})
+
+    lines = bibliography.splitlines()
+    assert len(lines) == 2
+    assert "10.1234/ab" in lines[0]
+    assert "10.1234/abc" not in lines[0]
+    assert "10.1234/abc" in lines[1]
@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-records-lom is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Search dumper tests."""
+
+from flask_principal import Identity
+from invenio_db.shared import SQLAlchemy
+
+from invenio_records_lom.records.dumpers import (
+    LOMFacetsDumperExt,
+    LOMLangstringsDumperExt,
+    LOMLicenseDumperExt,
+    LOMSuggestDumperExt,
+)
+from invenio_records_lom.services import LOMRecordService
+from invenio_records_lom.services.license_migration import normalize_rights_url
+from invenio_records_lom.utils import make_lom_vcard
+
+
+def langstring(text: str, lang: str | None = None) -> dict:
+    """Create a langstring."""
+    inner = {"#text": text} if lang is None else {"#text": text, "lang": lang}
+    return {"langstring": inner}
+
+
+def test_langstrings_dumper_routes_by_language() -> None:
+    """Test langstrings are dumped into subfields of their language."""
+    data = {
+        "metadata": {
+            "general": {
+                "title": langstring("Kraftfahrzeugversicherung", "de-AT"),
+                "description": [langstring("An introduction", "eng")],
+                "keyword": [langstring("cars", "EN"), langstring("voitures", "fr")],
+            },
+            "educational": {"description": langstring("Ohne Vorwissen", "ger")},
+            "classification": [{"keyword": langstring("insurance")}],
+        },
+    }
+    ext = LOMLangstringsDumperExt("langstrings")
+
+    ext.dump(None, data)
+    assert data["langstrings"] == {
+        "title": {"de": ["Kraftfahrzeugversicherung"]},
+        "description": {"en": ["An introduction"], "de": ["Ohne Vorwissen"]},
+        "keyword": {"en": ["cars"], "other": ["voitures", "insurance"]},
+    }
+
+    ext.load(data, None)
+    assert "langstrings" not in data
+
+
+def test_facets_dumper_flattens_values() -> None:
+    """Test facet-values are normalized, OEFOS-codes dumped with their ancestors."""
+    oefos_url = "https://w3id.org/oerbase/vocabs/oefos2012"
+    data = {
+        "metadata": {
+            "general": {"language": ["eng-US", "EN", "deu", "none"]},
+            "technical": {"format": ["Video/MP4", "non-digital"]},
+            "educational": {
+                "learningresourcetype": [{"id": "https://w3id.org/kim/hcrt/video"}],
+            },
+            "classification": [
+                {
+                    "taxonpath": [
+                        {
+                            "source": langstring(oefos_url, "x-none"),
+                            "taxon": [
+                                {"id": f"{oefos_url}/2"},
+                                {"id": f"{oefos_url}/207413"},
+                            ],
+                        },
+                        {
+                            "source": langstring("other-taxonomy", "x-none"),
+                            "taxon": [{"id": "42"}],
+                        },
+                    ],
+                },
+            ],
+        },
+    }
+    ext = LOMFacetsDumperExt("facets")
+
+    ext.dump(None, data)
+    assert data["facets"] == {
+        "oefos": ["2", "207", "2074", "207413"],
+        "language": ["de", "en"],
+        "format": ["non-digital", "video/mp4"],
+        "learningresourcetype": ["https://w3id.org/kim/hcrt/video"],
+    }
+
+    ext.load(data, None)
+    assert "facets" not in data
+
+
+def test_license_dumper_identifies_licenses() -> None:
+    """Test spellings of a license's URL are dumped as one id."""
+    ext = LOMLicenseDumperExt("license_id")
+    for url in [
+        "http://creativecommons.org/licenses/by/4.0",
+        "https://creativecommons.org/licenses/by/4.0/",
+    ]:
+        data = {"metadata": {"rights": {"url": url}}}
+        ext.dump(None, data)
+        assert data["metadata"]["rights"]["license_id"] == "cc-by-4.0"
+        ext.load(data, None)
+        assert data == {"metadata": {"rights": {"url": url}}}
+
+    data = {"metadata": {"rights": {"url": "http://example.org/license"}}}
+    ext.dump(None, data)
+    assert data["metadata"]["rights"]["license_id"] == "https://example.org/license/"
+
+
+def test_normalize_rights_url() -> None:
+    """Test stored license URLs are standardized, with their descriptions."""
+    url = "http://creativecommons.org/licenses/by/4.0"
+    metadata = {"rights": {"url": url, "description": langstring(url, "x-t-cc-url")}}
+
+    assert normalize_rights_url(metadata)
+    standardized = "https://creativecommons.org/licenses/by/4.0/"
+    assert metadata["rights"]["url"] == standardized
+    assert metadata["rights"]["description"]["langstring"]["#text"] == standardized
+    assert not normalize_rights_url(metadata)
+
+
+def test_suggest_dumper_collects_texts() -> None:
+    """Test titles, keywords and contributors' names are dumped for suggestions."""
+    data = {
+        "metadata": {
+            "general": {
+                "title": langstring("Kraftfahrzeugversicherung", "de"),
+                "keyword": [langstring("cars"), langstring("cars"), langstring("")],
+            },
+            "lifecycle": {
+                "contribute": [
+                    {"entity": ["Doe, Jane", make_lom_vcard(fn="Roe, Richard")]},
+                ],
+            },
+        },
+    }
+    ext = LOMSuggestDumperExt("suggest")
+
+    ext.dump(None, data)
+    assert data["suggest"] == {
+        "title": ["Kraftfahrzeugversicherung"],
+        "keyword": ["cars"],
+        "contributor": ["Doe, Jane", "Roe, Richard"],
+    }
+    ext.load(data, None)
+    assert "suggest" not in data
+
+
+def test_published_record_dumps_stats(
+    service: LOMRecordService,
+    db: SQLAlchemy,
+    identity: Identity,
+    full_lom_metadata: dict,
+) -> None:
+    """Test published records' dumps carry their statistics and popularity."""
+    draft = service.create(identity=identity, data=full_lom_metadata)
+    record = service.publish(identity=identity, id_=draft.id)
+
+    # pylint: disable-next=protected-access
+    dump = record._record.dumps()
+
+    assert "this_version" in dump["stats"]
+    assert "all_versions" in dump["stats"]
+    # without events, there is no popularity to boost by
+    assert dump["stats"]["popularity"] == 0
+    assert "popularity" not in dump
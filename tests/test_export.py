@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-records-lom is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Export view tests."""
+
+from flask import Flask, g
+from flask_principal import Identity
+from invenio_db.shared import SQLAlchemy
+
+from invenio_records_lom.services import LOMRecordService
+from invenio_records_lom.ui.records.records import record_export
+
+
+def test_citation_export(
+    base_app: Flask,
+    service: LOMRecordService,
+    db: SQLAlchemy,
+    identity: Identity,
+    full_lom_metadata: dict,
+) -> None:
+    """Test the citation export takes style and locale from plain query-args."""
+    draft = service.create(identity=identity, data=full_lom_metadata)
+    record = service.publish(identity=identity, id_=draft.id)
+
+    url = f"/oer/{record.id}/export/citation?style=apa&locale=en-US"
+    with base_app.test_request_context(url):
+        g.identity = identity
+        citation, status, headers = record_export(
+            pid_value=record.id,
+            export_format="citation",
+        )
+
+    assert status == 200
+    assert citation
+    assert headers["Content-Type"] == "text/plain; charset=utf-8"
+    assert headers["Content-Disposition"] == f"attachment; filename={record.id}.txt"
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-records-lom is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Facet tests."""
+
+from invenio_records_lom.services.facets import (
+    get_expanded_oefos,
+    get_oefos_children_pattern,
+    oefos,
+)
+
+
+def test_oefos_children_pattern() -> None:
+    """Test children-patterns per OEFOS-level."""
+    assert get_oefos_children_pattern("") == "[0-9]{1}"
+    assert get_oefos_children_pattern("1") == "1[0-9]{2}"
+    assert get_oefos_children_pattern("101") == "101[0-9]{1}"
+    assert get_oefos_children_pattern("1010") == "1010[0-9]{2}"
+    assert get_oefos_children_pattern("101001") is None
+
+
+def test_oefos_facet_expansion() -> None:
+    """Test selected codes expand, and only the deepest selected codes filter."""
+    assert get_expanded_oefos(["1010"]) == ["1", "101", "1010"]
+    assert get_expanded_oefos(["101001"]) == ["1", "101", "1010"]
+
+    query = oefos.add_filter(["1", "101", "2"])
+    assert query.to_dict() == {"terms": {"facets.oefos": ["101", "2"]}}
+
+
+def test_oefos_facet_aggregation() -> None:
+    """Test aggregations depend only on the passed selection."""
+    aggs = oefos.get_aggregation(["1010"]).to_dict()["aggs"]
+    assert sorted(aggs) == ["children_1", "children_101", "children_1010", "top"]
+
+    aggs = oefos.get_aggregation().to_dict()["aggs"]
+    assert sorted(aggs) == ["top"]
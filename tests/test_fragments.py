@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-records-lom is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Landing page fragment tests."""
+
+from flask import Flask
+from jinja2 import DictLoader, Environment
+from pytest_mock import MockerFixture
+
+from invenio_records_lom.ui.records.fragments import (
+    cached_record_ui,
+    make_fragment_renderer,
+)
+
+
+def test_render_fragment_is_cached(mocker: MockerFixture) -> None:
+    """Test fragments render with the page's context and are served from cache."""
+    cache = {}
+    current_cache = mocker.patch(
+        "invenio_records_lom.ui.records.fragments.current_cache",
+    )
+    current_cache.get.side_effect = cache.get
+    current_cache.set.side_effect = lambda key, value, **__: cache.update({key: value})
+
+    env = Environment(
+        loader=DictLoader(
+            {
+                "page.html": "[{{ render_fragment('title', 'title.html') }}]",
+                "title.html": "<h1>{{ title }}</h1>",
+            },
+        ),
+        autoescape=True,
+    )
+    app = Flask("testapp")
+    app.config["LOM_LANDING_PAGE_CACHE_TIMEOUT"] = 60
+
+    with app.app_context():
+        render_fragment = make_fragment_renderer("lom-landing:abc:1:en", "fp")
+        page = env.get_template("page.html")
+        assert page.render(render_fragment=render_fragment, title="A") == "[<h1>A</h1>]"
+        assert cache == {"lom-landing:abc:1:en:fp:title": "<h1>A</h1>"}
+
+        # served from cache, even though the context changed
+        assert page.render(render_fragment=render_fragment, title="B") == "[<h1>A</h1>]"
+
+        uncached = make_fragment_renderer(None, "fp")
+        assert page.render(render_fragment=uncached, title="B") == "[<h1>B</h1>]"
+
+
+def test_cached_record_ui_per_fingerprint(mocker: MockerFixture) -> None:
+    """Test UI-serializations aren't shared between differently permitted users."""
+    cache = {}
+    current_cache = mocker.patch(
+        "invenio_records_lom.ui.records.fragments.current_cache",
+    )
+    current_cache.get.side_effect = cache.get
+    current_cache.set.side_effect = lambda key, value, **__: cache.update({key: value})
+
+    app = Flask("testapp")
+    app.config["LOM_LANDING_PAGE_CACHE_TIMEOUT"] = 60
+
+    with app.app_context():
+        key = "lom-landing:abc:1:en"
+        assert cached_record_ui(key, "owner", lambda: {"links": "edit"}) == {
+            "links": "edit",
+        }
+        assert cached_record_ui(key, "owner", dict) == {"links": "edit"}
+        assert cached_record_ui(key, "anonymous", dict) == {}
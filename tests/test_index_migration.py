@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-records-lom is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Index migration tests."""
+
+from flask import Flask
+from flask_principal import Identity
+from invenio_search import current_search_client
+from invenio_search.utils import build_alias_name
+
+from invenio_records_lom.services import LOMRecordService
+from invenio_records_lom.services.index_migration import (
+    get_alias_names,
+    migrate_indices,
+)
+
+
+def test_get_alias_names(base_app: Flask) -> None:
+    """Test aliases are found by the indices' position in the mappings-tree."""
+    with base_app.app_context():
+        prefix = base_app.config.get("SEARCH_INDEX_PREFIX") or ""
+        assert get_alias_names("lomrecords-records-record-v2.0.0") == [
+            f"{prefix}lomrecords",
+            f"{prefix}lomrecords-records",
+        ]
+        assert get_alias_names("lomrecords-drafts-draft-v2.0.0") == [
+            f"{prefix}lomrecords",
+            f"{prefix}lomrecords-drafts",
+        ]
+        assert get_alias_names("unknown-index") == []
+
+
+def test_migrate_indices(
+    service: LOMRecordService,
+    search_clear: None,
+    identity: Identity,
+    full_lom_metadata: dict,
+) -> None:
+    """Test aliases are swapped to new indices, filled from the database."""
+    client = current_search_client
+    draft = service.create(identity=identity, data=full_lom_metadata)
+    record = service.publish(identity=identity, id_=draft.id)
+
+    # replace current indices by v1.0.0-ones, as a not yet migrated instance has
+    index_names = [
+        api_cls.index._name for api_cls in [service.record_cls, service.draft_cls]
+    ]
+    old_indices = {}
+    for new_index in index_names:
+        current = client.indices.get_alias(index=build_alias_name(new_index))
+        client.indices.delete(index=",".join(current))
+        old_index = build_alias_name(new_index.replace("-v2.0.0", "-v1.0.0"))
+        aliases = {alias: {} for alias in get_alias_names(new_index)}
+        client.indices.create(index=old_index, body={"aliases": aliases})
+        old_indices[new_index] = old_index
+
+    renamed = migrate_indices(service, "1.0.0", delete_old=True)
+
+    assert set(renamed) == set(old_indices.values())
+    for new_index, old_index in old_indices.items():
+        assert not client.indices.exists(index=old_index)
+        new_concretes = set(client.indices.get_alias(index=build_alias_name(new_index)))
+        assert new_concretes == {renamed[old_index]}
+        for alias in get_alias_names(new_index):
+            assert new_concretes <= set(client.indices.get_alias(name=alias))
+
+    query = {"query": {"term": {"id": record.id}}}
+    hits = client.search(index=build_alias_name("lomrecords-records"), body=query)
+    assert hits["hits"]["total"]["value"] == 1
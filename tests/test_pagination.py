@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-records-lom is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Cursor-pagination tests."""
+
+import pytest
+from flask import Flask
+from flask_principal import Identity
+from invenio_records_resources.services.errors import QuerystringValidationError
+from invenio_search.engine import search as search_engine
+
+from invenio_records_lom.services.pagination import (
+    cursor_errors,
+    decode_cursor,
+    encode_cursor,
+    open_pit,
+)
+
+
+def test_cursor_roundtrip() -> None:
+    """Test cursors decode to what they were encoded from."""
+    cursor = encode_cursor("pit-id==", [1.5, "abcde-12345"])
+    assert decode_cursor(cursor) == {
+        "pit_id": "pit-id==",
+        "search_after": [1.5, "abcde-12345"],
+    }
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    ["not base64!", "bm90IGpzb24=", encode_cursor("pit-id", None)],
+)
+def test_invalid_cursor(cursor: str) -> None:
+    """Test invalid cursors are rejected as invalid query strings."""
+    with pytest.raises(QuerystringValidationError):
+        decode_cursor(cursor)
+
+
+def test_cursor_errors() -> None:
+    """Test errors of expired cursors are raised as invalid query strings."""
+    error = search_engine.NotFoundError(404, "search_phase_execution_exception")
+    with pytest.raises(QuerystringValidationError), cursor_errors({"cursor": "c"}):
+        raise error
+
+    for params in [None, {"cursor": ""}]:
+        with pytest.raises(search_engine.NotFoundError), cursor_errors(params):
+            raise error
+
+
+def test_open_pit_rate_limited(base_app: Flask) -> None:
+    """Test opening PITs beyond a user's rate-limit is rejected."""
+    ext = base_app.extensions["invenio-records-lom"]
+    limit = base_app.config["LOM_SEARCH_CURSOR_RATE_LIMIT"]
+    base_app.config["LOM_SEARCH_CURSOR_RATE_LIMIT"] = {
+        "capacity": 0,
+        "refill_rate": 0,
+    }
+    ext.search_cursor_limiter = None
+    try:
+        with base_app.app_context(), pytest.raises(QuerystringValidationError):
+            open_pit(Identity(1), "lomrecords-records")
+    finally:
+        base_app.config["LOM_SEARCH_CURSOR_RATE_LIMIT"] = limit
+        ext.search_cursor_limiter = None
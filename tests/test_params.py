@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-records-lom is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Search parameter interpreter tests."""
+
+from flask import Flask
+from invenio_search.engine import dsl
+
+from invenio_records_lom.services.config import LOMSearchOptions
+from invenio_records_lom.services.params import SourceFieldsParam
+
+
+def test_source_fields(base_app: Flask) -> None:
+    """Test hits are summarized per mimetype, unless full fields are asked for."""
+    param = SourceFieldsParam(LOMSearchOptions)
+    mimetype = "application/vnd.inveniolom.v1+json"
+    summary = base_app.config["LOM_SEARCH_SOURCE_FIELDS"][mimetype]
+    with base_app.app_context():
+        search = param.apply(None, dsl.Search(), {"mimetype": mimetype})
+        assert search.to_dict()["_source"] == summary
+
+        for params in [
+            {"mimetype": mimetype, "fields": "full"},
+            {"mimetype": "application/json"},
+            {},
+        ]:
+            search = param.apply(None, dsl.Search(), params)
+            assert "_source" not in search.to_dict()
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-records-lom is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Permission tests."""
+
+from flask_principal import Identity, Need, UserNeed
+from invenio_db.shared import SQLAlchemy
+from invenio_records_permissions.generators import Generator, SystemProcess
+from invenio_records_permissions.policies import BasePermissionPolicy
+
+from invenio_records_lom.services.permissions import evaluate_permissions
+
+
+class CountingUserGenerator(Generator):
+    """Generator allowing user 1, counts how often it was evaluated."""
+
+    def __init__(self) -> None:
+        """Construct."""
+        self.calls = 0
+
+    def needs(self, **__: dict) -> list[Need]:
+        """Needs granting permission."""
+        self.calls += 1
+        return [UserNeed(1)]
+
+
+counting_generator = CountingUserGenerator()
+
+
+class CountingPolicy(BasePermissionPolicy):
+    """Policy whose actions share a generator."""
+
+    can_manage = (counting_generator,)
+    can_curate = (*can_manage, SystemProcess())
+
+
+def test_evaluate_permissions_shares_generator_results(
+    db: SQLAlchemy,
+) -> None:
+    """Test shared generators are evaluated once, with unchanged results."""
+    user, stranger = Identity(1), Identity(2)
+    user.provides.add(UserNeed(1))
+    stranger.provides.add(UserNeed(2))
+    actions = ["manage", "curate"]
+
+    expected = {action: CountingPolicy(action).allows(user) for action in actions}
+    counting_generator.calls = 0
+    assert evaluate_permissions(CountingPolicy, user, actions) == expected
+    assert counting_generator.calls == 1
+
+    assert evaluate_permissions(CountingPolicy, stranger, actions) == {
+        "manage": False,
+        "curate": False,
+    }
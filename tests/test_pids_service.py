@@ -1,23 +1,47 @@
 # -*- coding: utf-8 -*-
 #
-# Copyright (C) 2022-2025 Graz University of Technology.
+# Copyright (C) 2022-2026 Graz University of Technology.
 #
 # invenio-records-lom is free software; you can redistribute it and/or modify it
 # under the terms of the MIT License; see LICENSE file for more details.
 
 """PIDsService tests."""
 
+from collections.abc import Iterator
+from contextlib import contextmanager
+from unittest.mock import Mock
+from uuid import uuid4
+
 import pytest
+from cachelib import SimpleCache
+from datacite.errors import DataCiteError
+from flask import Flask, current_app
 from flask_principal import Identity
 from invenio_db.shared import SQLAlchemy
 from invenio_pidstore.errors import PIDDoesNotExistError
 from invenio_pidstore.models import PIDStatus
+from kombu import Connection
+from kombu.simple import SimpleQueue
 from pytest_mock import MockerFixture
+from requests.exceptions import ConnectionError as RequestsConnectionError
 
 from invenio_records_lom.resources.serializers import LOMToDataCite44Serializer
 from invenio_records_lom.services import LOMRecordService
+from invenio_records_lom.services.doi import bulk_update_doi_metadata
+from invenio_records_lom.services.pid_queue import (
+    PID_QUEUE_FAILURES_KEY,
+    drain_pid_queue,
+    enqueue_pid,
+    process_pid_jobs,
+)
+from invenio_records_lom.services.pids import (
+    LOMDataCitePIDProvider,
+    raise_datacite_errors,
+)
 from invenio_records_lom.services.tasks import register_or_update_pid
 
+from .fake_datacite_client import FakeDataCiteRESTClient
+
 
 def test_resolve_pid(
     service: LOMRecordService,
@@ -119,3 +143,189 @@ def test_register_pid(
     assert pid.status == PIDStatus.RESERVED
     register_or_update_pid(recid=record["id"], scheme="doi")
     assert pid.status == PIDStatus.REGISTERED
+
+
+def test_bulk_update_doi_metadata(base_app: Flask, full_lom_metadata: dict) -> None:
+    """Update DataCite-DOIs only, hide restricted ones, collect failures."""
+
+    def source(doi: str, provider: str = "datacite", access: str = "public") -> dict:
+        pids = {"doi": {"identifier": doi, "provider": provider}}
+        return {**full_lom_metadata, "pids": pids, "access": {"record": access}}
+
+    def update_doi(doi: str, **__: dict) -> None:
+        if doi == "10.1234/fails":
+            raise DataCiteError
+        if doi == "10.1234/unreachable":
+            raise RequestsConnectionError
+
+    def dump_obj(source: dict) -> dict:
+        if source["pids"]["doi"]["identifier"] == "10.1234/unserializable":
+            raise KeyError
+        return LOMToDataCite44Serializer().dump_obj(source)
+
+    api = Mock()
+    api.update_doi.side_effect = update_doi
+    provider = Mock()
+    provider.serializer.dump_obj.side_effect = dump_obj
+    provider.client.api = api
+    sources = [
+        source("10.1234/public"),
+        source("10.1234/restricted", access="restricted"),
+        source("10.1234/external", provider="external"),
+        source("10.1234/fails"),
+        source("10.1234/unserializable"),
+        source("10.1234/unreachable"),
+    ]
+
+    with base_app.app_context():
+        updated, failed = bulk_update_doi_metadata(sources, provider, workers=2)
+
+    assert updated == 2
+    assert sorted(failed) == [
+        "10.1234/fails",
+        "10.1234/unreachable",
+        "10.1234/unserializable",
+    ]
+    api.hide_doi.assert_called_once_with(doi="10.1234/restricted")
+    assert api.update_doi.call_count == 3
+
+
+def test_process_pid_jobs_retries_with_backoff(base_app: Flask) -> None:
+    """Retry failing registrations with exponential backoff, report exhausted ones."""
+
+    class FlakyDataCiteRESTClient(FakeDataCiteRESTClient):
+        """Fails the first `failures[doi]` requests per DOI."""
+
+        failures = {"10.1234/flaky": 2, "10.1234/broken": 10}  # noqa: RUF012
+
+        def update_doi(self, doi: str, **kwargs: dict) -> Mock:
+            if self.failures.get(doi, 0) > 0:
+                self.failures[doi] -= 1
+                raise DataCiteError
+            return super().update_doi(doi=doi, **kwargs)
+
+    api = FlakyDataCiteRESTClient("10.1234")
+    jobs = [
+        {"recid": recid, "scheme": "doi", "provider": "datacite"}
+        for recid in ["ok", "flaky", "broken"]
+    ]
+    waits = []
+
+    with base_app.app_context():
+        failed = process_pid_jobs(
+            jobs,
+            lambda job: api.update_doi(doi=f"10.1234/{job['recid']}"),
+            limiters={},
+            workers=2,
+            max_retries=3,
+            backoff=0.5,
+            sleep=waits.append,
+        )
+
+    assert failed == [jobs[2]]
+    # flaky: 0.5, 1.0; broken: 0.5, 1.0, 2.0
+    assert sorted(waits) == [0.5, 0.5, 1.0, 1.0, 2.0]
+
+
+@pytest.fixture
+def memory_pid_queue(mocker: MockerFixture) -> Iterator[SimpleCache]:
+    """Keep the PID-queue in kombu's in-memory transport, and its cache in a dict."""
+    connection = Connection("memory://")
+    name = f"test-pid-queue-{uuid4()}"
+
+    @contextmanager
+    def pid_queue() -> Iterator[SimpleQueue]:
+        queue = connection.SimpleQueue(name)
+        try:
+            yield queue
+        finally:
+            queue.close()
+
+    cache = SimpleCache()
+    mocker.patch("invenio_records_lom.services.pid_queue.pid_queue", pid_queue)
+    mocker.patch("invenio_records_lom.services.pid_queue.current_cache", cache)
+    yield cache
+    connection.release()
+
+
+def test_drain_pid_queue(
+    base_app: Flask,
+    memory_pid_queue: SimpleCache,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Coalesce duplicate jobs, requeue failed ones until giving up on them."""
+    monkeypatch.setitem(base_app.config, "LOM_PIDS_QUEUE_RATE_LIMITS", {})
+    monkeypatch.setitem(base_app.config, "LOM_PIDS_QUEUE_MAX_RETRIES", 0)
+    monkeypatch.setitem(base_app.config, "LOM_PIDS_QUEUE_MAX_RUNS", 2)
+
+    class FailingDataCiteRESTClient(FakeDataCiteRESTClient):
+        """Fails every request for "10.1234/broken"."""
+
+        def update_doi(self, doi: str, **kwargs: dict) -> Mock:
+            if doi == "10.1234/broken":
+                raise DataCiteError
+            return super().update_doi(doi=doi, **kwargs)
+
+    api = FailingDataCiteRESTClient("10.1234")
+    registered = []
+
+    def register(job: dict) -> None:
+        api.update_doi(doi=f"10.1234/{job['recid']}")
+        registered.append(job["recid"])
+
+    with base_app.app_context():
+        assert enqueue_pid("ok", "doi", "datacite")
+        assert not enqueue_pid("ok", "doi", "datacite")  # already queued
+        assert enqueue_pid("broken", "doi", "datacite")
+        # queued again after its pending-mark expired, coalesced while draining
+        memory_pid_queue.clear()
+        assert enqueue_pid("ok", "doi", "datacite")
+
+        assert drain_pid_queue(register) == (2, 1)
+        assert registered == ["ok"]
+        assert memory_pid_queue.get(PID_QUEUE_FAILURES_KEY) == 1
+
+        # requeued with `runs + 1`, given up on after `LOM_PIDS_QUEUE_MAX_RUNS`
+        assert drain_pid_queue(register) == (1, 1)
+        assert memory_pid_queue.get(PID_QUEUE_FAILURES_KEY) == 2
+        assert drain_pid_queue(register) == (0, 0)
+
+
+def test_log_errors_raises_only_if_requested(base_app: Flask) -> None:
+    """Swallow DataCite-errors after logging them, unless asked to raise them."""
+    error = DataCiteError("not json")
+    with base_app.app_context():
+        # pylint: disable-next=protected-access
+        LOMDataCitePIDProvider._log_errors(error)
+
+        token = raise_datacite_errors.set(True)
+        try:
+            with pytest.raises(DataCiteError):
+                # pylint: disable-next=protected-access
+                LOMDataCitePIDProvider._log_errors(error)
+        finally:
+            raise_datacite_errors.reset(token)
+
+
+@pytest.mark.parametrize("queue_enabled", [True, False])
+def test_publish_queues_pids_if_enabled(
+    service: LOMRecordService,
+    identity: Identity,
+    full_lom_metadata: dict,
+    mocker: MockerFixture,
+    queue_enabled: bool,  # noqa: FBT001
+) -> None:
+    """Queue PIDs on publish if the queue is enabled, else start one task each."""
+    mocker.patch.dict(current_app.config, {"LOM_PIDS_QUEUE_ENABLED": queue_enabled})
+    enqueue = mocker.patch("invenio_records_lom.services.pid_queue.enqueue_pid")
+    delay = mocker.patch.object(register_or_update_pid, "delay")
+
+    draft = service.create(identity=identity, data=full_lom_metadata)
+    record = service.publish(identity=identity, id_=draft.id)
+
+    if queue_enabled:
+        enqueue.assert_called_once_with(record.id, "doi", "datacite")
+        delay.assert_not_called()
+    else:
+        delay.assert_called_once_with(record.id, "doi")
+        enqueue.assert_not_called()
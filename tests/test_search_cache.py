@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-records-lom is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Search-cache tests."""
+
+from flask import Flask
+from invenio_search.engine import dsl
+
+from invenio_records_lom.services.search_cache import (
+    invalidate_search_cache,
+    search_cache_key,
+)
+
+
+def test_search_cache_key(base_app: Flask) -> None:
+    """Test keys are per search, and change on invalidation."""
+    search = dsl.Search().query("match", title="physics")
+    with base_app.app_context():
+        key = search_cache_key(search)
+        assert key == search_cache_key(dsl.Search().query("match", title="physics"))
+        assert key != search_cache_key(search.sort("-created"))
+
+        invalidate_search_cache()
+        assert key != search_cache_key(search)
@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-records-lom is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Statistics tests."""
+
+from datetime import date
+
+import pytest
+from flask import Flask
+from invenio_search.engine import search as search_engine
+from invenio_stats.receivers import EventEmitter
+from pytest_mock import MockerFixture
+
+from invenio_records_lom.records.statistics import emit_stats_event
+from invenio_records_lom.records.statistics.api import (
+    _merge_sorted,
+    get_decayed_sum,
+    get_part_recids,
+)
+from invenio_records_lom.records.statistics.event_builders import (
+    drop_if_rate_limited,
+)
+from invenio_records_lom.records.statistics.export import iter_stats_csv
+from invenio_records_lom.services.tasks import lom_reindex_stats
+from invenio_records_lom.utils import TokenBucketLimiter
+
+
+def copy_kwargs_builder(event: dict, sender_app: Flask, **kwargs: dict) -> dict:
+    """Event builder for tests, copies passed-in kwargs into the event."""
+    return {**event, **kwargs}
+
+
+def test_emit_stats_event_publishes_after_response(mocker: MockerFixture) -> None:
+    """Test that events are published in one batch, after the response was sent."""
+    current_stats = mocker.patch(
+        "invenio_records_lom.records.statistics.events.current_stats",
+    )
+    current_stats.events = {"lom-record-view": None}
+    current_stats.get_event_emitter.return_value = EventEmitter(
+        "lom-record-view",
+        [copy_kwargs_builder],
+    )
+
+    app = Flask("testapp")
+
+    @app.route("/")
+    def view() -> str:
+        emit_stats_event("lom-record-view", recid="abc")
+        emit_stats_event("lom-record-view", recid="def")
+        assert not current_stats.publish.called
+        return "ok"
+
+    response = app.test_client().get("/")
+    assert not current_stats.publish.called
+    response.close()
+
+    current_stats.publish.assert_called_once_with(
+        "lom-record-view",
+        [{"recid": "abc"}, {"recid": "def"}],
+    )
+
+
+def test_merge_sorted_stats() -> None:
+    """Test the outer merge-join of view- and download-buckets."""
+    views = iter([("a", {"views": 1}), ("c", {"views": 3})])
+    downloads = iter([("b", {"downloads": 2}), ("c", {"downloads": 4})])
+
+    assert list(_merge_sorted(views, downloads)) == [
+        ("a", {"views": 1}, {}),
+        ("b", {}, {"downloads": 2}),
+        ("c", {"views": 3}, {"downloads": 4}),
+    ]
+
+
+def test_get_decayed_sum() -> None:
+    """Test that daily counts halve in weight every half-life."""
+    today = date(2026, 10, 19)
+    counts = [(date(2026, 10, 19), 8), (date(2026, 9, 19), 8), (date(2026, 8, 20), 8)]
+    assert get_decayed_sum(counts, today, half_life=30) == 8 + 4 + 2
+    assert get_decayed_sum([], today, half_life=30) == 0
+
+
+def test_iter_stats_csv() -> None:
+    """Test CSV-export is streamed line by line and always has a header."""
+    header = "recid,views,unique_views,downloads,unique_downloads,data_volume\r\n"
+    assert "".join(iter_stats_csv([], "recid")) == header
+
+    row = dict.fromkeys(
+        ["views", "unique_views", "downloads", "unique_downloads", "data_volume"],
+        0,
+    )
+    lines = list(iter_stats_csv([{"recid": "a", **row}], "recid"))
+    assert lines[0] == header + "a,0,0,0,0,0\r\n"
+
+
+def test_get_part_recids() -> None:
+    """Test only "haspart"-related repo-pids are used for course statistics."""
+
+    def relation(kind: str, catalog: str, entry: str) -> dict:
+        identifier = {"catalog": catalog, "entry": {"langstring": {"#text": entry}}}
+        return {
+            "kind": {"value": {"langstring": {"#text": kind}}},
+            "resource": {"identifier": [identifier]},
+        }
+
+    data = {
+        "metadata": {
+            "relation": [
+                relation("haspart", "repo-pid", "unit-1"),
+                relation("ispartof", "repo-pid", "whole"),
+                relation("haspart", "other-catalog", "foreign"),
+                relation("haspart", "repo-pid", "unit-2"),
+            ],
+        },
+    }
+    assert get_part_recids(data) == ["unit-1", "unit-2"]
+
+
+def test_token_bucket_limiter() -> None:
+    """Test bursts are cut off, tokens refill, and least recently used keys evict."""
+    limiter = TokenBucketLimiter(capacity=2, refill_rate=0.5, max_keys=2)
+
+    assert limiter.allow("a", now=0)
+    assert limiter.allow("a", now=0)
+    assert not limiter.allow("a", now=0)
+    assert not limiter.has_token("a", now=1)
+    assert limiter.has_token("a", now=2)  # refilled one token
+    assert limiter.allow("a", now=2)
+
+    assert limiter.allow("b", now=2)
+    assert limiter.allow("c", now=2)  # evicts "a", the least recently used
+    assert limiter.allow("a", now=2)
+
+
+def test_drop_if_rate_limited(base_app: Flask) -> None:
+    """Test events beyond a session's burst-capacity are dropped."""
+    capacity = base_app.config["LOM_STATS_EVENTS_RATE_LIMITS"]["session"]["capacity"]
+    event = {"session_id": "test-drop-if-rate-limited"}
+    with base_app.app_context():
+        for _ in range(capacity):
+            assert drop_if_rate_limited(event, base_app) == event
+        assert drop_if_rate_limited(event, base_app) is None
+
+
+def test_drop_if_rate_limited_takes_tokens_only_if_all_allow(base_app: Flask) -> None:
+    """Test events dropped for their IP-address don't use up their session's tokens."""
+    ext = base_app.extensions["invenio-records-lom"]
+    limits = base_app.config["LOM_STATS_EVENTS_RATE_LIMITS"]
+    base_app.config["LOM_STATS_EVENTS_RATE_LIMITS"] = {
+        "session": {"capacity": 1, "refill_rate": 0},
+        "ip": {"capacity": 0, "refill_rate": 0},
+    }
+    ext.stats_events_limiters = {}
+    event = {"session_id": "test-all-allow", "ip_address": "192.0.2.1"}
+    try:
+        with base_app.app_context():
+            assert drop_if_rate_limited(event, base_app) is None
+            assert drop_if_rate_limited({"session_id": "test-all-allow"}, base_app)
+    finally:
+        base_app.config["LOM_STATS_EVENTS_RATE_LIMITS"] = limits
+        ext.stats_events_limiters = {}
+
+
+def test_failing_shard_keeps_bookmark(base_app: Flask, mocker: MockerFixture) -> None:
+    """Test the stats-reindex bookmark isn't advanced if a shard fails to index."""
+    bookmark_api = mocker.patch(
+        "invenio_records_lom.services.tasks.BookmarkAPI",
+    ).return_value
+    bookmark_api.get_bookmark.return_value = "2026-01-01T00:00:00+00:00"
+    mocker.patch(
+        "invenio_records_lom.services.tasks.get_changed_parents",
+        return_value=["parent-1", "parent-2"],
+    )
+    error = search_engine.helpers.BulkIndexError("1 document(s) failed to index.", [])
+    mocker.patch(
+        "invenio_records_lom.services.tasks.search_engine.helpers.bulk",
+        side_effect=error,
+    )
+
+    with base_app.app_context(), pytest.raises(search_engine.helpers.BulkIndexError):
+        lom_reindex_stats(["stats-lom-record-view"])
+
+    bookmark_api.set_bookmark.assert_not_called()
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# invenio-records-lom is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""UI serializer tests."""
+
+from copy import deepcopy
+
+from faker import Faker
+from flask import Flask
+from flask_resources import BaseListSchema, JSONSerializer, MarshmallowSerializer
+from marshmallow_oneofschema import OneOfSchema
+
+from invenio_records_lom.fixtures import create_fake_data
+from invenio_records_lom.resources.serializers import LOMToUIJSONSerializer
+from invenio_records_lom.resources.serializers.ui.schema import (
+    LOMUICourseSchema,
+    LOMUIRecordSchema,
+)
+
+
+class PerHitUIRecordSchema(OneOfSchema):
+    """Instantiates a type-schema per dumped record, like `OneOfSchema` does."""
+
+    type_field = "resource_type"
+    type_schemas = LOMUIRecordSchema.type_schemas
+
+    def get_obj_type(self, obj: dict) -> str:
+        """Get type of `obj`."""
+        return obj["resource_type"]
+
+
+def create_result_page(fake: Faker, size: int) -> dict:
+    """Create a page of search results, as passed to list-serializers."""
+    hits = []
+    for index in range(size):
+        hit = create_fake_data(fake, resource_type=fake.random.choice(["unit", "file"]))
+        hit["id"] = f"{index:05}-abcde"
+        hit["created"] = hit["updated"] = fake.iso8601()
+        hit["is_draft"] = False
+        hits.append(hit)
+    return {"hits": {"hits": hits, "total": size}, "links": {}}
+
+
+def test_ui_list_serialization(base_app: Flask) -> None:
+    """Test shared type-schemas serialize a result page like per-hit ones."""
+    fake = Faker()
+    Faker.seed(42)
+    compact = LOMToUIJSONSerializer()
+    per_hit = MarshmallowSerializer(
+        format_serializer_cls=JSONSerializer,
+        object_schema_cls=PerHitUIRecordSchema,
+        list_schema_cls=BaseListSchema,
+    )
+
+    with base_app.test_request_context():
+        page = create_result_page(fake, size=50)
+        assert compact.dump_list(deepcopy(page)) == per_hit.dump_list(deepcopy(page))
+
+
+def langstring(text: str) -> dict:
+    """Create a langstring."""
+    return {"langstring": {"#text": text, "lang": "en"}}
+
+
+def course_part(recid: str, author: str | None = None, description: str = "") -> dict:
+    """Create a course's part, dereferenced if it has an `author`."""
+    part = {"catalog": "repo-pid", "entry": langstring(recid)}
+    if author:
+        part["metadata"] = {
+            "general": {"description": [langstring(description)]},
+            "lifecycle": {
+                "contribute": [
+                    {"role": {"value": langstring("Author")}, "entity": [author]},
+                ],
+            },
+        }
+    return part
+
+
+def course(*parts: dict) -> dict:
+    """Create a course, with `parts` as its "haspart"-relations."""
+    relation = {"kind": {"value": langstring("haspart")}, "resource": {}}
+    relation["resource"]["identifier"] = list(parts)
+    return {"resource_type": "course", "metadata": {"relation": [relation]}}
+
+
+def test_course_ui_fields() -> None:
+    """Test courses take contributors of all parts, descriptions of the newest."""
+    schema = LOMUICourseSchema()
+
+    dereferenced = course(
+        course_part("unit-1", "Ada Lovelace", "Older unit."),
+        course_part("unit-2", "Alan Turing", "Newest unit."),
+    )
+    ui_fields = schema.extract_ui_fields(dereferenced)
+    assert ui_fields["contributors"] == [
+        {"fullname": "Ada Lovelace", "role": "Author"},
+        {"fullname": "Alan Turing", "role": "Author"},
+    ]
+    assert ui_fields["generalDescriptions"] == ["Newest unit."]
+    assert ui_fields["educationalDescriptions"] == []
+
+    # the newest part isn't dereferenced, e.g. when the course comes from the index
+    partly = course(
+        course_part("unit-1", "Ada Lovelace", "Older unit."),
+        course_part("unit-2"),
+    )
+    ui_fields = schema.extract_ui_fields(partly)
+    assert ui_fields["contributors"] == [{"fullname": "Ada Lovelace", "role": "Author"}]
+    assert ui_fields["generalDescriptions"] == []
+
+    ui_fields = schema.extract_ui_fields(course(course_part("unit-1")))
+    assert ui_fields["contributors"] == []
+    assert ui_fields["generalDescriptions"] == []
+    assert ui_fields["educationalDescriptions"] == []